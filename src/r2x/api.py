@@ -1,15 +1,20 @@
 """R2X API for data model."""
 
 import csv
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from os import PathLike
 from pathlib import Path
 from collections.abc import Iterable
 from loguru import logger
 
 import inspect
+from typing import Any
 from infrasys.component import Component
+from infrasys.supplemental_attribute import SupplementalAttribute
 from infrasys.system import System as ISSystem
+from infrasys.time_series_manager import make_time_series_key
+from infrasys.time_series_models import DatabaseConnection, TimeSeriesData, TimeSeriesKey
 
 from .__version__ import __data_model_version__
 
@@ -20,6 +25,7 @@ class System(ISSystem):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.data_format_version = __data_model_version__
+        self._batch: tuple[list[Component], list[tuple]] | None = None
 
     def __str__(self) -> str:
         return f"System(name={self.name}, DataModel Version={self.version})"
@@ -32,6 +38,62 @@ class System(ISSystem):
         """The version property."""
         return __data_model_version__
 
+    @contextmanager
+    def batch(self) -> Iterator["System"]:
+        """Queue the components and time series added inside the context and add them in bulk on exit.
+
+        The components are added with a single `add_components` call and the time series are written on a
+        single connection to the time series store. Queued components are not stored until the context
+        exits, so they can not be retrieved from the system inside it. Time series are queued as a shallow
+        copy, so reassigning their attributes (e.g., `variable_name`) after queuing them does not change what
+        is added. Nested contexts are added by the outermost one. If an exception is raised the queued
+        components and time series are discarded.
+
+        Examples
+        --------
+        >>> with system.batch():
+        ...     system.add_component(bus)
+        ...     system.add_component(load)
+        ...     system.add_time_series(ts, load)
+        """
+        if self._batch is not None:
+            yield self
+            return
+
+        self._batch = ([], [])
+        try:
+            yield self
+            components, time_series = self._batch
+        finally:
+            self._batch = None
+
+        logger.trace("Adding {} components and {} time series", len(components), len(time_series))
+        super().add_components(*components)
+        if time_series:
+            with self.open_time_series_store() as connection:
+                for data, owners, user_attributes in time_series:
+                    super().add_time_series(data, *owners, connection=connection, **user_attributes)
+
+    def add_components(self, *components: Component, **kwargs) -> None:  # noqa: D102
+        if self._batch is None or kwargs:
+            return super().add_components(*components, **kwargs)
+        self._batch[0].extend(components)
+
+    def add_time_series(  # noqa: D102
+        self,
+        time_series: TimeSeriesData,
+        *owners: Component | SupplementalAttribute,
+        connection: DatabaseConnection | None = None,
+        **user_attributes: Any,
+    ) -> TimeSeriesKey:
+        if self._batch is None or connection is not None:
+            return super().add_time_series(time_series, *owners, connection=connection, **user_attributes)
+        # Snapshot the time series so its metadata matches the call, not the state at the end of the batch.
+        time_series = time_series.model_copy()
+        self._batch[1].append((time_series, owners, user_attributes))
+        metadata = type(time_series).get_time_series_metadata_type().from_data(time_series, **user_attributes)
+        return make_time_series_key(metadata)
+
     def to_json(self, filename: Path | str, overwrite=False, indent=None, data=None) -> None:  # noqa: D102
         return super().to_json(filename, overwrite=overwrite, indent=indent, data=data)
 
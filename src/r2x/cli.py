@@ -8,7 +8,7 @@ import traceback
 
 from .cli_functions import base_cli
 from .logger import setup_logging
-from .runner import init, run
+from .runner import clear_cache, init, run
 from .utils import read_user_dict
 
 
@@ -63,6 +63,8 @@ def cli_commands(cli_args: dict, user_dict: dict | None = None) -> None:
         run(cli_args, user_dict=user_dict)
     elif cli_args["command"] == "init":
         init(cli_args)
+    elif cli_args["command"] == "clear-cache":
+        clear_cache(cli_args)
     else:
         raise NotImplementedError
     return
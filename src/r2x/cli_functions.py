@@ -86,6 +86,7 @@ def base_cli() -> argparse.ArgumentParser:
     subparsers = parser.add_subparsers(dest="command", help="Subcommands")
     init_command = subparsers.add_parser("init", help="Create an empty configuration file.")
     run_command = subparsers.add_parser("run", help="Run an R2X translation")
+    clear_cache_command = subparsers.add_parser("clear-cache", help="Delete the cached PLEXOS databases.")
 
     init_command.add_argument(
         "-o",
@@ -95,6 +96,12 @@ def base_cli() -> argparse.ArgumentParser:
         help="Destination folder where the file will be copied. Defaults to current directory.",
     )
 
+    clear_cache_command.add_argument(
+        "--cache-dir",
+        dest="cache_dir",
+        help="Cache directory. Defaults to $R2X_CACHE_DIR or ~/.cache/r2x.",
+    )
+
     group_run = run_command.add_argument_group("Options for running the code")
     group_run.add_argument("--inspect", action="store_true", help="Inspect resulting infrasys system.")
     group_run.add_argument("--upgrade", action="store_true", help="Run upgrader logic.")
@@ -165,6 +172,11 @@ def base_cli() -> argparse.ArgumentParser:
         action="store_true",
         help="Serialize infrasys system.",
     )
+    group_cli.add_argument(
+        "--profile",
+        action="store_true",
+        help="Save a profile of the time and memory of each stage of the system construction.",
+    )
     run_command.add_argument("--pdb", action="store_true", dest="pdb", help="Run with debugger enabled.")
     run_command.add_argument("--flags", nargs="*", dest="feature_flags", action=Flags, help="Feature flags")
     parser.add_argument("--verbose", "-v", action="count", default=0, help="Run with additional verbosity")
@@ -22,6 +22,7 @@ from r2x.config_scenario import Scenario
 from r2x.config_utils import get_year
 from r2x.exporter.utils import modify_components
 from r2x.parser.handler import file_handler
+from r2x.utils import get_time_series_scaling_factor
 
 OUTPUT_FNAME = "{self.weather_year}"
 
@@ -239,6 +240,7 @@ class BaseExporter(ABC):
 
         time_series_list: defaultdict[str, list[TimeSeriesData]] = defaultdict(list)
         time_series_headers = defaultdict(list)
+        time_series_scaling_factors: defaultdict[str, list[float]] = defaultdict(list)
         for component in system.get_components(
             Component,
             filter_func=lambda x: system.has_time_series(
@@ -256,6 +258,9 @@ class BaseExporter(ABC):
                 time_series_list[ts_component_name].append(
                     system._time_series_mgr._get_by_metadata(ts_metadata)
                 )
+                time_series_scaling_factors[ts_component_name].append(
+                    get_time_series_scaling_factor(component, ts_metadata.variable_name)
+                )
 
         if check_time_series_length_consistency(time_series_list):
             msg = "Multiple lengths not supported for the same component type."
@@ -278,6 +283,13 @@ class BaseExporter(ABC):
                     time_series,
                 )
             )
+            # Shared time series are scaled to the values of each component.
+            time_series_arrays_no_pint = [
+                array if scaling_factor == 1 else array * scaling_factor
+                for array, scaling_factor in zip(
+                    time_series_arrays_no_pint, time_series_scaling_factors[component_type]
+                )
+            ]
             fname_substitution_dict["component_type"] = component_type
             csv_fname = string_template.safe_substitute(fname_substitution_dict)
             csv_table = np.column_stack([datetime_array, *time_series_arrays_no_pint])
@@ -7,17 +7,21 @@ This module provides the abstract class to create parser objects.
 import inspect
 import json
 from abc import ABC, abstractmethod
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Iterator, MutableMapping, Sequence
 from copy import deepcopy
 from dataclasses import dataclass, field
+from functools import cache, partial, wraps
 from pathlib import Path
-from typing import Any, TypeVar
+from types import NoneType
+from typing import Annotated, Any, TypeVar, get_args, get_origin
 
 import polars as pl
 
 # Third-party packages
+from infrasys.base_quantity import BaseQuantity
 from infrasys.component import Component
 from loguru import logger
+from pint import Quantity
 from plexosdb import XMLHandler
 from pydantic import ValidationError
 
@@ -27,7 +31,7 @@ from r2x.config_scenario import Scenario
 from r2x.exceptions import R2XParserError
 from r2x.utils import check_file_exists
 
-from .handler_utils import csv_handler, h5_handler
+from .handler_utils import csv_handler, h5_handler, scan_csv_handler
 from .polars_helpers import pl_filter_by_weather_year, pl_filter_by_year, pl_rename
 
 FILE_PARSING_KWARGS = {
@@ -41,6 +45,66 @@ FILE_PARSING_KWARGS = {
 }
 
 
+class DataRegistry(MutableMapping):
+    """Dictionary of parsed files that reads each file the first time it is accessed.
+
+    Files are registered with a loader that is called on the first access to the key. The result replaces
+    the loader, so each file is read at most once per parser. Checking membership, `len` and iteration do
+    not read any file.
+
+    Examples
+    --------
+    >>> data = DataRegistry()
+    >>> data.register("load", partial(read_load, fpath))
+    >>> "load" in data
+    True
+    >>> data.is_loaded("load")
+    False
+    >>> load = data["load"]  # Reads the file.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        self._data: dict[str, Any] = dict(*args, **kwargs)
+        self._loaders: dict[str, Callable[[], Any]] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._loaders:
+            self._data[key] = self._loaders.pop(key)()
+        return self._data[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._loaders.pop(key, None)
+        self._data[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key in self._loaders:
+            del self._loaders[key]
+            return
+        del self._data[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._loaders or key in self._data
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._data
+        yield from self._loaders
+
+    def __len__(self) -> int:
+        return len(self._data) + len(self._loaders)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(loaded={list(self._data)}, pending={list(self._loaders)})"
+
+    def register(self, key: str, loader: Callable[[], Any]) -> None:
+        """Register a loader that is called the first time `key` is accessed."""
+        self._data.pop(key, None)
+        self._loaders[key] = loader
+
+    def is_loaded(self, key: str) -> bool:
+        """Return True if the data of `key` has been read."""
+        return key in self._data
+
+
 @dataclass
 class BaseParser(ABC):
     """Class that defines the shared methods of parsers.
@@ -53,8 +117,8 @@ class BaseParser(ABC):
     ----------
     config: Scenario
         Scenario configuration
-    data: dict
-        We save each file read in a data dictionary
+    data: DataRegistry
+        We save each file in a data dictionary. Files are read the first time they are accessed.
 
     Methods
     -------
@@ -67,7 +131,7 @@ class BaseParser(ABC):
     """
 
     config: Scenario
-    data: dict = field(default_factory=dict)
+    data: DataRegistry = field(default_factory=DataRegistry)
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(Files parsed: {len(self.data)})"
@@ -100,8 +164,14 @@ class BaseParser(ABC):
         filter_func: List
             Filter functions to apply
 
+        Note
+        ----
+        CSV files are scanned and the filter functions are applied to the `pl.LazyFrame` before collecting it,
+        so only the selected columns and years are read.
         """
-        data = file_handler(fpath, parser_class=type(self).__name__, **kwargs)
+        fpath = Path(fpath)
+        logger.debug("Loading file {}", fpath)
+        data = file_handler(fpath, parser_class=type(self).__name__, lazy=True, **kwargs)
         if data is None:
             return
 
@@ -111,6 +181,9 @@ class BaseParser(ABC):
         if use_filter_functions and isinstance(filter_funcs, list):
             for func in filter_funcs:
                 data = func(data, **kwargs)
+
+        if fpath.suffix == ".csv" and isinstance(data, pl.LazyFrame):
+            data = data.collect()
         return data
 
     def parse_data(
@@ -121,7 +194,11 @@ class BaseParser(ABC):
         filter_funcs: list[Callable] | None = None,
         **kwargs,
     ) -> bool:
-        """Parse all the data for the given translation."""
+        """Register all the files of the given translation.
+
+        The paths of the files are resolved, and missing mandatory files raised, when this method is called,
+        but each file is read the first time it is accessed with `get_data` or `data[key]`.
+        """
         logger.trace("Parsing data for {}", self.__class__.__name__)
         _fmap = deepcopy(fmap)
 
@@ -151,14 +228,27 @@ class BaseParser(ABC):
                 raise R2XParserError(msg)
 
             if fpath is not None:
-                logger.debug("Loading file {} from {}", dname, fpath)
-                self.data[dname] = self.read_file(fpath, filter_funcs=filter_funcs, **file_parsing_kwargs)
+                logger.trace("Registering file {} from {}", dname, fpath)
+                self.data.register(
+                    dname, partial(self.read_file, fpath, filter_funcs=filter_funcs, **file_parsing_kwargs)
+                )
         return True
 
     @abstractmethod
     def build_system(self) -> System:
         """Create the infra_sys model."""
 
+    def build_systems(self, names: Sequence[Any]) -> Iterator[tuple[str, System]]:
+        """Create a system for each model or solve year of the input, reading the input once.
+
+        Raises
+        ------
+        NotImplementedError
+            If the parser does not support translating several systems in a single run.
+        """
+        msg = f"{type(self).__name__} does not support translating several systems in a single run."
+        raise NotImplementedError(msg)
+
 
 class PCMParser(BaseParser):
     """Class defining shared methods for PCM (currently plexos and sienna) parsers."""
@@ -167,10 +257,12 @@ class PCMParser(BaseParser):
 
 
 def file_handler(
-    fpath: Path | str, parser_class: str | None = None, optional: bool = False, **kwargs
+    fpath: Path | str, parser_class: str | None = None, optional: bool = False, lazy: bool = False, **kwargs
 ) -> pl.LazyFrame | pl.DataFrame | Sequence | XMLHandler | None:
     """Return FileHandler based on file extension.
 
+    If `lazy` is True, CSV files are scanned and returned as a `pl.LazyFrame`.
+
     Raises
     ------
     FileNotFoundError
@@ -185,6 +277,8 @@ def file_handler(
     logger.trace("Reading {}", fpath)
     match fpath.suffix:
         case ".csv":
+            if lazy:
+                return scan_csv_handler(fpath, **kwargs)
             return csv_handler(fpath, **kwargs)
         case ".h5":
             assert parser_class is not None
@@ -250,7 +344,10 @@ def get_parser_data(
     # NOTE: At some point we are going to migrate this out, but this sound like a good standard set
     if (filter_funcs is None) and (parser_class.__name__ == "ReEDSParser"):
         logger.trace("Using default filter functions")
-        filter_funcs = [pl_rename, pl_filter_by_year]
+        filter_funcs = [pl_rename]
+        # Multi-year runs keep every solve year and partition the tables on `ReEDSParser.build_systems`.
+        if not isinstance(getattr(config.input_config, "solve_year", None), list):
+            filter_funcs.append(pl_filter_by_year)
 
     # Adding special case for Plexos parser
     if model := getattr(config, "model", False):
@@ -270,6 +367,20 @@ def get_parser_data(
     return parser
 
 
+def batched(method: Callable) -> Callable:
+    """Add the components and time series created by a parser method in bulk.
+
+    The method runs inside `System.batch`, so it can not retrieve from the system the components that it adds.
+    """
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.system.batch():
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
 def create_model_instance(
     model_class: type["Component"], skip_validation: bool = False, **field_values
 ) -> Any:
@@ -286,3 +397,49 @@ def create_model_instance(
         except ValidationError:
             return model_class.model_construct(**valid_fields)
     return model_class.model_validate(valid_fields)
+
+
+@cache
+def get_quantity_fields(model_class: type["Component"]) -> dict[str, type[BaseQuantity]]:
+    """Return the fields of the model that only accept a single quantity type, e.g., `ActivePower | None`."""
+    quantity_fields = {}
+    for name, field_info in model_class.model_fields.items():
+        field_types = [
+            get_args(field_type)[0] if get_origin(field_type) is Annotated else field_type
+            for field_type in get_args(field_info.annotation) or (field_info.annotation,)
+            if field_type is not NoneType
+        ]
+        if (
+            len(field_types) == 1
+            and inspect.isclass(field_types[0])
+            and issubclass(field_types[0], BaseQuantity)
+        ):
+            quantity_fields[name] = field_types[0]
+    return quantity_fields
+
+
+def construct_model_instance(model_class: type["Component"], **field_values) -> Any:
+    """Create R2X model instance from trusted values without validation.
+
+    Quantities are converted to the quantity type of the field, which is the only coercion that we rely on
+    from the validation. The values are expected to be already filtered (see `field_filter`). Use
+    `validate_model_instance` to validate the instance afterwards.
+    """
+    for name, quantity_class in get_quantity_fields(model_class).items():
+        value = field_values.get(name)
+        if value is None or isinstance(value, quantity_class) or isinstance(value, bool):
+            continue
+        if isinstance(value, Quantity):
+            field_values[name] = quantity_class(value.magnitude, value.units)
+        elif isinstance(value, int | float):
+            field_values[name] = quantity_class(value, quantity_class.__base_unit__)
+    return model_class.model_construct(**field_values)
+
+
+def validate_model_instance(component: "Component") -> ValidationError | None:
+    """Return the validation error of a component created with `construct_model_instance`, if any."""
+    try:
+        type(component).model_validate(dict(component))
+    except ValidationError as error:
+        return error
+    return None
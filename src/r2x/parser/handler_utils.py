@@ -1,15 +1,18 @@
 """Helper functions for base parser."""
 
 import os
+import re
 from pathlib import Path
 
 import h5py
-import pandas as pd
+import numpy as np
 import polars as pl
 from loguru import logger
 
 from .polars_helpers import pl_lowercase
 
+UTC_OFFSET = re.compile(r"[+-]\d{2}:\d{2}$")
+
 
 def csv_handler(fpath: Path, csv_file_encoding="utf8", **kwargs) -> pl.DataFrame:
     """Parse CSV files and return a Polars DataFrame with all column names in lowercase.
@@ -76,6 +79,52 @@ def csv_handler(fpath: Path, csv_file_encoding="utf8", **kwargs) -> pl.DataFrame
     return data_file
 
 
+def scan_csv_handler(fpath: Path, csv_file_encoding="utf8", **kwargs) -> pl.LazyFrame:
+    """Scan CSV files and return a Polars LazyFrame with all column names in lowercase.
+
+    Same as `csv_handler` but the file is not read until the LazyFrame is collected, so column selections
+    and filters applied to it are pushed down to the reader. Encodings not supported by `pl.scan_csv` fall
+    back to `csv_handler`.
+
+    Parameters
+    ----------
+    fpath : str
+        The file path of the CSV file to scan.
+    csv_file_encoding : str, optional
+        The encoding format of the CSV file, by default "utf8".
+    **kwargs : dict, optional
+        Additional keyword arguments.
+
+    Returns
+    -------
+    pl.LazyFrame
+
+    Raises
+    ------
+    FileNotFoundError
+        Raised if the file is not found.
+
+    See Also
+    --------
+    csv_handler
+    """
+    if csv_file_encoding not in ("utf8", "utf8-lossy"):
+        return csv_handler(fpath, csv_file_encoding=csv_file_encoding, **kwargs).lazy()
+
+    if not fpath.exists():
+        msg = f"File {fpath} not found."
+        logger.error(msg)
+        raise FileNotFoundError(msg)
+
+    logger.trace("Scanning file {}", fpath)
+    data_file = pl.scan_csv(fpath, infer_schema_length=10_000_000, encoding=csv_file_encoding)
+
+    if kwargs.get("keep_case") is None:
+        data_file = pl_lowercase(data_file)
+
+    return data_file
+
+
 def h5_handler(fpath, parser_class: str, **kwargs) -> pl.LazyFrame:
     """Parse H5 files and return a Polars DataFrame.
 
@@ -93,45 +142,20 @@ def h5_handler(fpath, parser_class: str, **kwargs) -> pl.LazyFrame:
     ------
     NotImplementedError
         Raised if a non supported parser request a h5 file.
+
+    See Also
+    --------
+    reeds_h5_reader
     """
     match parser_class:
         case "ReEDSParser":
-            with h5py.File(fpath, "r") as f:
-                logger.info(f"Parsing h5 File: {fpath}")
-                # unique structure for recf versus load
-                if os.path.basename(fpath) == "recf.h5":
-                    index_datetime = f["index_datetime"][:]
-                    pd_df = pd.DataFrame(
-                        f["data"],
-                        index=pd.Index(
-                            pd.to_datetime(
-                                index_datetime.astype(str),
-                            ),
-                            name="datetime",
-                        ),
-                        columns=[col.decode("utf-8") for col in f["columns"]],
-                    )
-                    pd_df = pd_df.reset_index()
-                elif os.path.basename(fpath) == "load.h5":
-                    # get index data
-                    index_year = f["index_year"][:]
-                    index_datetime = f["index_datetime"][:]
-                    # get data in pandas format
-                    pd_df = pd.DataFrame(f["data"], columns=[col.decode("utf-8") for col in f["columns"]])
-
-                    # creating multi level index
-                    unique_year_sorted = sorted(set(index_year))
-                    unique_datetime_sorted = sorted(set(index_datetime))
-                    multilevel_index = pd.MultiIndex.from_product(
-                        [unique_year_sorted, unique_datetime_sorted], names=["year", "datetime"]
-                    )
-
-                    # setting index then reseting
-                    pd_df = pd_df.set_index(multilevel_index).reset_index()
-
-                    # correctly formating datetime col
-                    pd_df["datetime"] = pd.to_datetime(pd_df["datetime"].astype(str))
-                pl_df = pl.LazyFrame(pd_df)
+            logger.info(f"Parsing h5 File: {fpath}")
+            weather_year = kwargs.get("weather_year") if kwargs.get("filter_by_weather_year") else None
+            pl_df = reeds_h5_reader(
+                fpath,
+                weather_year=weather_year,
+                solve_year=kwargs.get("solve_year"),
+            ).lazy()
         case _:
             msg = f"H5 file parsing is not implemented for {parser_class=}."
             raise NotImplementedError(msg)
@@ -139,3 +163,105 @@ def h5_handler(fpath, parser_class: str, **kwargs) -> pl.LazyFrame:
     if kwargs.get("keep_case") is None:
         pl_df = pl_lowercase(pl_df)
     return pl_df
+
+
+def reeds_h5_reader(
+    fpath: Path | str,
+    weather_year: int | None = None,
+    solve_year: int | list[int] | None = None,
+) -> pl.DataFrame:
+    """Read the ReEDS `recf.h5` and `load.h5` profiles into a Polars DataFrame.
+
+    Only the rows of the weather year and solve year are read from the `data` dataset using hyperslab
+    selections. If a year is not in the file all its rows are read, so the filter
+    functions applied afterwards behave as with the full file.
+
+    Parameters
+    ----------
+    fpath : Path | str
+        Path to `recf.h5` or `load.h5`.
+    weather_year : int | None, optional
+        Weather year of the `datetime` index to read.
+    solve_year : int | list[int] | None, optional
+        Years of the `year` index to read. Only used for `load.h5`.
+
+    Returns
+    -------
+    pl.DataFrame
+        Profiles with a `datetime` column (and a `year` column for `load.h5`) followed by the columns.
+    """
+    with h5py.File(fpath, "r") as f:
+        column_names = f["columns"][:].astype("U")
+
+        match os.path.basename(fpath):
+            case "recf.h5":
+                datetimes = decode_h5_datetime(f["index_datetime"][:])
+                rows = get_weather_year_rows(datetimes, weather_year)
+                data = f["data"][rows]
+                index = [datetimes[rows]]
+            case "load.h5":
+                # The data is stored as the product of the sorted years and datetimes.
+                years = np.unique(f["index_year"][:])
+                datetimes = decode_h5_datetime(np.unique(f["index_datetime"][:]))
+                rows = get_weather_year_rows(datetimes, weather_year)
+                year_idx = np.flatnonzero(np.isin(years, solve_year if solve_year is not None else []))
+                if year_idx.size == 0:
+                    year_idx = np.arange(len(years))
+                start, stop, _ = rows.indices(len(datetimes))
+                data = np.concatenate(
+                    [
+                        f["data"][idx * len(datetimes) + start : idx * len(datetimes) + stop]
+                        for idx in year_idx
+                    ]
+                )
+                index = [
+                    pl.Series("year", np.repeat(years[year_idx], stop - start)),
+                    pl.concat([datetimes[rows]] * len(year_idx)),
+                ]
+            case _:
+                msg = f"H5 file {fpath} is not a ReEDS profile."
+                raise NotImplementedError(msg)
+
+    return pl.DataFrame(index).hstack(pl.DataFrame(data, schema=list(column_names), orient="row"))
+
+
+def decode_h5_datetime(index_datetime: np.ndarray) -> pl.Series:
+    """Decode the ISO 8601 byte strings of a h5 index into a datetime Series.
+
+    Timestamps with a UTC offset, e.g., `2007-01-01T00:00:00-05:00`, keep the offset of the first timestamp as
+    time zone, e.g., `Etc/GMT+5`. Offsets that are not whole hours stay in UTC.
+    """
+    datetime_str = pl.Series("datetime", index_datetime.astype("U"))
+    datetimes = datetime_str.str.to_datetime(time_unit="ns")
+    offset = UTC_OFFSET.search(datetime_str[0])
+    if offset is not None and datetimes.dtype.time_zone is not None:  # type: ignore
+        if (time_zone := get_offset_time_zone(offset.group())) is not None:
+            datetimes = datetimes.dt.convert_time_zone(time_zone)
+    return datetimes
+
+
+def get_offset_time_zone(offset: str) -> str | None:
+    """Return the `Etc/GMT` time zone of a UTC offset like `-05:00`, or None if it is not a whole hour.
+
+    The sign of the `Etc/GMT` zones is inverted, so `-05:00` is `Etc/GMT+5`.
+    """
+    hours, minutes = int(offset[1:3]), int(offset[4:6])
+    if minutes:
+        return None
+    if hours == 0:
+        return "Etc/GMT"
+    sign = "+" if offset[0] == "-" else "-"
+    return f"Etc/GMT{sign}{hours}"
+
+
+def get_weather_year_rows(datetimes: pl.Series, weather_year: int | None = None) -> slice:
+    """Return the rows of a sorted datetime Series that belong to the weather year.
+
+    Returns all the rows if the weather year is None or not in the Series.
+    """
+    if weather_year is None:
+        return slice(None)
+    rows = np.flatnonzero((datetimes.dt.year() == weather_year).to_numpy())
+    if rows.size == 0:
+        return slice(None)
+    return slice(int(rows[0]), int(rows[-1]) + 1)
@@ -178,13 +178,15 @@ def fill_missing_timestamps(data_file: pl.DataFrame, hourly_time_index: pl.DataF
             raise ValueError("The data_file must have at least 'year' and 'month' columns.")
 
 
-def resample_data_to_hourly(data_file: pl.DataFrame) -> pl.DataFrame:
+def resample_data_to_hourly(data_file: pl.DataFrame, value_columns: list[str] | None = None) -> pl.DataFrame:
     """Resample data to hourly frequency from minute data.
 
     Parameters
     ----------
     data_file : pl.DataFrame
         DataFrame containing timeseries data with minute intervals.
+    value_columns : list[str], optional
+        Columns to average for each hour. Defaults to `["value"]`.
 
     Returns
     -------
@@ -221,23 +223,25 @@ def resample_data_to_hourly(data_file: pl.DataFrame) -> pl.DataFrame:
     )
 
     data_file = data_file.drop_nulls().sort("timestamp")
+    value_columns = value_columns or ["value"]
 
     # Group by the hour and aggregate the values
     return (
         data_file.group_by_dynamic("timestamp", every="1h")
-        .agg([pl.col("value").mean().alias("value")])  # Average of values for the hour
+        .agg([pl.col(value_columns).mean()])  # Average of values for the hour
         .with_columns(
             pl.col("timestamp").dt.year().alias("year"),
             pl.col("timestamp").dt.month().alias("month"),
             pl.col("timestamp").dt.day().alias("day"),
             pl.col("timestamp").dt.hour().alias("hour"),
-            pl.col("value").alias("value"),
         )
-        .select(["year", "month", "day", "hour", "value"])
+        .select(["year", "month", "day", "hour", *value_columns])
     )
 
 
-def reconcile_timeseries(data_file: pl.DataFrame, hourly_time_index: pl.DataFrame) -> pl.DataFrame:
+def reconcile_timeseries(
+    data_file: pl.DataFrame, hourly_time_index: pl.DataFrame, value_columns: list[str] | None = None
+) -> pl.DataFrame:
     """Adjust timeseries data to match the study year datetime index.
 
     Parameters
@@ -246,6 +250,8 @@ def reconcile_timeseries(data_file: pl.DataFrame, hourly_time_index: pl.DataFram
         The input DataFrame containing the timeseries data to adjust.
     hourly_time_index : pl.DataFrame
         The DataFrame containing the hourly time index for the study year, used for alignment.
+    value_columns : list[str], optional
+        Columns with values to average when resampling half-hourly data. Defaults to `["value"]`.
 
     Returns
     -------
@@ -282,11 +288,91 @@ def reconcile_timeseries(data_file: pl.DataFrame, hourly_time_index: pl.DataFram
         return fill_missing_timestamps(data_file, hourly_time_index)
 
     if data_file.height in [17568, 17520]:
-        return resample_data_to_hourly(data_file)
+        return resample_data_to_hourly(data_file, value_columns=value_columns)
 
     return data_file
 
 
+def reconcile_timeseries_matrix(
+    data_file: pl.DataFrame, hourly_time_index: pl.DataFrame, index_columns: list[str]
+) -> tuple[np.ndarray, dict[str, int]] | None:
+    """Reconcile all the records of a long data file at once.
+
+    The data file is pivoted to one column per record and reconciled with a single call to
+    `reconcile_timeseries`, so leap-year trimming, gap filling and resampling run once per file instead of
+    once per record.
+
+    Parameters
+    ----------
+    data_file : pl.DataFrame
+        Long DataFrame with `name` and `value` columns.
+    hourly_time_index : pl.DataFrame
+        The DataFrame containing the hourly time index for the study year, used for alignment.
+    index_columns : list[str]
+        Time columns that identify a row of a record.
+
+    Returns
+    -------
+    tuple[np.ndarray, dict[str, int]] | None
+        Matrix with one column per record and the column of each lowercase record name. None if the records
+        of the file do not share the same time stamps, in which case they need to be reconciled one by one.
+
+    Examples
+    --------
+    >>> from datetime import datetime
+    >>> df = pl.DataFrame(
+    ...     {
+    ...         "name": ["a", "a", "b", "b"],
+    ...         "year": [2020] * 4,
+    ...         "month": [1] * 4,
+    ...         "day": [1] * 4,
+    ...         "hour": [0, 1, 0, 1],
+    ...         "value": [1, 2, 3, 4],
+    ...     }
+    ... )
+    >>> hourly_time_index = pl.datetime_range(
+    ...     datetime(2020, 1, 1), datetime(2020, 1, 1, 3), interval="1h", eager=True, closed="left"
+    ... ).to_frame("datetime")
+    >>> matrix, column_index = reconcile_timeseries_matrix(
+    ...     df, hourly_time_index, ["year", "month", "day", "hour"]
+    ... )
+    >>> matrix[:, column_index["b"]]
+    array([3., 4., 4.])
+    """
+    if not index_columns or data_file.is_empty() or not {"name", "value"}.issubset(data_file.columns):
+        return None
+
+    names = data_file["name"].unique(maintain_order=True)
+    if names.str.to_lowercase().n_unique() != len(names) or set(names).intersection(data_file.columns):
+        return None
+
+    # Every record must have the same time stamps on the same rows and no duplicated rows.
+    positions = data_file.select(*index_columns, "name").with_columns(
+        position=pl.int_range(pl.len()).over("name")
+    )
+    first_record = positions.filter(pl.col("name") == names[0]).select(index_columns)
+    if first_record.height < 2 or first_record.is_duplicated().any():
+        return None
+    rows = positions.group_by("position").agg(
+        pl.struct(index_columns).n_unique().alias("n_keys"), pl.len().alias("n_records")
+    )
+    if (
+        rows.height != first_record.height
+        or rows["n_keys"].max() != 1
+        or rows["n_records"].min() != len(names)
+    ):
+        return None
+
+    wide_file = data_file.with_columns(pl.col("value").cast(pl.Float64)).pivot(
+        on="name", index=index_columns, values="value"
+    )
+    value_columns = names.to_list()
+    wide_file = reconcile_timeseries(wide_file, hourly_time_index, value_columns=value_columns)
+    matrix = np.asfortranarray(wide_file.select(value_columns).to_numpy())
+    column_index = {name.lower(): idx for idx, name in enumerate(value_columns)}
+    return matrix, column_index
+
+
 def construct_pwl_from_quadtratic(fn, mapped_records, num_tranches=6):
     """Given function data of quadratic curve, construct piecewise linear curve with num_tranches tranches."""
     assert isinstance(fn, QuadraticFunctionData), "Input function data must be of type QuadraticFunctionData"
@@ -2,10 +2,13 @@
 
 import importlib
 from argparse import ArgumentParser
-from collections.abc import Sequence
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from collections.abc import Iterator, Sequence
 from datetime import datetime, timedelta
 from pathlib import Path, PureWindowsPath
 from typing import Any
+from uuid import UUID
 
 import numpy as np
 import polars as pl
@@ -19,7 +22,7 @@ from infrasys.time_series_models import SingleTimeSeries
 from infrasys.value_curves import AverageRateCurve, InputOutputCurve, LinearCurve
 from loguru import logger
 from pint import Quantity
-from plexosdb import ClassEnum, CollectionEnum, PlexosDB
+from plexosdb import ClassEnum, CollectionEnum
 from plexosdb.utils import get_sql_query
 
 from r2x.api import System
@@ -62,22 +65,39 @@ from r2x.models import (
     UpDown,
 )
 from r2x.units import ureg
-from r2x.utils import get_enum_from_string, get_pint_unit, validate_string
+from r2x.utils import get_cache_dir, get_enum_from_string, get_pint_unit, validate_string
 
-from .handler import PCMParser, csv_handler
+from .handler import PCMParser, batched, construct_model_instance, csv_handler, validate_model_instance
 from .parser_helpers import (
     construct_pwl_from_quadtratic,
     field_filter,
     prepare_ext_field,
     reconcile_timeseries,
+    reconcile_timeseries_matrix,
+)
+from .plexos_cache import (
+    DATA_FILE_CACHE_FOLDER,
+    DATA_FILE_CACHE_MAX_SIZE,
+    evict_cache,
+    get_data_file_cache_fpath,
+    get_data_file_column_type,
+    get_data_file_header,
+    load_plexos_db,
+    read_data_file_cache,
+    scan_data_file_sidecar,
+    write_data_file_cache,
 )
 from .plexos_utils import (
     DATAFILE_COLUMNS,
+    LONG_DATAFILE_SCHEMAS,
     PLEXOS_ACTION_MAP,
+    TimeSliceCalendar,
     filter_property_dates,
     find_xml,
+    get_array_digest,
     get_column_enum,
     parse_data_file,
+    scan_data_file,
     time_slice_handler,
 )
 from .polars_helpers import pl_filter_by_year
@@ -128,6 +148,8 @@ DEFAULT_PROPERTY_COLUMNS = [
     # "timeslice_value",
 ]
 DEFAULT_INDEX = ["object_id", "name", "category"]
+# Identity of a property row used to resolve the scenario and dated overrides.
+RESOLUTION_KEY = ["parent_object_id", "object_id", "property_name", "band", "tag_timeslice"]
 SIMPLE_QUERY_COLUMNS_SCHEMA = {
     "parent_class_name": pl.String,
     "child_class_name": pl.String,
@@ -152,6 +174,60 @@ SIMPLE_QUERY_COLUMNS_SCHEMA = {
     "action": pl.String,
     "scenario": pl.String,
 }
+MEMBERSHIP_QUERY = """
+SELECT
+    mem.membership_id,
+    mem.parent_object_id,
+    mem.child_object_id,
+    parent_object.name AS parent,
+    child_object.name AS child,
+    child_category.name AS child_category,
+    parent_class.name AS parent_class_name,
+    child_class.name AS child_class_name,
+    REPLACE(collections.name, ' ', '') AS collection_name
+FROM
+    t_membership AS mem
+    INNER JOIN t_object AS parent_object ON mem.parent_object_id = parent_object.object_id
+    INNER JOIN t_object AS child_object ON mem.child_object_id = child_object.object_id
+    LEFT JOIN t_category AS child_category ON child_object.category_id = child_category.category_id
+    LEFT JOIN t_class AS parent_class ON parent_object.class_id = parent_class.class_id
+    LEFT JOIN t_class AS child_class ON child_object.class_id = child_class.class_id
+    LEFT JOIN t_collection AS collections ON mem.collection_id = collections.collection_id
+"""
+# Name and id of all the objects of a class. Used to resolve the variables and timeslices of the properties.
+OBJECT_ID_QUERY = """
+SELECT
+    obj.name,
+    obj.object_id
+FROM
+    t_object AS obj
+    INNER JOIN t_class AS class ON obj.class_id = class.class_id
+WHERE
+    class.name = ?
+"""
+# Classes referenced by name from the properties of other objects.
+REFERENCED_CLASSES = (ClassEnum.Variable, ClassEnum.Timeslice)
+MEMBERSHIP_COLUMNS_SCHEMA = {
+    "membership_id": pl.Int64,
+    "parent_object_id": pl.Int32,
+    "child_object_id": pl.Int32,
+    "parent": pl.String,
+    "child": pl.String,
+    "child_category": pl.String,
+    "parent_class_name": pl.String,
+    "child_class_name": pl.String,
+    "collection_name": pl.String,
+}
+# Relationships used to attach fuels, buses, reserves and storages to the devices:
+# name -> (parent class, child class, collection, whether the device is the parent of the membership).
+DEVICE_RELATIONSHIPS = {
+    "generator_fuel": (ClassEnum.Generator, ClassEnum.Fuel, None, True),
+    "generator_node": (ClassEnum.Generator, ClassEnum.Node, CollectionEnum.Nodes, True),
+    "generator_reserve": (ClassEnum.Reserve, ClassEnum.Generator, CollectionEnum.Generators, False),
+    "generator_storage": (ClassEnum.Generator, ClassEnum.Storage, None, True),
+    "battery_node": (ClassEnum.Battery, ClassEnum.Node, CollectionEnum.Nodes, True),
+    "battery_reserve": (ClassEnum.Reserve, ClassEnum.Battery, CollectionEnum.Batteries, False),
+}
 
 
 def cli_arguments(parser: ArgumentParser):
@@ -161,6 +237,55 @@ def cli_arguments(parser: ArgumentParser):
         required=False,
         help="Plexos model to translate",
     )
+    parser.add_argument(
+        "--cache-dir",
+        dest="cache_dir",
+        required=False,
+        help="Folder used to cache the parsed PLEXOS XML files. Defaults to `R2X_CACHE_DIR` or ~/.cache/r2x",
+    )
+    parser.add_argument(
+        "--no-xml-cache",
+        dest="no_xml_cache",
+        action="store_true",
+        help="Parse the PLEXOS XML file without using the cache",
+    )
+    parser.add_argument(
+        "--clear-xml-cache",
+        dest="clear_xml_cache",
+        action="store_true",
+        help="Delete the cached PLEXOS databases before parsing",
+    )
+    parser.add_argument(
+        "--data-file-cache",
+        dest="data_file_cache",
+        action="store_true",
+        help="Cache the parsed PLEXOS data files on disk to re-use them on later runs",
+    )
+    parser.add_argument(
+        "--trusted-input",
+        dest="trusted_input",
+        action="store_true",
+        help="Create the PLEXOS components without validating them",
+    )
+    parser.add_argument(
+        "--validate-trusted-input",
+        dest="validate_trusted_input",
+        action="store_true",
+        help="Validate the components created with `--trusted-input` after the system is built",
+    )
+    parser.add_argument(
+        "--models",
+        nargs="+",
+        required=False,
+        help="Translate several PLEXOS models of the XML loading the database only once",
+    )
+    parser.add_argument(
+        "--export-workers",
+        dest="export_workers",
+        type=int,
+        required=False,
+        help="Number of processes used to export the models translated with `--models`",
+    )
     return parser
 
 
@@ -184,6 +309,11 @@ class PlexosParser(PCMParser):
         self.year = self.input_config.model_year
         assert self.year
         assert isinstance(self.year, int)
+        # Trusted input builds the components without validation. See `_create_component`.
+        self.trusted_input: bool = getattr(self.config, "trusted_input", False)
+        self._constructed_components: list[Any] = []
+        # Set for the year of each model by `_set_model`.
+        self.hourly_time_index = pl.DataFrame(schema={"datetime": pl.Datetime})
 
         # TODO(pesap): Rename exceptions to include R2X
         # https://github.com/NREL/R2X/issues/5
@@ -202,15 +332,32 @@ class PlexosParser(PCMParser):
 
         xml_file = str(self.run_folder / xml_file)
 
-        self.db = PlexosDB.from_xml(xml_file)
+        self.db = load_plexos_db(
+            xml_file,
+            cache_dir=getattr(self.config, "cache_dir", None),
+            use_cache=not getattr(self.config, "no_xml_cache", False),
+            clear_cache=getattr(self.config, "clear_xml_cache", False),
+        )
 
         # Extract scenario data
         model_name = getattr(self.input_config, "model_name", None) or self.input_config.fmap.get(
             "xml_file", {}
         ).get("model_name", None)
-        if model_name is None:
+        if model_name is None and not getattr(self.config, "models", None):
             model_name = self._select_model_name()
+        if model_name is None:
+            model_name = getattr(self.config, "models")[0]
+        self._set_model(model_name)
+        return
+
+    def _set_model(self, model_name: str) -> None:
+        """Select the PLEXOS model to translate.
+
+        The time index, data files and time series are only reset if the year of the model changes, so
+        consecutive models of the same XML re-use them.
+        """
         logger.info("Parsing plexos model={}", model_name)
+        self.model_name = model_name
         self._process_scenarios(model_name=model_name)
 
         # date from is in days since 1900, convert to year
@@ -220,21 +367,61 @@ class PlexosParser(PCMParser):
             if date_from is not None:
                 self.year = int((date_from / 365.25) + 1900)
 
+        assert isinstance(self.year, int)
+        if not self.hourly_time_index.is_empty() and self.hourly_time_index["datetime"][0].year == self.year:
+            return
+
         self.hourly_time_index = pl.datetime_range(
             datetime(self.year, 1, 1), datetime(self.year + 1, 1, 1), interval="1h", eager=True, closed="left"
         ).to_frame("datetime")
+        self.time_slice_calendar = TimeSliceCalendar(self.hourly_time_index)
         self._data_file_cache: dict[Path, pl.DataFrame] = {}
         self._data_file_column_types: dict[Path, DATAFILE_COLUMNS] = {}
-
+        self._data_file_matrices: dict[Path, tuple[np.ndarray, dict[str, int]] | None] = {}
+        self._data_file_scans: dict[Path, tuple[pl.LazyFrame, DATAFILE_COLUMNS] | None] = {}
+        self._time_series_store: dict[tuple, SingleTimeSeries] = {}
+        self._time_series_copies: dict[tuple[UUID, str, bool], SingleTimeSeries] = {}
         return
 
+    def build_systems(self, model_names: Sequence[str]) -> Iterator[tuple[str, System]]:
+        """Create a system for each PLEXOS model of the XML.
+
+        The database, the object table and the data files are loaded once and shared by all the models.
+        Only the scenario resolution and the construction of the components run for each model.
+
+        Parameters
+        ----------
+        model_names : Sequence[str]
+            Names of the PLEXOS models to translate.
+
+        Yields
+        ------
+        tuple[str, System]
+            Model name and its system. The parser is set to the model until the next system is requested.
+        """
+        for model_name in model_names:
+            self._set_model(model_name)
+            self.system = System(name=model_name, auto_add_composed_components=True)
+            yield model_name, self.build_system()
+
     def build_system(self) -> System:
         """Create infrasys system."""
         logger.info("Building infrasys system using {}", self.__class__.__name__)
 
         # If we decide to change the engine for handling the data we can do it here.
-        object_data = self._plexos_table_data()
-        self.plexos_data = self._polarize_data(object_data=object_data)
+        # The object table and memberships do not depend on the model, so they are only loaded once.
+        if not hasattr(self, "plexos_data"):
+            object_data = self._plexos_table_data()
+            self.plexos_data = self._polarize_data(object_data=object_data)
+            self._build_membership_index()
+            self._build_relationship_map()
+            self._build_object_id_index()
+        self._build_property_index()
+        self._prefetch_data_files()
+        self._constructed_components = []
+        # Time series are attached to a single system, so they are only shared between components of a model.
+        self._time_series_store = {}
+        self._time_series_copies = {}
 
         # Construct the network
         self._construct_areas()
@@ -260,8 +447,49 @@ class PlexosParser(PCMParser):
 
         # Emission object_class
         self._add_generator_emissions()
+
+        if self.trusted_input and getattr(self.config, "validate_trusted_input", False):
+            self._validate_components()
         return self.system
 
+    def _create_component(self, model_class: type[Any], **valid_fields) -> Any:
+        """Create a component of the model class.
+
+        With trusted input the component is built with `model_construct` skipping the pydantic validation and
+        can be validated afterwards with `_validate_components`.
+        """
+        if not self.trusted_input:
+            return model_class(**valid_fields)
+        component = construct_model_instance(model_class, **valid_fields)
+        self._constructed_components.append(component)
+        return component
+
+    def _validate_components(self) -> None:
+        """Validate the components created from trusted input.
+
+        Validation is CPU bound pure Python, so it runs serially. The system keeps the constructed components;
+        validation only reports the ones that are not valid.
+
+        Raises
+        ------
+        R2XModelError
+            If any of the components is not valid.
+        """
+        logger.debug("Validating {} components", len(self._constructed_components))
+        errors = [
+            (component, error)
+            for component in self._constructed_components
+            if (error := validate_model_instance(component)) is not None
+        ]
+        if errors:
+            details = "\n".join(
+                f"{getattr(component, 'label', type(component).__name__)}: {error}"
+                for component, error in errors
+            )
+            msg = f"{len(errors)} components created from trusted input are not valid:\n{details}"
+            raise R2XModelError(msg)
+        return
+
     def _collect_horizon_data(self, model_name: str) -> dict[str, float]:
         """Collect horizon data (Date From/To) from Plexos database."""
         horizon_query = f"""
@@ -293,27 +521,20 @@ class PlexosParser(PCMParser):
 
     def _get_fuel_prices(self):
         logger.debug("Creating fuel representation")
-        system_fuels = (pl.col("child_class_name") == ClassEnum.Fuel.value) & (
-            pl.col("parent_class_name") == ClassEnum.System.value
-        )
-
-        fuels = self._get_model_data(system_fuels)
+        fuels = self._get_class_data(ClassEnum.Fuel, ClassEnum.System)
         fuels.write_csv("fuels.csv")
         fuel_prices = {}
         for fuel_name, fuel_data in fuels.group_by("name"):
             fuel_name = fuel_name[0]
-            property_records = fuel_data.to_dicts()
-
-            for property in property_records:
-                property.update({"property_unit": "$/MMBtu"})
-
-            mapped_records, multi_band_records = self._parse_property_data(property_records)
+            fuel_data = fuel_data.with_columns(property_unit=pl.lit("$/MMBtu"))
+            mapped_records, multi_band_records = self._parse_property_data(fuel_data)
             if multi_band_records:
                 logger.warning("Some properties have multiple bands.")
             mapped_records["name"] = fuel_name
             fuel_prices[fuel_name] = mapped_records.get("Price", 0)
         return fuel_prices
 
+    @batched
     def _construct_areas(self) -> None:
         """Create Area representation from a PLEXOS model.
 
@@ -321,13 +542,11 @@ class PlexosParser(PCMParser):
         The equivalent of an Area from PLEXOS is a `ClassEnum.Region` category.
         """
         logger.info("Creating `Area` representation")
-        system_regions = (pl.col("child_class_name") == ClassEnum.Region.value) & (
-            pl.col("parent_class_name") == ClassEnum.System.value
-        )
-        regions = self._get_model_data(system_regions)
+        regions = self._get_class_data(ClassEnum.Region, ClassEnum.System)
         for area in regions["category"].unique():
-            self.system.add_component(Area(name=area))
+            self.system.add_component(self._create_component(Area, name=area))
 
+    @batched
     def _construct_load_zones(self, default_model=LoadZone) -> None:
         """Create LoadZone representation.
 
@@ -336,10 +555,7 @@ class PlexosParser(PCMParser):
         of doing it.
         """
         logger.info("Creating `LoadZone` representation")
-        system_regions = (pl.col("child_class_name") == ClassEnum.Zone.value) & (
-            pl.col("parent_class_name") == ClassEnum.System.value
-        )
-        regions = self._get_model_data(system_regions)
+        regions = self._get_class_data(ClassEnum.Zone, ClassEnum.System)
 
         region_pivot = regions.pivot(
             index=DEFAULT_INDEX,
@@ -350,56 +566,39 @@ class PlexosParser(PCMParser):
         for region in region_pivot.iter_rows(named=True):
             valid_fields, ext_data = field_filter(region, default_model.model_fields)
             valid_fields = prepare_ext_field(valid_fields, ext_data)
-            self.system.add_component(default_model(**valid_fields))
+            self.system.add_component(self._create_component(default_model, **valid_fields))
         return
 
+    @batched
     def _construct_buses(self, default_model=ACBus) -> None:
         logger.info("Creating `Bus` representation")
 
         # Get list of buses that are connected to lines, because `sienna` doesn't like islanded buses
-        buses_connected_to_lines = self._get_model_data(
-            (
-                (pl.col("parent_class_name") == ClassEnum.Line.value).or_(
-                    pl.col("parent_class_name") == ClassEnum.Transformer.value
-                )
-            )
-            & (pl.col("child_class_name") == ClassEnum.Node.value)
-        )["name"]
-
-        system_buses = (
-            (pl.col("child_class_name") == ClassEnum.Node.value)
-            & (pl.col("parent_class_name") == ClassEnum.System.value)
-            & (pl.col("name").is_in(buses_connected_to_lines))
-        )
-        region_buses = (pl.col("child_class_name") == ClassEnum.Region.value) & (
-            pl.col("parent_class_name") == ClassEnum.Node.value
+        buses_connected_to_lines = pl.concat(
+            [
+                self._get_class_data(ClassEnum.Node, ClassEnum.Line)["name"],
+                self._get_class_data(ClassEnum.Node, ClassEnum.Transformer)["name"],
+            ]
         )
-        zone_buses = (pl.col("child_class_name") == ClassEnum.Zone.value) & (
-            pl.col("parent_class_name") == ClassEnum.Node.value
+
+        system_buses = self._get_class_data(ClassEnum.Node, ClassEnum.System).filter(
+            pl.col("name").is_in(buses_connected_to_lines)
         )
-        system_buses = self._get_model_data(system_buses)
-        buses_region = self._get_model_data(region_buses)
-        buses_zone = self._get_model_data(zone_buses)
         for idx, (bus_name, bus_data) in enumerate(system_buses.group_by("name")):
             bus_name = bus_name[0]
             logger.trace("Parsing bus = {}", bus_name)
 
-            property_records = bus_data.to_dicts()
-            mapped_records, _ = self._parse_property_data(property_records)
+            mapped_records, _ = self._parse_property_data(bus_data)
             mapped_records["name"] = bus_name
-            # mapped_records, _ = self._parse_property_data(property_records)
 
             valid_fields, ext_data = field_filter(mapped_records, default_model.model_fields)
 
-            # Get region from buses region memberships
-            region_name = buses_region.filter(pl.col("parent_object_id") == bus_data["object_id"].unique())[
-                "category"
-            ].item()
-            zone_name = (
-                buses_zone.filter(pl.col("parent_object_id") == bus_data["object_id"].unique())["name"]
-                .unique()
-                .item()
-            )
+            # Get region and zone from the bus memberships
+            bus_object_id = bus_data["object_id"][0]
+            region_name = self._get_object_memberships(bus_object_id, CollectionEnum.Region)[0][
+                "child_category"
+            ]
+            zone_name = self._get_object_memberships(bus_object_id, CollectionEnum.Zone)[0]["child"]
 
             valid_fields["area"] = self.system.get_component(Area, name=region_name)
             valid_fields["load_zone"] = self.system.get_component(LoadZone, name=zone_name)
@@ -416,7 +615,7 @@ class PlexosParser(PCMParser):
             )
 
             valid_fields = prepare_ext_field(valid_fields, ext_data)
-            bus = default_model(number=idx + 1, **valid_fields)
+            bus = self._create_component(default_model, number=idx + 1, **valid_fields)
             self.system.add_component(bus)
 
             if max_active_power := mapped_records.pop("max_active_power", False):
@@ -429,41 +628,33 @@ class PlexosParser(PCMParser):
                 if max_load > 0:
                     load = PowerLoad(name=f"{bus_name}", bus=bus, max_active_power=max_load)
                     self.system.add_component(load)
-                    ts_dict = {"solve_year": self.year}
+                    ts_dict: dict[str, Any] = {"solve_year": self.year}
                     if isinstance(max_active_power, SingleTimeSeries):
-                        self.system.add_time_series(max_active_power, load, connection=None, **ts_dict)
+                        self.system.add_time_series(max_active_power, load, **ts_dict)
 
             ts_fields = {k: v for k, v in mapped_records.items() if isinstance(v, SingleTimeSeries)}
             if ts_fields:
-                generator = self.system.get_component_by_label(f"{default_model.__name__}.{bus_name}")
                 ts_dict = {"solve_year": self.year}
                 for ts_name, ts in ts_fields.items():
-                    ts.variable_name = ts_name
-                    self.system.add_time_series(ts, generator, connection=None, **ts_dict)
+                    ts = self._get_time_series_copy(ts, ts_name)
+                    self.system.add_time_series(ts, bus, **ts_dict)
         return
 
     def _add_generator_emissions(self, default_model=Emission):
         logger.info("Creating buses representation")
-        emission_objects = (pl.col("child_class_name") == ClassEnum.Emission.value) & (
-            pl.col("parent_class_name") == ClassEnum.System.value
-        )
-        generator_emissions = (pl.col("child_class_name") == ClassEnum.Generator.value) & (
-            pl.col("parent_class_name") == ClassEnum.Emission.value
-        )
-        emission_objects = self._get_model_data(emission_objects)
-        generator_emissions = self._get_model_data(generator_emissions)
+        emission_objects = self._get_class_data(ClassEnum.Emission, ClassEnum.System)
+        generator_emissions = self._get_class_data(ClassEnum.Generator, ClassEnum.Emission)
         generator_emissions = generator_emissions.join(
             emission_objects, left_on="parent_object_id", right_on="object_id", suffix="_emission"
         )
 
-        for generator_name, generator_data in generator_emissions.group_by(["name", "name_emission"]):
-            generator_name = generator_name[0]
+        emission_properties = self._parse_class_property_data(
+            generator_emissions, group_by=["name", "name_emission"]
+        )
+        for (generator_name, emission_name), (mapped_records, _) in emission_properties.items():
             logger.trace("Parsing generator emission properties = {}", generator_name)
 
-            property_records = generator_data.to_dicts()
-            mapped_records, multi_band_records = self._parse_property_data(property_records)
             mapped_records["generator_name"] = generator_name
-            emission_name = generator_data["name_emission"].item()
             if emission_name in EmissionType._value2member_map_:
                 mapped_records["emission_type"] = EmissionType[emission_name]
             else:
@@ -492,21 +683,19 @@ class PlexosParser(PCMParser):
                     missing_fields,
                 )
                 continue
-            self.system.add_supplemental_attribute(gen_component, default_model(**valid_fields))
+            self.system.add_supplemental_attribute(
+                gen_component, self._create_component(default_model, **valid_fields)
+            )
 
+    @batched
     def _construct_reserves(self, default_model=Reserve):
         logger.info("Creating reserve representation")
 
-        system_reserves = self._get_model_data(
-            (pl.col("child_class_name") == ClassEnum.Reserve.name)
-            & (pl.col("parent_class_name") == ClassEnum.System.name)
-        )
+        system_reserves = self._get_class_data(ClassEnum.Reserve, ClassEnum.System)
 
-        for reserve_name, reserve_data in system_reserves.group_by("name"):
-            reserve_name = reserve_name[0]
+        reserve_properties = self._parse_class_property_data(system_reserves)
+        for (reserve_name,), (mapped_records, _) in reserve_properties.items():
             logger.trace("Parsing reserve = {}", reserve_name)
-            property_records = reserve_data.to_dicts()
-            mapped_records, _ = self._parse_property_data(property_records)
             mapped_records["name"] = reserve_name
             reserve_type = validate_string(mapped_records.pop("Type", "default"))
             plexos_reserve_map = self.input_config.defaults["reserve_types"].get(
@@ -550,28 +739,22 @@ class PlexosParser(PCMParser):
             )
 
             valid_fields = prepare_ext_field(valid_fields, ext_data)
-            self.system.add_component(default_model(**valid_fields))
+            reserve = self._create_component(default_model, **valid_fields)
+            self.system.add_component(reserve)
 
             if ts_fields:
-                reserve = self.system.get_component_by_label(f"{default_model.__name__}.{reserve_name}")
                 ts_dict = {"solve_year": self.year}
                 for ts_name, ts in ts_fields.items():
-                    ts.variable_name = ts_name
-                    self.system.add_time_series(ts, reserve, connection=None, **ts_dict)
+                    ts = self._get_time_series_copy(ts, ts_name)
+                    self.system.add_time_series(ts, reserve, **ts_dict)
 
         reserve_map = ReserveMap(name="contributing_generators")
         self.system.add_component(reserve_map)
         return
 
     def _add_reserve_region_properties(self):
-        region_reserve_filter = (pl.col("child_class_name") == ClassEnum.Region.value) & (
-            pl.col("parent_class_name") == ClassEnum.Reserve.value
-        )
-        system_reserves = self._get_model_data(
-            (pl.col("child_class_name") == ClassEnum.Reserve.name)
-            & (pl.col("parent_class_name") == ClassEnum.System.name)
-        )
-        region_reserve_data = self._get_model_data(region_reserve_filter)
+        system_reserves = self._get_class_data(ClassEnum.Reserve, ClassEnum.System)
+        region_reserve_data = self._get_class_data(ClassEnum.Region, ClassEnum.Reserve)
         for reserve_object_id, reserve_data in region_reserve_data.group_by("parent_object_id"):
             reserve_object_id = reserve_object_id[0]
             region_names = reserve_data["name"].unique().to_list()
@@ -587,8 +770,7 @@ class PlexosParser(PCMParser):
             if not len(reserve_data["property_value"].unique() == 1):
                 msg = "Multiple property values not supported for Reserve regions."
                 raise NotImplementedError
-            property_records = reserve_data.to_dicts()
-            mapped_records, _ = self._parse_property_data(property_records)
+            mapped_records, _ = self._parse_property_data(reserve_data)
 
             reserve_name = (
                 system_reserves.filter(pl.col("object_id") == reserve_object_id)["name"].unique().item()
@@ -600,12 +782,10 @@ class PlexosParser(PCMParser):
                 reserve_object.load_risk = mapped_records["load_risk"]
         return
 
+    @batched
     def _construct_branches(self, default_model=MonitoredLine):
         logger.info("Creating lines")
-        system_lines = (pl.col("child_class_name") == ClassEnum.Line.value) & (
-            pl.col("parent_class_name") == ClassEnum.System.value
-        )
-        system_lines = self._get_model_data(system_lines)
+        system_lines = self._get_class_data(ClassEnum.Line, ClassEnum.System)
 
         lines_pivot = system_lines.pivot(
             index=DEFAULT_INDEX,
@@ -617,9 +797,6 @@ class PlexosParser(PCMParser):
             logger.warning("No line objects found on the system.")
             return
 
-        lines_pivot_memberships = self.db.get_object_memberships(
-            *lines_pivot["name"].to_list(), class_enum=ClassEnum.Line
-        )
         for line in lines_pivot.iter_rows(named=True):
             line_properties_mapped = {self.property_map.get(key, key): value for key, value in line.items()}
             line_properties_mapped["rating"] = line_properties_mapped.get("max_power_flow", 0.0)
@@ -634,39 +811,25 @@ class PlexosParser(PCMParser):
 
             valid_fields, ext_data = field_filter(line_properties_mapped, default_model.model_fields)
 
-            from_bus_name = next(
-                membership
-                for membership in lines_pivot_memberships
-                if (
-                    membership["parent"] == line["name"]
-                    and membership["parent_class_name"] == ClassEnum.Line.name
-                    and membership["collection_name"].replace(" ", "") == CollectionEnum.NodeFrom.name
-                )
-            )["child"]
+            from_bus_name = self._get_memberships(ClassEnum.Line, line["name"], CollectionEnum.NodeFrom)[0][
+                "child"
+            ]
             from_bus = self.system.get_component(ACBus, from_bus_name)
-            to_bus_name = next(
-                membership
-                for membership in lines_pivot_memberships
-                if (
-                    membership["parent"] == line["name"]
-                    and membership["parent_class_name"] == ClassEnum.Line.name
-                    and membership["collection_name"].replace(" ", "") == CollectionEnum.NodeTo.name
-                )
-            )["child"]
+            to_bus_name = self._get_memberships(ClassEnum.Line, line["name"], CollectionEnum.NodeTo)[0][
+                "child"
+            ]
             to_bus = self.system.get_component(ACBus, to_bus_name)
             valid_fields["from_bus"] = from_bus
             valid_fields["to_bus"] = to_bus
 
             valid_fields = prepare_ext_field(valid_fields, ext_data)
-            self.system.add_component(default_model(**valid_fields))
+            self.system.add_component(self._create_component(default_model, **valid_fields))
         return
 
+    @batched
     def _construct_transformers(self, default_model=Transformer2W):
         logger.info("Creating transformers")
-        system_transformers = (pl.col("child_class_name") == ClassEnum.Transformer.value) & (
-            pl.col("parent_class_name") == ClassEnum.System.value
-        )
-        system_transformers = self._get_model_data(system_transformers)
+        system_transformers = self._get_class_data(ClassEnum.Transformer, ClassEnum.System)
         transformer_pivot = system_transformers.pivot(
             index=DEFAULT_INDEX,
             on="property_name",
@@ -677,9 +840,6 @@ class PlexosParser(PCMParser):
             logger.warning("No transformer objects found on the system.")
             return
 
-        lines_pivot_memberships = self.db.get_object_memberships(
-            *transformer_pivot["name"].to_list(), class_enum=ClassEnum.Transformer
-        )
         for transformer in transformer_pivot.iter_rows(named=True):
             transformer_properties_mapped = {
                 self.property_map.get(key, key): value for key, value in transformer.items()
@@ -700,31 +860,19 @@ class PlexosParser(PCMParser):
 
             valid_fields, ext_data = field_filter(transformer_properties_mapped, default_model.model_fields)
 
-            from_bus_name = next(
-                membership
-                for membership in lines_pivot_memberships
-                if (
-                    membership["parent"] == transformer["name"]
-                    and membership["parent_class_name"] == ClassEnum.Transformer.name
-                    and membership["collection"].replace(" ", "") == CollectionEnum.NodeFrom.name
-                )
-            )["child"]
+            from_bus_name = self._get_memberships(
+                ClassEnum.Transformer, transformer["name"], CollectionEnum.NodeFrom
+            )[0]["child"]
             from_bus = self.system.get_component(ACBus, from_bus_name)
-            to_bus_name = next(
-                membership
-                for membership in lines_pivot_memberships
-                if (
-                    membership["parent"] == transformer["name"]
-                    and membership["parent_class_name"] == ClassEnum.Transformer.name
-                    and membership["collection"].replace(" ", "") == CollectionEnum.NodeTo.name
-                )
-            )["child"]
+            to_bus_name = self._get_memberships(
+                ClassEnum.Transformer, transformer["name"], CollectionEnum.NodeTo
+            )[0]["child"]
             to_bus = self.system.get_component(ACBus, to_bus_name)
             valid_fields["from_bus"] = from_bus
             valid_fields["to_bus"] = to_bus
 
             valid_fields = prepare_ext_field(valid_fields, ext_data)
-            self.system.add_component(default_model(**valid_fields))
+            self.system.add_component(self._create_component(default_model, **valid_fields))
         return
 
     def _infer_model_type(self, generator_name):
@@ -788,47 +936,32 @@ class PlexosParser(PCMParser):
                     return model
         return ""
 
+    @batched
     def _construct_generators(self):  # noqa: C901
         """Create Plexos generator objects."""
         logger.info("Creating generator objects")
 
         # Filter only generator objects that belong to the system
-        # NOTE: Polars 1.1.0 can not make a comparisson between a Enum and a string column. If we convert the
-        # Enum to string it works, but we might be able to change this in a near future if polars supports it.
-        system_generators_filter = (pl.col("child_class_name") == str(ClassEnum.Generator)) & (
-            pl.col("parent_class_name") == str(ClassEnum.System)
-        )
-
-        system_generators = self._get_model_data(system_generators_filter)
+        system_generators = self._get_class_data(ClassEnum.Generator, ClassEnum.System)
         if self.config.feature_flags.get("plexos-csv", None):
             system_generators.write_csv("generators.csv")
 
         # NOTE: The best way to identify the type of generator on Plexos is by reading the fuel
-        fuel_query = f"""
-        SELECT
-            parent_object.name AS parent_object_name,
-            child_object.name AS fuel_name
-        FROM
-            t_membership AS mem
-            LEFT JOIN t_object AS child_object ON mem.child_object_id = child_object.object_id
-            LEFT JOIN t_object AS parent_object ON mem.parent_object_id = parent_object.object_id
-            LEFT JOIN t_class AS child_class ON child_object.class_id = child_class.class_id
-            LEFT JOIN t_class AS parent_cls ON parent_object.class_id = parent_cls.class_id
-        WHERE
-            child_class.name = '{ClassEnum.Fuel}'
-            AND parent_cls.name = '{ClassEnum.Generator}'
-        """
-        generator_fuel = self.db.query(fuel_query)
-        generator_fuel_map = {key: value for key, value in generator_fuel}
+        generator_fuel_map = dict(
+            self.relationships.filter(pl.col("relationship") == "generator_fuel")
+            .select("device", "related")
+            .rows()
+        )
 
         fuel_prices = self._get_fuel_prices()
+        generator_properties = self._parse_class_property_data(system_generators)
+        generator_storage = self._get_generator_storage_properties()
 
         # Iterate over properties to create generator object
         for generator_name, generator_data in system_generators.group_by("name"):
             generator_name = generator_name[0]
 
             category = generator_data["category"].unique()
-            object_id = generator_data["object_id"].unique().item()
             if len(category) > 1:
                 msg = "Generator has more then one category. Check the dataset"
                 logger.debug(msg)
@@ -855,10 +988,7 @@ class PlexosParser(PCMParser):
                 )
                 raise AttributeError(msg)
 
-            # property_records = generator_data[DEFAULT_PROPERTY_COLUMNS].to_dicts()
-            property_records = generator_data.to_dicts()
-
-            mapped_records, multi_band_records = self._parse_property_data(property_records)
+            mapped_records, _ = generator_properties.get((generator_name,), ({}, set()))
             mapped_records["name"] = generator_name
 
             # if multi_band_records:
@@ -877,7 +1007,7 @@ class PlexosParser(PCMParser):
 
             mapped_records = self._set_unit_capacity(mapped_records)
             if model_map.__name__ == HydroPumpedStorage.__name__:
-                mapped_records = self._get_storage_objects_attached(object_id, mapped_records)
+                mapped_records = generator_storage.get(generator_name, {}) | mapped_records
 
                 # NOTE: Some Plexos models mighy have different up and down capacities. We need to parse those
                 # at some point as well.
@@ -916,122 +1046,87 @@ class PlexosParser(PCMParser):
             )
 
             valid_fields = prepare_ext_field(valid_fields, ext_data)
-            self.system.add_component(model_map(**valid_fields))
-            generator = self.system.get_component_by_label(f"{model_map.__name__}.{generator_name}")
+            generator = self._create_component(model_map, **valid_fields)
+            self.system.add_component(generator)
 
             if ts_fields:
-                generator = self.system.get_component_by_label(f"{model_map.__name__}.{generator_name}")
                 ts_dict = {"solve_year": self.year}
                 for ts_name, ts in ts_fields.items():
-                    ts.variable_name = ts_name
-
                     # NOTE: This is fix to avoid mismatch with unit registry for custom units.
-                    if isinstance(ts.data, Quantity):
-                        # ts_dict["units"] = str(ts.data.units)
-                        ts.data = ts.data.magnitude
+                    # ts_dict["units"] = str(ts.data.units)
+                    ts = self._get_time_series_copy(ts, ts_name, unitless=isinstance(ts.data, Quantity))
                     self.system.add_time_series(ts, generator, **ts_dict)
         return
 
-    def _get_storage_objects_attached(self, object_id: int, mapped_records: dict[str, Any]) -> dict[str, Any]:
-        """Get head and tail objects for generators with Storage.
+    def _get_generator_storage_properties(self) -> dict[str, dict[str, Any]]:
+        """Get head and tail storage properties of all the generators with Storage.
 
         Currently only works for PHS type of generator where the generator appears and it has a head and tail
         object attached to it.
 
         Notes
         -----
-            If the head and tail have separate values, we just get the first occurence.
+            If the head and tail have separate values, we just get the last occurence.
         """
-        system_storage_filter = (pl.col("child_class_name") == str(ClassEnum.Storage)) & (
-            pl.col("parent_class_name") == str(ClassEnum.System)
+        generator_storages = self.relationships.filter(pl.col("relationship") == "generator_storage").select(
+            pl.col("device").alias("generator_name"), pl.col("related_object_id").alias("object_id")
         )
-        generator_storage_filter = (pl.col("child_class_name") == str(ClassEnum.Storage)) & (
-            pl.col("parent_class_name") == str(ClassEnum.Generator)
-        )
-        storage_objects = self._get_model_data(generator_storage_filter).filter(
-            pl.col("parent_object_id") == object_id
-        )["object_id"]
-
-        system_storage_data = self._get_model_data(system_storage_filter).filter(
-            pl.col("object_id").is_in(storage_objects)
+        system_storage_data = self._get_class_data(ClassEnum.Storage, ClassEnum.System).join(
+            generator_storages, on="object_id"
         )
-        mapped_storage_records, ext_data = self._parse_property_data(system_storage_data.to_dicts())
-
-        return mapped_storage_records | mapped_records
+        storage_properties = self._parse_class_property_data(system_storage_data, group_by=["generator_name"])
+        return {
+            generator_name: mapped_storage_records
+            for (generator_name,), (mapped_storage_records, _) in storage_properties.items()
+        }
 
     def _add_buses_to_generators(self):
         # Add buses to generators
-        generators = [generator["name"] for generator in self.system.to_records(Generator)]
-        generator_memberships = self.db.get_object_memberships(
-            *generators,
-            class_enum=ClassEnum.Generator,
-            collection_enum=CollectionEnum.Nodes,
-        )
         for generator in self.system.get_components(Generator):
-            buses = [
-                membership for membership in generator_memberships if membership["parent"] == generator.name
-            ]
-            if buses:
-                for bus in buses:
-                    try:
-                        bus_object = self.system.get_component(ACBus, name=bus["child"])
-                    except ISNotStored:
-                        logger.warning(
-                            "Skipping membership for generator:{} since reserve {} is not stored",
-                            generator.name,
-                            buses["child"],
-                        )
-                        continue
-                    generator.bus = bus_object
+            for bus in self._get_relationships("generator_node", generator.name):
+                try:
+                    bus_object = self.system.get_component(ACBus, name=bus["related"])
+                except ISNotStored:
+                    logger.warning(
+                        "Skipping membership for generator:{} since bus {} is not stored",
+                        generator.name,
+                        bus["related"],
+                    )
+                    continue
+                generator.bus = bus_object
         return
 
     def _add_generator_reserves(self):
         reserve_map = self.system.get_component(ReserveMap, name="contributing_generators")
-        generators = [generator["name"] for generator in self.system.to_records(Generator)]
-        generator_memberships = self.db.get_object_memberships(
-            *generators,
-            class_enum=ClassEnum.Generator,
-            parent_class_enum=ClassEnum.Reserve,
-            collection_enum=CollectionEnum.Generators,
-        )
         for generator in self.system.get_components(Generator):
-            reserves = [
-                membership for membership in generator_memberships if membership["child"] == generator.name
-            ]
-            if reserves:
-                # NOTE: This would get replaced if we have a method on infrasys
-                # that check if something exists on the system
-                for reserve in reserves:
-                    try:
-                        reserve_object = self.system.get_component(Reserve, name=reserve["parent"])
-                    except ISNotStored:
-                        logger.warning(
-                            "Skipping membership for generator:{} since reserve {} is not stored",
-                            generator.name,
-                            reserve["child"],
-                        )
-                        continue
-                    reserve_map.mapping[reserve_object.name].append(generator.name)
+            # NOTE: This would get replaced if we have a method on infrasys
+            # that check if something exists on the system
+            for reserve in self._get_relationships("generator_reserve", generator.name):
+                try:
+                    reserve_object = self.system.get_component(Reserve, name=reserve["related"])
+                except ISNotStored:
+                    logger.warning(
+                        "Skipping membership for generator:{} since reserve {} is not stored",
+                        generator.name,
+                        reserve["related"],
+                    )
+                    continue
+                reserve_map.mapping[reserve_object.name].append(generator.name)
         return
 
+    @batched
     def _construct_batteries(self):
         logger.info("Creating battery objects")
-        system_batteries = self._get_model_data(
-            (pl.col("child_class_name") == ClassEnum.Battery.name)
-            & (pl.col("parent_class_name") == ClassEnum.System.name)
-        )
+        system_batteries = self._get_class_data(ClassEnum.Battery, ClassEnum.System)
 
         required_fields = {
             key: value for key, value in EnergyReservoirStorage.model_fields.items() if value.is_required()
         }
 
-        for battery_name, battery_data in system_batteries.group_by("name"):
-            battery_name = battery_name[0]
+        battery_properties = self._parse_class_property_data(system_batteries)
+        for (battery_name,), (mapped_records, _) in battery_properties.items():
             logger.trace("Parsing battery = {}", battery_name)
 
-            property_records = battery_data.to_dicts()
-
-            mapped_records, _ = self._parse_property_data(property_records)
             mapped_records["name"] = battery_name
             mapped_records["prime_mover_type"] = PrimeMoversType.BA
 
@@ -1061,79 +1156,56 @@ class PlexosParser(PCMParser):
                 continue
 
             valid_fields = prepare_ext_field(valid_fields, ext_data)
-            self.system.add_component(EnergyReservoirStorage(**valid_fields))
+            self.system.add_component(self._create_component(EnergyReservoirStorage, **valid_fields))
         return
 
     def _add_buses_to_batteries(self):
-        batteries = [battery["name"] for battery in self.system.to_records(EnergyReservoirStorage)]
+        batteries = list(self.system.get_components(EnergyReservoirStorage))
         if not batteries:
             msg = "No battery objects found on the system. Skipping adding membership to buses"
             logger.warning(msg)
             return
-        generator_memberships = self.db.get_object_memberships(
-            *batteries,
-            class_enum=ClassEnum.Battery,
-            collection_enum=CollectionEnum.Nodes,
-        )
-        for component in self.system.get_components(EnergyReservoirStorage):
-            buses = [
-                membership for membership in generator_memberships if membership["parent"] == component.name
-            ]
-            if buses:
-                for bus in buses:
-                    try:
-                        bus_object = self.system.get_component(ACBus, name=bus["child"])
-                    except ISNotStored:
-                        logger.warning(
-                            "Skipping membership for battery:{} since bus {} is not stored",
-                            component.name,
-                            buses["child"],
-                        )
-                        continue
-                    component.bus = bus_object
+        for component in batteries:
+            for bus in self._get_relationships("battery_node", component.name):
+                try:
+                    bus_object = self.system.get_component(ACBus, name=bus["related"])
+                except ISNotStored:
+                    logger.warning(
+                        "Skipping membership for battery:{} since bus {} is not stored",
+                        component.name,
+                        bus["related"],
+                    )
+                    continue
+                component.bus = bus_object
         return
 
     def _add_battery_reserves(self):
         reserve_map = self.system.get_component(ReserveMap, name="contributing_generators")
-        batteries = [battery["name"] for battery in self.system.to_records(EnergyReservoirStorage)]
+        batteries = list(self.system.get_components(EnergyReservoirStorage))
         if not batteries:
             msg = "No battery objects found on the system. Skipping adding reserve memberships"
             logger.warning(msg)
             return
-        generator_memberships = self.db.get_object_memberships(
-            *batteries,
-            class_enum=ClassEnum.Battery,
-            parent_class_enum=ClassEnum.Reserve,
-            collection_enum=CollectionEnum.Batteries,
-        )
-
-        for battery in self.system.get_components(EnergyReservoirStorage):
-            reserves = [
-                membership for membership in generator_memberships if membership["child"] == battery.name
-            ]
-            if reserves:
-                # NOTE: This would get replaced if we have a method on infrasys
-                # that check if something exists on the system
-                for reserve in reserves:
-                    try:
-                        reserve_object = self.system.get_component(Reserve, name=reserve["parent"])
-                    except ISNotStored:
-                        logger.warning(
-                            "Skipping membership for generator:{} since reserve {} is not stored",
-                            battery.name,
-                            reserve["parent"],
-                        )
-                        continue
-                    reserve_map.mapping[reserve_object.name].append(battery.name)
+        for battery in batteries:
+            # NOTE: This would get replaced if we have a method on infrasys
+            # that check if something exists on the system
+            for reserve in self._get_relationships("battery_reserve", battery.name):
+                try:
+                    reserve_object = self.system.get_component(Reserve, name=reserve["related"])
+                except ISNotStored:
+                    logger.warning(
+                        "Skipping membership for generator:{} since reserve {} is not stored",
+                        battery.name,
+                        reserve["related"],
+                    )
+                    continue
+                reserve_map.mapping[reserve_object.name].append(battery.name)
         return
 
     def _construct_interfaces(self, default_model=TransmissionInterface):
         """Construct Transmission Interface and Transmission Interface Map."""
         logger.info("Creating transmission interfaces")
-        system_interfaces_mask = (pl.col("child_class_name") == ClassEnum.Interface.name) & (
-            pl.col("parent_class_name") == ClassEnum.System.name
-        )
-        system_interfaces = self._get_model_data(system_interfaces_mask)
+        system_interfaces = self._get_class_data(ClassEnum.Interface, ClassEnum.System)
         interfaces = system_interfaces.pivot(
             index=DEFAULT_INDEX,
             on="property_name",
@@ -1179,21 +1251,17 @@ class PlexosParser(PCMParser):
                 continue
 
             valid_fields = prepare_ext_field(valid_fields, ext_data)
-            self.system.add_component(default_model(**valid_fields))
+            self.system.add_component(self._create_component(default_model, **valid_fields))
 
         # Add lines memberships
-        lines = [line["name"] for line in self.system.to_records(MonitoredLine)]
-        if not lines:
-            return
-        lines_memberships = self.db.get_object_memberships(
-            *lines,
-            class_enum=ClassEnum.Line,
-            parent_class_enum=ClassEnum.Interface,
-            collection_enum=CollectionEnum.Lines,
-        )
         for line in self.system.get_components(MonitoredLine):
             interface = next(
-                (membership for membership in lines_memberships if membership["child"] == line.name), None
+                iter(
+                    self._get_child_memberships(
+                        ClassEnum.Line, line.name, CollectionEnum.Lines, parent_class=ClassEnum.Interface
+                    )
+                ),
+                None,
             )
             if interface:
                 # NOTE: This would get replaced if we have a method on infrasys
@@ -1389,6 +1457,7 @@ class PlexosParser(PCMParser):
             msg = f"Model `{model_name}` not found on the XML. Check spelling of the `model_name`."
             raise R2XParserError(msg)
         self.model_id = model_id[0][0]  # Unpacking tuple [(model_id,)]
+        self.scenarios: list[str] = []
 
         # NOTE: When doing performance updates this query could get some love.
         valid_scenarios = self.db.query(
@@ -1546,57 +1615,195 @@ class PlexosParser(PCMParser):
         self.id_to_tag_id = dict(zip(object_map["object_id"], object_map["tag_datafile_object_id"]))
         return data
 
-    def _get_model_data(self, data_filter) -> pl.DataFrame:
-        """Filter plexos data for a given class and all scenarios in a model."""
-        assert isinstance(self.year, int)
-        scenario_specific_data = None
-        scenario_filter = None
-        if getattr(self, "scenarios", None):
-            scenario_filter = pl.col("scenario").is_in(self.scenarios)
-            scenario_specific_data = self.plexos_data.filter(data_filter & scenario_filter)
-            scenario_specific_data = filter_property_dates(scenario_specific_data, self.year)
-
-        base_case_filter = pl.col("scenario").is_null()
-        # Default is to parse data normally if there is not scenario. If scenario exist modify the filter.
-        if scenario_specific_data is None:
-            system_data = self.plexos_data.filter(data_filter & base_case_filter)
-            system_data = filter_property_dates(system_data, self.year)
-        else:
-            # include both scenario specific and basecase data
-            combined_key_base = pl.col("name") + "_" + pl.col("property_name")
-            combined_key_scenario = (
-                scenario_specific_data["name"] + "_" + scenario_specific_data["property_name"]
+    def _build_property_index(self) -> None:
+        """Build the scenario-resolved property index of `plexos_data`.
+
+        The scenario and dated overrides are resolved once for the whole `plexos_data` into `model_data`. The
+        resolved rows are partitioned by (child_class_name, parent_class_name) and indexed by `object_id`, so
+        constructors and nested object lookups do not need to filter the full frame on every call.
+        """
+        assert hasattr(self, "plexos_data"), "plexos data not processed yet"
+        self.model_data = self._resolve_model_data(self.plexos_data)
+        partitions = self.model_data.partition_by(
+            ["child_class_name", "parent_class_name"], as_dict=True, maintain_order=True
+        )
+        self._class_data: dict[tuple[str, str], pl.DataFrame] = dict(partitions)
+        self._empty_model_data = self.model_data.clear()
+
+        # Rows are sorted by object_id so each object is a contiguous (offset, length) slice.
+        object_data = self.model_data.sort("object_id", maintain_order=True)
+        object_offsets = (
+            object_data.with_row_index("offset")
+            .group_by("object_id")
+            .agg(pl.col("offset").first(), pl.len().alias("length"))
+        )
+        self._object_data = object_data
+        self._object_offsets: dict[int, tuple[int, int]] = {
+            object_id: (offset, length) for object_id, offset, length in object_offsets.iter_rows()
+        }
+        self._nested_object_records: dict[int, list[dict[str, Any]]] = {}
+        return
+
+    def _build_object_id_index(self, class_enums: Sequence[ClassEnum] = REFERENCED_CLASSES) -> None:
+        """Load the name to object id map of the classes referenced by name from other properties.
+
+        Each class is loaded with a single query, so resolving the variables and timeslices of the properties
+        does not query the database. See `_get_object_id`.
+        """
+        self._object_ids: dict[ClassEnum, dict[str, int]] = getattr(self, "_object_ids", {})
+        for class_enum in class_enums:
+            self._object_ids[class_enum] = dict(self.db.query(OBJECT_ID_QUERY, (str(class_enum),)))
+        return
+
+    def _get_object_id(self, class_enum: ClassEnum, name: str) -> int:
+        """Return the object id of a PLEXOS object from the in-memory index.
+
+        Classes that are not indexed yet are loaded on the first call. Names that are not on the index are
+        resolved with the database, so missing objects raise the same error as `PlexosDB.get_object_id`.
+        """
+        if class_enum not in getattr(self, "_object_ids", {}):
+            self._build_object_id_index([class_enum])
+        if (object_id := self._object_ids[class_enum].get(name)) is None:
+            return self.db.get_object_id(class_enum, name=name)
+        return object_id
+
+    def _build_membership_index(self) -> None:
+        """Index all the memberships of the database.
+
+        Memberships are indexed by (parent class, parent name, collection), by (child class, child name,
+        collection) and by `parent_object_id`, so the topology constructors resolve the endpoints, regions and
+        zones of each object without scanning all the memberships.
+        """
+        self.memberships = pl.from_records(
+            self.db.query(MEMBERSHIP_QUERY), schema=MEMBERSHIP_COLUMNS_SCHEMA, orient="row"
+        )
+        self._memberships_by_parent: dict[tuple[str, str, str], list[dict[str, Any]]] = defaultdict(list)
+        self._memberships_by_child: dict[tuple[str, str, str], list[dict[str, Any]]] = defaultdict(list)
+        self._memberships_by_parent_id: dict[int, list[dict[str, Any]]] = defaultdict(list)
+        for membership in self.memberships.iter_rows(named=True):
+            parent_key = (
+                membership["parent_class_name"],
+                membership["parent"],
+                membership["collection_name"],
             )
+            self._memberships_by_parent[parent_key].append(membership)
+            child_key = (membership["child_class_name"], membership["child"], membership["collection_name"])
+            self._memberships_by_child[child_key].append(membership)
+            self._memberships_by_parent_id[membership["parent_object_id"]].append(membership)
+        return
 
-            base_case_filter = base_case_filter & (
-                ~combined_key_base.is_in(combined_key_scenario) | pl.col("property_name").is_null()
+    def _build_relationship_map(self) -> None:
+        """Extract the device relationships from the memberships in a single pass.
+
+        `self.relationships` has one row per membership in `DEVICE_RELATIONSHIPS` with the device and the
+        related object (fuel, node, reserve or storage) of each one. Rows are also indexed by relationship and
+        device name.
+        """
+        assert hasattr(self, "memberships"), "memberships not indexed yet"
+        relationships = []
+        for relationship, (
+            parent_class,
+            child_class,
+            collection,
+            device_is_parent,
+        ) in DEVICE_RELATIONSHIPS.items():
+            condition = (pl.col("parent_class_name") == str(parent_class)) & (
+                pl.col("child_class_name") == str(child_class)
             )
-            base_case_data = self.plexos_data.filter(data_filter & base_case_filter)
-            base_case_data = filter_property_dates(base_case_data, self.year)
+            if collection is not None:
+                condition &= pl.col("collection_name") == collection.name
+            device, related = ("parent", "child") if device_is_parent else ("child", "parent")
+            relationships.append(
+                self.memberships.filter(condition).select(
+                    pl.lit(relationship).alias("relationship"),
+                    pl.col(f"{device}_object_id").alias("device_object_id"),
+                    pl.col(device).alias("device"),
+                    pl.col(f"{related}_object_id").alias("related_object_id"),
+                    pl.col(related).alias("related"),
+                    pl.col("collection_name"),
+                )
+            )
+        self.relationships = pl.concat(relationships)
+        self._relationship_map: dict[tuple[str, str], list[dict[str, Any]]] = defaultdict(list)
+        for row in self.relationships.iter_rows(named=True):
+            self._relationship_map[(row["relationship"], row["device"])].append(row)
+        return
 
-            system_data = pl.concat([scenario_specific_data, base_case_data])
+    def _get_relationships(self, relationship: str, device_name: str) -> list[dict[str, Any]]:
+        """Return the related objects of a device for a relationship of `DEVICE_RELATIONSHIPS`."""
+        return self._relationship_map.get((relationship, device_name), [])
+
+    def _get_memberships(
+        self, parent_class: ClassEnum, parent_name: str, collection: CollectionEnum
+    ) -> list[dict[str, Any]]:
+        """Return the memberships of a parent object for a given collection."""
+        return self._memberships_by_parent.get((str(parent_class), parent_name, collection.name), [])
+
+    def _get_child_memberships(
+        self, child_class: ClassEnum, child_name: str, collection: CollectionEnum, parent_class: ClassEnum
+    ) -> list[dict[str, Any]]:
+        """Return the memberships of a child object for a given collection and parent class."""
+        return [
+            membership
+            for membership in self._memberships_by_child.get(
+                (str(child_class), child_name, collection.name), []
+            )
+            if membership["parent_class_name"] == str(parent_class)
+        ]
 
-        # If date_from / date_to is specified, override the base_case_value
-        rows_to_keep = system_data.filter(pl.col("date_from").is_not_null() | pl.col("date_to").is_not_null())
-        rtk_key = rows_to_keep["name"] + "_" + rows_to_keep["property_name"]
-        sys_data_key = system_data["name"] + "_" + system_data["property_name"]
-        if not rows_to_keep.is_empty():
-            # remove if name and property_name are the same
-            system_data = system_data.filter(~sys_data_key.is_in(rtk_key))
-            system_data = pl.concat([system_data, rows_to_keep])
+    def _get_object_memberships(
+        self, parent_object_id: int, collection: CollectionEnum | None = None
+    ) -> list[dict[str, Any]]:
+        """Return the memberships of a parent object, optionally filtered by collection."""
+        memberships = self._memberships_by_parent_id.get(parent_object_id, [])
+        if collection is None:
+            return memberships
+        return [membership for membership in memberships if membership["collection_name"] == collection.name]
 
-        return system_data
+    def _get_class_data(self, child_class: ClassEnum, parent_class: ClassEnum) -> pl.DataFrame:
+        """Return the resolved properties of a child/parent class membership."""
+        return self._class_data.get((str(child_class), str(parent_class)), self._empty_model_data)
 
-    def _construct_load_profiles(self):
-        logger.info("Creating load profile time series")
-        system_regions = (pl.col("child_class_name") == ClassEnum.Region.name) & (
-            pl.col("parent_class_name") == ClassEnum.System.name
+    def _get_model_data(self, data_filter) -> pl.DataFrame:
+        """Filter plexos data for a given class and all scenarios in a model."""
+        if hasattr(self, "model_data"):
+            return self.model_data.filter(data_filter)
+        return self._resolve_model_data(self.plexos_data.filter(data_filter))
+
+    def _resolve_model_data(self, model_data: pl.DataFrame) -> pl.DataFrame:
+        """Resolve the scenario and dated overrides of the model for the given data.
+
+        Rows are identified by `RESOLUTION_KEY`. Rows of the selected scenarios override the base case rows
+        with the same key and rows with a date window valid for the solve year override the rows without one.
+        Rows without a property (plain memberships) are always kept.
+        """
+        assert isinstance(self.year, int)
+        scenarios = getattr(self, "scenarios", None) or []
+        model_data = model_data.filter(pl.col("scenario").is_null() | pl.col("scenario").is_in(scenarios))
+        model_data = filter_property_dates(model_data, self.year)
+
+        has_property = pl.col("property_name").is_not_null()
+        is_scenario = pl.col("scenario").is_not_null()
+        scenario_keys = model_data.filter(is_scenario & has_property).select(RESOLUTION_KEY).unique()
+        base_case_data = model_data.filter(~is_scenario).join(
+            scenario_keys, on=RESOLUTION_KEY, how="anti", join_nulls=True
         )
-        regions = self._get_model_data(system_regions)
-        for region, region_data in regions.group_by("name"):
-            property_records = region_data.to_dicts()
-            mapped_records, _ = self._parse_property_data(property_records)
+        model_data = pl.concat([model_data.filter(is_scenario), base_case_data])
 
+        # If date_from / date_to is specified, override the undated value
+        is_dated = pl.col("date_from").is_not_null() | pl.col("date_to").is_not_null()
+        dated_keys = model_data.filter(is_dated & has_property).select(RESOLUTION_KEY).unique()
+        undated_data = model_data.filter(~is_dated).join(
+            dated_keys, on=RESOLUTION_KEY, how="anti", join_nulls=True
+        )
+        return pl.concat([undated_data, model_data.filter(is_dated)])
+
+    @batched
+    def _construct_load_profiles(self):
+        logger.info("Creating load profile time series")
+        regions = self._get_class_data(ClassEnum.Region, ClassEnum.System)
+        region_properties = self._parse_class_property_data(regions)
+        for region, (mapped_records, _) in region_properties.items():
             if max_active_power := mapped_records.get("max_active_power"):
                 max_load = (
                     np.nanmax(max_active_power.data)
@@ -1605,11 +1812,8 @@ class PlexosParser(PCMParser):
                 )
             else:
                 continue
-            bus_region_membership = self.db.get_object_memberships(
-                region[0],
-                class_enum=ClassEnum.Region,
-                parent_class_enum=ClassEnum.Node,
-                collection_enum=CollectionEnum.Region,
+            bus_region_membership = self._get_child_memberships(
+                ClassEnum.Region, region[0], CollectionEnum.Region, parent_class=ClassEnum.Node
             )
             for bus in bus_region_membership:
                 bus = self.system.get_component(ACBus, name=bus["parent"])
@@ -1620,10 +1824,13 @@ class PlexosParser(PCMParser):
                     self.system.add_time_series(max_active_power, load, **ts_dict)
         return
 
-    def _data_file_reader(self, fpath_str: str, csv_file_encoding="utf8"):
-        path = self.run_folder / Path(fpath_str)
+    def _get_data_file_path(self, fpath_str: str) -> Path:
         if "\\" in fpath_str:
-            path = self.run_folder / PureWindowsPath(fpath_str)
+            return self.run_folder / PureWindowsPath(fpath_str)
+        return self.run_folder / Path(fpath_str)
+
+    def _data_file_reader(self, fpath_str: str, csv_file_encoding="utf8"):
+        path = self._get_data_file_path(fpath_str)
 
         if path in self._data_file_cache:
             return path, self._data_file_cache[path], self._data_file_column_types[path]
@@ -1631,6 +1838,127 @@ class PlexosParser(PCMParser):
         if encoding := self.config.feature_flags.get("csv_file_encoding"):
             csv_file_encoding = encoding
 
+        parsed_file, column_type = self._load_data_file(path, csv_file_encoding=csv_file_encoding)
+
+        if path not in self._data_file_cache:
+            self._data_file_cache[path] = parsed_file
+            self._data_file_column_types[path] = column_type
+
+        return path, parsed_file, column_type
+
+    def _load_data_file(
+        self, path: Path, csv_file_encoding="utf8", evict: bool = True
+    ) -> tuple[pl.DataFrame, DATAFILE_COLUMNS]:
+        if getattr(self.config, "data_file_cache", False):
+            return self._read_cached_data_file(path, csv_file_encoding=csv_file_encoding, evict=evict)
+        return self._parse_data_file(path, csv_file_encoding=csv_file_encoding)
+
+    def _collect_data_file_paths(self) -> set[str]:
+        """Return every data file referenced by the resolved properties of the model.
+
+        Data files can be referenced directly on the `text` of a property, or through a nested Data File
+        object (`tag_datafile`) that can also be attached to a Variable.
+        """
+        data_file_texts = self._object_data.filter(
+            (pl.col("child_class_name") != str(ClassEnum.DataFile))
+            & (pl.col("text_class_name") == str(ClassEnum.DataFile))
+        )["text"]
+        fpaths = set(data_file_texts.drop_nulls().to_list())
+
+        for object_id in self._object_data["tag_datafile_object_id"].drop_nulls().unique().to_list():
+            try:
+                nested_object_data = self._get_nested_object_data(object_id)
+            except (NotImplementedError, IndexError):
+                continue
+            if isinstance(nested_object_data, str):
+                fpaths.add(nested_object_data)
+        return fpaths
+
+    def _prefetch_data_files(self) -> None:
+        """Load, parse and reconcile all the data files of the model concurrently.
+
+        The number of threads can be set with the `data-file-workers` feature flag. Setting it to 0 disables
+        the prefetch and data files are read the first time a property uses them. Files that fail to load are
+        skipped here so that the error is raised by the property that uses them.
+        """
+        workers = self.config.feature_flags.get("data-file-workers")
+        max_workers = int(workers) if workers is not None else None
+        if max_workers == 0:
+            return
+
+        csv_file_encoding = self.config.feature_flags.get("csv_file_encoding", "utf8")
+        paths = {
+            self._get_data_file_path(fpath_str) for fpath_str in self._collect_data_file_paths()
+        } - self._data_file_cache.keys()
+        if self.config.feature_flags.get("lazy-data-files"):
+            # Long data files are scanned for each record instead of loaded in memory.
+            paths = {path for path in paths if self._get_data_file_scan(path) is None}
+        if not paths:
+            return
+
+        logger.debug("Prefetching {} data files", len(paths))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # The on-disk cache is evicted once after all the writes, so no thread deletes a file another
+            # thread is reading.
+            futures = {
+                executor.submit(
+                    self._load_data_file, path, csv_file_encoding=csv_file_encoding, evict=False
+                ): path
+                for path in paths
+            }
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    parsed_file, column_type = future.result()
+                except Exception as error:
+                    logger.debug("Could not prefetch data file {}: {}", path, error)
+                    continue
+                self._data_file_cache[path] = parsed_file
+                self._data_file_column_types[path] = column_type
+
+            # Reconcile each data file with the hourly time index on the same pool.
+            matrix_futures: dict[Future[tuple[np.ndarray, dict[str, int]] | None], Path] = {
+                executor.submit(self._get_data_file_matrix, path): path
+                for path in paths
+                if path in self._data_file_cache
+            }
+            for matrix_future in as_completed(matrix_futures):
+                try:
+                    matrix_future.result()
+                except Exception as error:
+                    logger.debug("Could not reconcile data file {}: {}", matrix_futures[matrix_future], error)
+
+        if getattr(self.config, "data_file_cache", False):
+            cache_dir = get_cache_dir(getattr(self.config, "cache_dir", None))
+            data_file_cache_dir = cache_dir / DATA_FILE_CACHE_FOLDER
+            if data_file_cache_dir.exists():
+                evict_cache(data_file_cache_dir, max_size=DATA_FILE_CACHE_MAX_SIZE, pattern="*.arrow")
+        return
+
+    def _read_cached_data_file(
+        self, path: Path, csv_file_encoding="utf8", evict: bool = True
+    ) -> tuple[pl.DataFrame, DATAFILE_COLUMNS]:
+        """Read a parsed data file from the on-disk cache or parse it and store it."""
+        assert isinstance(self.year, int)
+        column_type = get_data_file_column_type(path, csv_file_encoding=csv_file_encoding)
+        if column_type is None:
+            return self._parse_data_file(path, csv_file_encoding=csv_file_encoding)
+
+        cache_fpath = get_data_file_cache_fpath(
+            path,
+            column_type,
+            year=self.year,
+            csv_file_encoding=csv_file_encoding,
+            cache_dir=getattr(self.config, "cache_dir", None),
+        )
+        parsed_file = read_data_file_cache(cache_fpath)
+        if parsed_file is None:
+            parsed_file, column_type = self._parse_data_file(path, csv_file_encoding=csv_file_encoding)
+            write_data_file_cache(cache_fpath, parsed_file, evict=evict)
+        return parsed_file, column_type
+
+    def _parse_data_file(self, path: Path, csv_file_encoding="utf8") -> tuple[pl.DataFrame, DATAFILE_COLUMNS]:
+        """Read and parse a data file filtering it for the model year."""
         data_file = csv_handler(path, csv_file_encoding=csv_file_encoding)
 
         column_type: DATAFILE_COLUMNS | None = get_column_enum(data_file.columns)
@@ -1645,12 +1973,7 @@ class PlexosParser(PCMParser):
 
             if parsed_file.is_empty():
                 logger.warning("No time series data specified for year filter. Year passed {}", self.year)
-
-        if path not in self._data_file_cache:
-            self._data_file_cache[path] = parsed_file
-            self._data_file_column_types[path] = column_type
-
-        return path, parsed_file, column_type
+        return parsed_file, column_type
 
     def _data_file_handler(
         self,
@@ -1662,11 +1985,12 @@ class PlexosParser(PCMParser):
     ):
         """Read time varying data from a data file."""
         assert isinstance(self.year, int)
-        path, parsed_file, column_type = self._data_file_reader(fpath_str)
+        cols = [col.lower() for col in [record_name, property_name, variable_name] if col]
+        column = self._get_data_file_column(fpath_str, cols, property_name)
+        if column is not None:
+            return column
 
-        if "name" in parsed_file.columns:
-            cols = [col.lower() for col in [record_name, property_name, variable_name] if col]
-            parsed_file = parsed_file.filter(pl.col("name").str.to_lowercase().is_in(cols))
+        path, parsed_file, column_type = self._read_data_file_records(fpath_str, cols)
 
         if record_name in parsed_file.columns:
             parsed_file = parsed_file.fiter(pl.col(record_name))
@@ -1707,6 +2031,124 @@ class PlexosParser(PCMParser):
         )
         return parsed_file["value"].cast(pl.Float64).to_numpy()
 
+    def _read_data_file_records(
+        self, fpath_str: str, names: list[str]
+    ) -> tuple[Path, pl.DataFrame, DATAFILE_COLUMNS]:
+        """Return the rows of a data file that belong to any of the record names.
+
+        Long data files scanned lazily only read the rows of the records. See `_get_data_file_scan`.
+        """
+        path = self._get_data_file_path(fpath_str)
+        if (data_file_scan := self._get_data_file_scan(path)) is None:
+            path, parsed_file, column_type = self._data_file_reader(fpath_str)
+            if "name" in parsed_file.columns:
+                parsed_file = parsed_file.filter(pl.col("name").str.to_lowercase().is_in(names))
+            return path, parsed_file, column_type
+
+        lazy_file, column_type = data_file_scan
+        records = lazy_file.filter(pl.col("name_key").is_in(names)).drop("name_key").collect()
+        return path, parse_data_file(column_type, records), column_type
+
+    def _get_data_file_scan(self, path: Path) -> tuple[pl.LazyFrame, DATAFILE_COLUMNS] | None:
+        """Return the lazy scan of a long data file filtered by the model year.
+
+        Only used with the `lazy-data-files` feature flag for the layouts on `LONG_DATAFILE_SCHEMAS`. If the
+        data file cache is enabled the scan reads from a Parquet sidecar of the file instead of the CSV.
+        """
+        if path not in self._data_file_scans:
+            self._data_file_scans[path] = self._scan_data_file(path)
+        return self._data_file_scans[path]
+
+    def _scan_data_file(self, path: Path) -> tuple[pl.LazyFrame, DATAFILE_COLUMNS] | None:
+        csv_file_encoding = self.config.feature_flags.get("csv_file_encoding", "utf8")
+        if (
+            not self.config.feature_flags.get("lazy-data-files")
+            or csv_file_encoding not in ("utf8", "utf8-lossy")
+            or not path.exists()
+        ):
+            return None
+
+        columns = get_data_file_header(path, csv_file_encoding=csv_file_encoding)
+        column_type = get_column_enum([column.lower() for column in columns])
+        if column_type not in LONG_DATAFILE_SCHEMAS:
+            return None
+
+        if getattr(self.config, "data_file_cache", False):
+            lazy_file = scan_data_file_sidecar(
+                path,
+                column_type,
+                columns,
+                csv_file_encoding=csv_file_encoding,
+                cache_dir=getattr(self.config, "cache_dir", None),
+            )
+        else:
+            lazy_file = scan_data_file(path, column_type, columns, csv_file_encoding=csv_file_encoding)
+
+        if "year" in LONG_DATAFILE_SCHEMAS[column_type]:
+            # The scan stops at the first row of the year, so only files without the year are read in full.
+            year_file = lazy_file.filter(pl.col("year") == self.year)
+            if year_file.head(1).collect().is_empty():
+                logger.debug("{} not in available years of {}. Using unfiltered file.", self.year, path)
+            else:
+                lazy_file = year_file
+        return lazy_file, column_type
+
+    def _get_data_file_column(
+        self, fpath_str: str, names: list[str], property_name: str
+    ) -> np.ndarray | None:
+        """Return the reconciled column of the record from the data file matrix.
+
+        Returns None if the file has no matrix, if the names match zero or several records, if the property
+        is simplified to a single value or if the file is scanned lazily.
+        """
+        simplified = property_name == "Max Capacity" or (
+            self.config.feature_flags.get("simplify-heat-rate") and property_name == "Heat Rate"
+        )
+        if simplified or self._get_data_file_scan(self._get_data_file_path(fpath_str)) is not None:
+            return None
+
+        path, *_ = self._data_file_reader(fpath_str)
+        if (data_file_matrix := self._get_data_file_matrix(path)) is None:
+            return None
+        matrix, column_index = data_file_matrix
+        columns = {column_index[name] for name in names if name in column_index}
+        if len(columns) != 1:
+            return None
+        return matrix[:, columns.pop()]
+
+    def _get_data_file_matrix(self, path: Path) -> tuple[np.ndarray, dict[str, int]] | None:
+        """Return the reconciled matrix of a data file with one column per record.
+
+        The whole file is reconciled once against the hourly time index and cached, so every record that
+        reads from the file only slices its column. Files whose records do not share the same time stamps
+        return None and are reconciled record by record.
+        """
+        if path in self._data_file_matrices:
+            return self._data_file_matrices[path]
+
+        parsed_file = self._data_file_cache[path]
+        if "name" not in parsed_file.columns:
+            self._data_file_matrices[path] = None
+            return None
+        if "year" not in parsed_file.columns:
+            parsed_file = parsed_file.with_columns(year=self.year)
+
+        # Files with duplicated rows are deduplicated record by record on `_data_file_handler`.
+        columns_to_check = [
+            column
+            for column in self._create_columns_to_check(self._data_file_column_types[path])
+            if column in parsed_file.columns
+        ]
+        if parsed_file.select(columns_to_check).is_duplicated().any():
+            self._data_file_matrices[path] = None
+            return None
+
+        index_columns = [column for column in parsed_file.columns if column not in ("name", "value")]
+        self._data_file_matrices[path] = reconcile_timeseries_matrix(
+            parsed_file, hourly_time_index=self.hourly_time_index, index_columns=index_columns
+        )
+        return self._data_file_matrices[path]
+
     def _create_columns_to_check(self, column_type: DATAFILE_COLUMNS):
         # NOTE: Some files might have duplicated data. If so, we warn the user and drop the duplicates.
         columns_to_check = [
@@ -1763,21 +2205,59 @@ class PlexosParser(PCMParser):
         return None
 
     def _parse_value(self, value: Any, variable_name: str | None = None, unit: str | None = None):
-        """Return appropiate value with units if passed."""
+        """Return appropiate value with units if passed.
+
+        Time series are shared: identical profiles with the same variable name and unit return the same
+        `SingleTimeSeries`, so the array is stored only once on the system no matter how many components use
+        it.
+        """
         if not isinstance(value, np.ndarray | Sequence):
             return value * ureg.Unit(unit) if unit else value
 
         assert isinstance(self.year, int)
         assert variable_name
+        value = np.asarray(value)
+        time_series_key = (variable_name, str(unit) if unit else None, get_array_digest(value))
+        if time_series := self._time_series_store.get(time_series_key):
+            return time_series
+
         initial_time = datetime(self.year, 1, 1)
         resolution = timedelta(hours=1)
 
-        return SingleTimeSeries(
+        time_series = SingleTimeSeries(
             data=ureg.Quantity(value, unit) if unit else value,  # type: ignore
             variable_name=variable_name,
             initial_time=initial_time,
             resolution=resolution,
         )
+        self._time_series_store[time_series_key] = time_series
+        return time_series
+
+    def _get_time_series_copy(
+        self, time_series: SingleTimeSeries, variable_name: str, unitless: bool = False
+    ) -> SingleTimeSeries:
+        """Return the shared time series with the `variable_name` attached to the component.
+
+        Time series returned by `_parse_value` are shared and never modified. If the variable name differs or
+        the units must be dropped, a copy is created once per time series, name and units, so components that
+        attach the same profile under the same name also share the copy.
+        """
+        if time_series.variable_name == variable_name and not unitless:
+            return time_series
+        copy_key = (time_series.uuid, variable_name, unitless)
+        if time_series_copy := self._time_series_copies.get(copy_key):
+            return time_series_copy
+        data = time_series.data
+        if unitless and isinstance(data, Quantity):
+            data = data.magnitude
+        time_series_copy = SingleTimeSeries(
+            data=data,
+            variable_name=variable_name,
+            initial_time=time_series.initial_time,
+            resolution=time_series.resolution,
+        )
+        self._time_series_copies[copy_key] = time_series_copy
+        return time_series_copy
 
     def _apply_action(self, action, val_a, val_b):
         val_a_data = val_a.data if isinstance(val_a, SingleTimeSeries) else val_a
@@ -1792,73 +2272,119 @@ class PlexosParser(PCMParser):
             return val_b
         return results
 
-    def _parse_property_data(self, record_data: list[dict[str, Any]]):
-        mapped_properties = {}
-        property_counts: dict[str, Any] = {}
-        multi_band_properties = set()
-        timeslice_properties = set()
-        unit = None
-        mapped_property_name = None
-        property_unit_map = {}
-
-        for record in record_data:
-            band = record["band"]
-            prop_name = record["property_name"]
-            prop_value = record["property_value"]
-            timeslice = record["tag_timeslice"]
-            unit = record["property_unit"].replace("$", "usd") if record["property_unit"] else None
-            mapped_property_name = self.property_map.get(prop_name, prop_name)
-            unit = get_pint_unit(unit)
-            property_unit_map[mapped_property_name] = unit
-            value = self._handle_record(record, prop_name, prop_value, unit)
-
-            if mapped_property_name not in property_counts:
-                mapped_properties[mapped_property_name] = value
-                property_counts[mapped_property_name] = {band}
-                property_counts[mapped_property_name] = {
-                    "count": 1,
-                    "bands": {band},
-                    "timeslices": {timeslice},
-                    "values": {band: {timeslice: value}},  # Store values by band and timeslice
-                }
-            else:
-                property_counts[mapped_property_name]["count"] += 1
-                property_counts[mapped_property_name]["bands"].add(band)
-                property_counts[mapped_property_name]["timeslices"].add(timeslice)
-
-                # Capture the value for multi-band/multi-timeslice
-                if band not in property_counts[mapped_property_name]["values"]:
-                    property_counts[mapped_property_name]["values"][band] = {}
-                property_counts[mapped_property_name]["values"][band][timeslice] = value
-
-                # Handle multi-band and multi-timeslice cases
-                if len(property_counts[mapped_property_name]["bands"]) > 1:
-                    multi_band_properties.add(mapped_property_name)
-                if len(property_counts[mapped_property_name]["timeslices"]) > 1:
-                    timeslice_properties.add(mapped_property_name)
-
-                mapped_properties[mapped_property_name] = value
-        if timeslice_properties:
-            for property in timeslice_properties:
-                property_with_timeslice = property_counts[property]
-                pattern_values = []
-                for timeslice in property_with_timeslice["timeslices"]:
-                    timeslice_object_id = self.db.get_object_id(ClassEnum.Timeslice, name=timeslice)
-                    timeslice_data = self._filter_by_object_id(timeslice_object_id)
-                    pattern_values.append(
-                        {
-                            "pattern": timeslice_data["text"][0],
-                            "value": property_with_timeslice["values"][1][
-                                timeslice
-                            ],  # 1 since we only assume single band timeslices
-                        }
-                    )
-                mapped_properties[property] = self._parse_value(
-                    time_slice_handler(pattern_values, self.hourly_time_index),
-                    property,
-                    unit=property_unit_map[property],
+    def _parse_property_data(self, property_data: pl.DataFrame) -> tuple[dict[str, Any], set[str]]:
+        """Map the properties of a single object.
+
+        All the rows of `property_data` are treated as properties of the same object.
+
+        See Also
+        --------
+        _parse_class_property_data
+        """
+        parsed_properties = self._parse_class_property_data(
+            property_data.with_columns(pl.lit(0).alias("property_group")), group_by=["property_group"]
+        )
+        return parsed_properties.get((0,), ({}, set()))
+
+    def _parse_class_property_data(
+        self, property_data: pl.DataFrame, group_by: list[str] | None = None
+    ) -> dict[tuple, tuple[dict[str, Any], set[str]]]:
+        """Map the properties of all the objects of a class at once.
+
+        Mapped property names, units and the number of bands and timeslices of each property are resolved
+        with polars expressions for all the objects. Only the records that reference a data file, a variable
+        or a timeslice are handled one by one with `_handle_record`. If a property has multiple records, the
+        last one is used unless it has multiple timeslices.
+
+        Parameters
+        ----------
+        property_data : pl.DataFrame
+            Resolved properties of the class.
+        group_by : list[str], optional
+            Columns that identify each object. Default is `["name"]`.
+
+        Returns
+        -------
+        dict[tuple, tuple[dict[str, Any], set[str]]]
+            Mapped properties and set of multi-band properties keyed by the `group_by` values of each object.
+        """
+        group_by = group_by or ["name"]
+        if property_data.is_empty():
+            return {}
+
+        record_columns = ("text", "tag_timeslice", "tag_datafile", "tag_variable")
+        is_record = pl.any_horizontal(pl.col(column).is_not_null() for column in record_columns)
+        property_data = property_data.with_row_index("record_index").with_columns(
+            mapped_property_name=pl.col("property_name").replace(self.property_map),
+            unit_name=pl.col("property_unit").str.replace("$", "usd", literal=True),
+            is_record=is_record,
+        )
+        units = {unit_name: get_pint_unit(unit_name) for unit_name in property_data["unit_name"].unique()}
+
+        # Records that need special handling (data files, variables and timeslices)
+        record_values: dict[int, Any] = {}
+        timeslice_values: dict[tuple, dict[str, Any]] = defaultdict(dict)
+        for record in property_data.filter(pl.col("is_record")).iter_rows(named=True):
+            value = self._handle_record(
+                record, record["property_name"], record["property_value"], units[record["unit_name"]]
+            )
+            record_values[record["record_index"]] = value
+            if record["tag_timeslice"] is not None and record["band"] == 1:
+                timeslice_key = (tuple(record[column] for column in group_by), record["mapped_property_name"])
+                timeslice_values[timeslice_key][record["tag_timeslice"]] = value
+
+        properties = property_data.group_by([*group_by, "mapped_property_name"], maintain_order=True).agg(
+            pl.col("record_index").last(),
+            pl.col("property_value").last(),
+            pl.col("unit_name").last(),
+            pl.col("is_record").last(),
+            band_count=pl.col("band").n_unique(),
+            timeslice_count=pl.col("tag_timeslice").n_unique(),
+        )
+
+        parsed_properties: dict[tuple, tuple[dict[str, Any], set[str]]] = {}
+        for object_key, *property_row in zip(
+            properties.select(group_by).rows(),
+            *properties.select(
+                "mapped_property_name",
+                "record_index",
+                "property_value",
+                "unit_name",
+                "is_record",
+                "band_count",
+                "timeslice_count",
+            ).get_columns(),
+        ):
+            mapped_property_name, record_index, value, unit_name, record, band_count, timeslice_count = (
+                property_row
+            )
+            mapped_properties, multi_band_properties = parsed_properties.setdefault(object_key, ({}, set()))
+            unit = units[unit_name]
+            if timeslice_count > 1:
+                value = self._parse_timeslice_property(
+                    timeslice_values[(object_key, mapped_property_name)], mapped_property_name, unit=unit
                 )
-        return mapped_properties, multi_band_properties
+            elif record:
+                value = record_values[record_index]
+            else:
+                value = self._parse_value(value, unit=unit)
+            if band_count > 1:
+                multi_band_properties.add(mapped_property_name)
+            mapped_properties[mapped_property_name] = value
+        return parsed_properties
+
+    def _parse_timeslice_property(self, timeslice_values: dict[str, Any], property_name: str, unit=None):
+        """Create the time series of a property defined with multiple timeslices."""
+        pattern_values = []
+        for timeslice, value in timeslice_values.items():
+            timeslice_object_id = self._get_object_id(ClassEnum.Timeslice, timeslice)
+            timeslice_data = self._filter_by_object_id(timeslice_object_id)
+            pattern_values.append({"pattern": timeslice_data["text"][0], "value": value})
+        return self._parse_value(
+            time_slice_handler(pattern_values, self.time_slice_calendar),
+            property_name,
+            unit=unit,
+        )
 
     def _handle_record(self, record: dict[str, Any], prop_name, prop_value, unit):  # noqa: C901
         """Handle record data.
@@ -1895,7 +2421,7 @@ class PlexosParser(PCMParser):
                     value=data_file_value, variable_name=mapped_property_name, unit=unit
                 )
             case {"text": str(), "text_class_name": ClassEnum.Variable}:
-                nested_object_id = self.db.get_object_id(ClassEnum.Variable, name=record["text"])
+                nested_object_id = self._get_object_id(ClassEnum.Variable, record["text"])
                 nested_object_data = self._get_nested_object_data(nested_object_id)
                 if isinstance(nested_object_data, str):
                     value = (
@@ -1915,7 +2441,7 @@ class PlexosParser(PCMParser):
 
             # This case covers when the variable is used to scale a property that is nested on a data file
             case {"tag_datafile": str(), "tag_variable": str()}:
-                nested_object_id = self.db.get_object_id(ClassEnum.Variable, name=record["tag_variable"])
+                nested_object_id = self._get_object_id(ClassEnum.Variable, record["tag_variable"])
                 nested_object_data = self._get_nested_object_data(nested_object_id)
                 if isinstance(nested_object_data, str):
                     nested_object_data = self._data_file_handler(
@@ -1941,7 +2467,7 @@ class PlexosParser(PCMParser):
                     data_file_value = prop_value
                 value = self._parse_value(data_file_value, variable_name=mapped_property_name, unit=unit)
             case {"tag_variable": str()}:
-                nested_object_id = self.db.get_object_id(ClassEnum.Variable, name=record["tag_variable"])
+                nested_object_id = self._get_object_id(ClassEnum.Variable, record["tag_variable"])
                 nested_object_data = self._get_nested_object_data(nested_object_id)
                 if isinstance(nested_object_data, str):
                     value = self._data_file_handler(
@@ -1999,15 +2525,19 @@ class PlexosParser(PCMParser):
         pl.DataFrame
             A filtered DataFrame containing only rows where the object_id matches.
         """
-        assert hasattr(self, "plexos_data"), "plexos data not processed yet"
-        return self._get_model_data(pl.col("object_id") == object_id)
+        assert hasattr(self, "_object_offsets"), "plexos data not processed yet"
+        if object_id not in self._object_offsets:
+            return self._empty_model_data
+        offset, length = self._object_offsets[object_id]
+        return self._object_data.slice(offset, length)
 
     def _get_nested_object_data(self, object_id: int) -> str | float | np.ndarray:
         assert object_id
         logger.trace("Unnesting nested object", object_id)
         nested_object_id = self._resolve_object_id(object_id)
-        nested_object_data = self._filter_by_object_id(nested_object_id)
-        nested_object_records = nested_object_data.to_dicts()
+        if (nested_object_records := self._nested_object_records.get(nested_object_id)) is None:
+            nested_object_records = self._filter_by_object_id(nested_object_id).to_dicts()
+            self._nested_object_records[nested_object_id] = nested_object_records
         if len(nested_object_records) > 1:
             logger.warning("Multiple nested objects")
             key_str = "text_class_name"
@@ -2028,7 +2558,7 @@ class PlexosParser(PCMParser):
 
                 return time_slice_handler(
                     records=timeslice_patterns,
-                    hourly_time_index=self.hourly_time_index,
+                    hourly_time_index=self.time_slice_calendar,
                 )
 
         nested_object_record = nested_object_records[0]  # Get the only element of the list
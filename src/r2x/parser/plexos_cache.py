@@ -0,0 +1,293 @@
+"""On-disk cache for the PLEXOS parser.
+
+Parsing a PLEXOS XML into the SQLite representation used by `PlexosDB` is the most expensive step of opening
+a model. Since the same XML is usually translated several times (different models, scenarios or years), we
+keep the populated SQLite database on disk keyed by the content of the XML and the `plexosdb` version that
+created it.
+
+Optionally, the parsed data files of a model are also stored as Arrow IPC files keyed by the location, size
+and modification time of the CSV, so repeated runs over the same run folder memory-map them instead of
+parsing the CSV again. Long data files that are scanned lazily are instead converted once to a Parquet
+sidecar sorted by record name, so the scan of a record only reads the row groups that contain it.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from importlib.metadata import version
+from pathlib import Path
+
+import polars as pl
+from loguru import logger
+from plexosdb import PlexosDB
+
+from r2x.utils import get_cache_dir
+
+from .plexos_utils import DATAFILE_COLUMNS, get_column_enum, scan_data_file
+from .polars_helpers import pl_lowercase
+
+XML_CACHE_FOLDER = "plexos_db"
+XML_CACHE_MAX_SIZE = 10 * 1024**3  # 10 GB
+DATA_FILE_CACHE_FOLDER = "data_files"
+DATA_FILE_CACHE_MAX_SIZE = 10 * 1024**3  # 10 GB
+DATA_FILE_SIDECAR_ROW_GROUP_SIZE = 100_000
+HASH_CHUNK_SIZE = 1024**2  # 1 MB
+TMP_FILE_MAX_AGE = 24 * 3600  # 1 day
+
+
+def get_xml_cache_key(xml_file: Path | str) -> str:
+    """Return the content-addressed key of a PLEXOS XML file.
+
+    The key combines the SHA-256 of the file content with the `plexosdb` version, so a new version of
+    `plexosdb` never reads a database created by a different schema.
+    """
+    file_hash = hashlib.sha256()
+    with open(xml_file, "rb") as f:
+        while chunk := f.read(HASH_CHUNK_SIZE):
+            file_hash.update(chunk)
+    return f"{file_hash.hexdigest()}-plexosdb{version('plexosdb')}"
+
+
+def clear_xml_cache(cache_dir: Path | str | None = None) -> int:
+    """Delete all the cached PLEXOS databases.
+
+    Returns
+    -------
+    int
+        Number of databases deleted.
+    """
+    xml_cache_dir = get_cache_dir(cache_dir) / XML_CACHE_FOLDER
+    if not xml_cache_dir.exists():
+        return 0
+    cached_files = list(xml_cache_dir.glob("*.db"))
+    for fpath in cached_files:
+        fpath.unlink(missing_ok=True)
+    remove_orphaned_tmp_files(xml_cache_dir)
+    logger.info("Removed {} cached PLEXOS databases from {}", len(cached_files), xml_cache_dir)
+    return len(cached_files)
+
+
+def remove_orphaned_tmp_files(cache_folder: Path, max_age: float = TMP_FILE_MAX_AGE) -> int:
+    """Delete the temporary files left on the cache folder by interrupted writes.
+
+    Only files older than `max_age` seconds are deleted, so the writes in progress of concurrent runs are
+    left untouched.
+
+    Returns
+    -------
+    int
+        Number of temporary files deleted.
+    """
+    cutoff = time.time() - max_age
+    removed = 0
+    for fpath in cache_folder.glob("*.tmp"):
+        try:
+            if fpath.stat().st_mtime > cutoff:
+                continue
+            fpath.unlink()
+        except FileNotFoundError:
+            continue
+        logger.debug("Removed orphaned temporary file {}", fpath)
+        removed += 1
+    return removed
+
+
+def evict_cache(cache_folder: Path, max_size: int = XML_CACHE_MAX_SIZE, pattern: str = "*.db") -> None:
+    """Remove the least recently used files until the cache folder fits in `max_size` bytes.
+
+    Temporary files older than `TMP_FILE_MAX_AGE` are also removed. See `remove_orphaned_tmp_files`.
+    """
+    remove_orphaned_tmp_files(cache_folder)
+    cached_files = []
+    for fpath in cache_folder.glob(pattern):
+        # Files can be evicted by a concurrent run between the glob and the stat.
+        try:
+            cached_files.append((fpath, fpath.stat()))
+        except FileNotFoundError:
+            continue
+    cached_files.sort(key=lambda cached_file: cached_file[1].st_mtime)
+    cache_size = sum(fpath_stat.st_size for _, fpath_stat in cached_files)
+    while cached_files and cache_size > max_size:
+        fpath, fpath_stat = cached_files.pop(0)
+        cache_size -= fpath_stat.st_size
+        logger.debug("Evicting cached file {}", fpath)
+        fpath.unlink(missing_ok=True)
+    return
+
+
+def load_plexos_db(
+    xml_file: Path | str,
+    cache_dir: Path | str | None = None,
+    use_cache: bool = True,
+    clear_cache: bool = False,
+    max_size: int = XML_CACHE_MAX_SIZE,
+) -> PlexosDB:
+    """Return a `PlexosDB` for the XML file using the on-disk cache.
+
+    On a cache hit the cached SQLite database is opened read-only. On a miss, the XML is parsed with
+    `PlexosDB.from_xml` and the populated database is stored on the cache.
+
+    Parameters
+    ----------
+    xml_file : Path | str
+        Location of the PLEXOS XML file.
+    cache_dir : Path | str, optional
+        Cache directory. See `get_cache_dir`.
+    use_cache : bool
+        If False, bypass the cache and parse the XML file.
+    clear_cache : bool
+        If True, delete the cached databases before loading the XML.
+    max_size : int
+        Maximum size in bytes of the cache. Least recently used databases are evicted first.
+
+    Returns
+    -------
+    PlexosDB
+        Database populated with the XML data.
+    """
+    if clear_cache:
+        clear_xml_cache(cache_dir)
+
+    if not use_cache:
+        return PlexosDB.from_xml(xml_file)
+
+    xml_cache_dir = get_cache_dir(cache_dir) / XML_CACHE_FOLDER
+    xml_cache_dir.mkdir(parents=True, exist_ok=True)
+    db_fpath = xml_cache_dir / f"{get_xml_cache_key(xml_file)}.db"
+
+    if db_fpath.exists():
+        logger.debug("Using cached PLEXOS database {} for {}", db_fpath, xml_file)
+        db_fpath.touch()  # Mark as recently used for the LRU eviction.
+        conn = sqlite3.connect(f"file:{db_fpath.as_posix()}?mode=ro", uri=True)
+        return PlexosDB(fpath_or_conn=conn, in_memory=False)
+
+    db = PlexosDB.from_xml(xml_file)
+
+    # Write to a temporary file first so concurrent runs never read a partially written database.
+    tmp_fpath = db_fpath.with_suffix(f".{os.getpid()}.tmp")
+    if db._db.backup(tmp_fpath):
+        tmp_fpath.replace(db_fpath)
+        logger.debug("Cached PLEXOS database for {} at {}", xml_file, db_fpath)
+        evict_cache(xml_cache_dir, max_size=max_size)
+    else:
+        tmp_fpath.unlink(missing_ok=True)
+    return db
+
+
+def get_data_file_header(fpath: Path, csv_file_encoding: str = "utf8") -> list[str]:
+    """Return the columns of a data file reading only its header."""
+    return pl.read_csv(fpath.as_posix(), n_rows=0, encoding=csv_file_encoding).columns
+
+
+def get_data_file_column_type(fpath: Path, csv_file_encoding: str = "utf8") -> DATAFILE_COLUMNS | None:
+    """Return the column type of a data file reading only its header."""
+    header = pl_lowercase(pl.read_csv(fpath.as_posix(), n_rows=0, encoding=csv_file_encoding))
+    return get_column_enum(header.columns)
+
+
+def get_data_file_cache_fpath(
+    fpath: Path,
+    column_type: DATAFILE_COLUMNS,
+    year: int,
+    csv_file_encoding: str = "utf8",
+    cache_dir: Path | str | None = None,
+) -> Path:
+    """Return the location of the cached data file.
+
+    The key is the absolute path, size and modification time of the data file, its column type, the
+    encoding used to read it and the year used to filter it. Any modification of the data file changes the
+    key.
+    """
+    fpath_stat = fpath.stat()
+    key = "|".join(
+        [
+            str(fpath.resolve()),
+            str(fpath_stat.st_size),
+            str(fpath_stat.st_mtime_ns),
+            column_type.name,
+            csv_file_encoding,
+            str(year),
+        ]
+    )
+    key_hash = hashlib.sha256(key.encode()).hexdigest()
+    return get_cache_dir(cache_dir) / DATA_FILE_CACHE_FOLDER / f"{key_hash}.arrow"
+
+
+def read_data_file_cache(cache_fpath: Path) -> pl.DataFrame | None:
+    """Memory-map a cached data file if it exists."""
+    if not cache_fpath.exists():
+        return None
+    logger.trace("Using cached data file {}", cache_fpath)
+    cache_fpath.touch()  # Mark as recently used for the LRU eviction.
+    return pl.read_ipc(cache_fpath, memory_map=True)
+
+
+def write_data_file_cache(
+    cache_fpath: Path,
+    parsed_file: pl.DataFrame,
+    max_size: int = DATA_FILE_CACHE_MAX_SIZE,
+    evict: bool = True,
+) -> None:
+    """Store a parsed data file on the cache as Arrow IPC.
+
+    Set `evict` to False when several files are written concurrently and call `evict_cache` once after all
+    the writes finish.
+    """
+    cache_fpath.parent.mkdir(parents=True, exist_ok=True)
+    tmp_fpath = cache_fpath.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    parsed_file.write_ipc(tmp_fpath)
+    tmp_fpath.replace(cache_fpath)
+    if evict:
+        evict_cache(cache_fpath.parent, max_size=max_size, pattern="*.arrow")
+    return
+
+
+def get_data_file_sidecar_fpath(
+    fpath: Path, csv_file_encoding: str = "utf8", cache_dir: Path | str | None = None
+) -> Path:
+    """Return the location of the Parquet sidecar of a long data file.
+
+    The key is the absolute path, size and modification time of the data file and the encoding used to read
+    it. Unlike the parsed data files, the sidecar keeps every year so it is shared by all the models that use
+    the file.
+    """
+    fpath_stat = fpath.stat()
+    key = "|".join(
+        [str(fpath.resolve()), str(fpath_stat.st_size), str(fpath_stat.st_mtime_ns), csv_file_encoding]
+    )
+    key_hash = hashlib.sha256(key.encode()).hexdigest()
+    return get_cache_dir(cache_dir) / DATA_FILE_CACHE_FOLDER / f"{key_hash}.parquet"
+
+
+def scan_data_file_sidecar(
+    fpath: Path,
+    column_type: DATAFILE_COLUMNS,
+    columns: list[str],
+    csv_file_encoding: str = "utf8",
+    cache_dir: Path | str | None = None,
+    max_size: int = DATA_FILE_CACHE_MAX_SIZE,
+) -> pl.LazyFrame:
+    """Lazily scan the Parquet sidecar of a long data file, creating it on the first call.
+
+    The sidecar is sorted by `name_key` and written in small row groups, so the row group statistics let the
+    scan skip every record that is not requested.
+    """
+    sidecar_fpath = get_data_file_sidecar_fpath(
+        fpath, csv_file_encoding=csv_file_encoding, cache_dir=cache_dir
+    )
+    if sidecar_fpath.exists():
+        logger.trace("Using data file sidecar {}", sidecar_fpath)
+        sidecar_fpath.touch()  # Mark as recently used for the LRU eviction.
+        return pl.scan_parquet(sidecar_fpath)
+
+    sidecar_fpath.parent.mkdir(parents=True, exist_ok=True)
+    tmp_fpath = sidecar_fpath.with_suffix(f".{os.getpid()}.tmp")
+    scan_data_file(fpath, column_type, columns, csv_file_encoding=csv_file_encoding).sort(
+        "name_key"
+    ).sink_parquet(tmp_fpath, row_group_size=DATA_FILE_SIDECAR_ROW_GROUP_SIZE)
+    tmp_fpath.replace(sidecar_fpath)
+    logger.debug("Created data file sidecar {} for {}", sidecar_fpath, fpath)
+    evict_cache(sidecar_fpath.parent, max_size=max_size, pattern="*.parquet")
+    return pl.scan_parquet(sidecar_fpath)
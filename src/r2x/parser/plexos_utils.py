@@ -2,6 +2,8 @@
 # ruff: noqa
 
 from datetime import datetime
+from functools import lru_cache
+import hashlib
 import re
 from enum import Enum
 from typing import Any
@@ -151,6 +153,61 @@ class DATAFILE_COLUMNS(Enum):  # noqa: N801
     )
 
 
+# Declared schema of the data file layouts that have one row per record and time stamp. These files are
+# scanned lazily so only the rows of the requested records are read.
+LONG_DATAFILE_SCHEMAS: dict[DATAFILE_COLUMNS, dict[str, type[pl.DataType]]] = {
+    DATAFILE_COLUMNS.NV: {"name": pl.String, "value": pl.Float64},
+    DATAFILE_COLUMNS.TS_NPV: {"name": pl.String, "pattern": pl.String, "value": pl.Float64},
+    DATAFILE_COLUMNS.TS_NYV: {"name": pl.String, "year": pl.Int64, "value": pl.Float64},
+    DATAFILE_COLUMNS.TS_NYMDV: {
+        "name": pl.String,
+        "year": pl.Int64,
+        "month": pl.Int64,
+        "day": pl.Int64,
+        "value": pl.Float64,
+    },
+    DATAFILE_COLUMNS.TS_NYMDPV: {
+        "name": pl.String,
+        "year": pl.Int64,
+        "month": pl.Int64,
+        "day": pl.Int64,
+        "period": pl.Int64,
+        "value": pl.Float64,
+    },
+}
+
+
+def scan_data_file(
+    fpath: Path, column_type: DATAFILE_COLUMNS, columns: Sequence[str], csv_file_encoding: str = "utf8"
+) -> pl.LazyFrame:
+    """Lazily scan a long data file with the declared schema of its layout.
+
+    Column names are lowercased and a `name_key` column with the lowercase record name is added, so filters
+    on the record name and year are pushed down to the scan.
+
+    Parameters
+    ----------
+    fpath : Path
+        Location of the data file.
+    column_type : DATAFILE_COLUMNS
+        Layout of the data file. Must be one of `LONG_DATAFILE_SCHEMAS`.
+    columns : Sequence[str]
+        Header of the data file.
+    csv_file_encoding : str
+        Encoding of the file. Lazy scans only support `utf8` and `utf8-lossy`.
+
+    Returns
+    -------
+    pl.LazyFrame
+        Lazy data file.
+    """
+    layout_schema = LONG_DATAFILE_SCHEMAS[column_type]
+    schema = {column.lower(): layout_schema.get(column.lower(), pl.String) for column in columns}
+    return pl.scan_csv(fpath, schema=schema, encoding=csv_file_encoding).with_columns(
+        name_key=pl.col("name").str.to_lowercase()
+    )
+
+
 def get_column_enum(columns: list[str]) -> DATAFILE_COLUMNS | None:
     """Identify the corresponding PropertyColumns enum based on the given columns.
 
@@ -219,7 +276,7 @@ def parse_data_file(column_type: DATAFILE_COLUMNS, data_file: pl.DataFrame) -> p
             data_file = parse_ts_DateTime(data_file)
         case column_type.TS_datetime:
             data_file = parse_ts_datetime(data_file)
-        case column_type.PV:
+        case column_type.PV | column_type.TS_NPV:
             data_file = parse_pv(data_file)
         case column_type.NV:
             data_file = parse_nv(data_file)
@@ -446,9 +503,82 @@ def parse_patterns(key: str) -> list[tuple[str, list[int]]]:
     return pattern_list
 
 
+TIME_SLICE_CACHE_SIZE = 1024
+
+
+class TimeSliceCalendar:
+    """Calendar arrays of an hourly time index used to evaluate time slice patterns.
+
+    The month, day of the month, weekday and hour of each timestamp are computed once. Each pattern string
+    is compiled into a boolean mask over the time index and cached, so evaluating the same pattern again
+    does not parse it or touch the calendar arrays.
+
+    PLEXOS numbers the hours of the day from H1 (00:00-01:00) to H24 and the weekdays from W1 (Sunday) to
+    W7 (Saturday).
+
+    Parameters
+    ----------
+    hourly_time_index : pl.DataFrame | NDArray[np.datetime64] | Sequence[datetime]
+        Hourly time index. If it is a DataFrame, the `datetime` column is used.
+
+    Examples
+    --------
+    >>> calendar = TimeSliceCalendar(hourly_time_index)
+    >>> winter_nights = calendar.get_mask("M1-2,M12;H1-6")
+    """
+
+    def __init__(self, hourly_time_index: pl.DataFrame | NDArray[np.datetime64] | Sequence[datetime]) -> None:
+        datetimes = _to_datetime64(hourly_time_index)
+        days = datetimes.astype("datetime64[D]")
+        months = datetimes.astype("datetime64[M]")
+        self.size = len(datetimes)
+        self.month = (months - datetimes.astype("datetime64[Y]")).astype(np.int64) + 1
+        self.day = (days - months).astype(np.int64) + 1
+        self.hour = (datetimes.astype("datetime64[h]") - days).astype(np.int64) + 1
+        # 1970-01-01 was a Thursday (W5)
+        self.weekday = (days.astype(np.int64) + 4) % 7 + 1
+        self.get_mask = lru_cache(maxsize=TIME_SLICE_CACHE_SIZE)(self._compile_mask)
+
+    def _compile_mask(self, pattern: str) -> NDArray[np.bool_]:
+        """Compile a pattern string into a boolean mask.
+
+        Patterns separated by `;` are combined with OR. Inside each of them, ranges of the same period type
+        are combined with OR and different period types with AND, e.g. `W2-6,H8-23` selects the hours 8 to 23
+        of the weekdays.
+        """
+        calendar_arrays = {"M": self.month, "D": self.day, "W": self.weekday, "H": self.hour}
+        mask = np.zeros(self.size, dtype=bool)
+        for sub_pattern in pattern.split(";"):
+            period_values: dict[str, list[int]] = {}
+            for period_type, values in parse_patterns(sub_pattern):
+                period_values.setdefault(period_type, []).extend(values)
+            if not period_values:
+                raise NotImplementedError(f"Time slice pattern {pattern} not supported.")
+
+            sub_mask = np.ones(self.size, dtype=bool)
+            for period_type, values in period_values.items():
+                sub_mask &= np.isin(calendar_arrays[period_type], values)
+            mask |= sub_mask
+        mask.flags.writeable = False  # Masks are shared by the cache.
+        return mask
+
+
+def _to_datetime64(
+    hourly_time_index: pl.DataFrame | NDArray[np.datetime64] | Sequence[datetime],
+) -> NDArray[np.datetime64]:
+    """Convert a time index to a flat NumPy `datetime64` array without creating Python objects."""
+    if isinstance(hourly_time_index, pl.DataFrame):
+        if "datetime" not in hourly_time_index.columns:
+            raise ValueError("Column 'datetime' not found on hourly_time_index.")
+        return hourly_time_index["datetime"].to_numpy()
+    if isinstance(hourly_time_index, np.ndarray):
+        return hourly_time_index.flatten().astype("datetime64[us]")
+    return np.array(hourly_time_index, dtype="datetime64[us]")
+
+
 def time_slice_handler(
     records: list[dict[str, Any]],
-    hourly_time_index: pl.DataFrame | NDArray[np.datetime64] | Sequence[datetime],
+    hourly_time_index: pl.DataFrame | NDArray[np.datetime64] | Sequence[datetime] | TimeSliceCalendar,
     pattern_key: str = "pattern",
 ) -> np.ndarray:
     """Deconstruct a dict of time slices and return a NumPy array representing a time series.
@@ -457,15 +587,17 @@ def time_slice_handler(
     ----------
     records : dist[str, Any]
         A list of dictionaries containing timeslice records.
-    hourly_time_index : pl.DataFrame | NDArray[np.datetime64] | Sequence[datetime]
-        Dataframe containing a 'datetime' column for hourly time index.
+    hourly_time_index : pl.DataFrame | NDArray[np.datetime64] | Sequence[datetime] | TimeSliceCalendar
+        Dataframe containing a 'datetime' column for hourly time index. Pass a `TimeSliceCalendar` when
+        calling this function multiple times for the same time index to re-use the compiled patterns.
     pattern_key : str, optional
         Key used to extract patterns from records (default is 'pattern').
 
     Returns
     -------
     np.ndarray
-        A NumPy array representing the time series based on the input patterns.
+        A NumPy array representing the time series based on the input patterns. If multiple records match
+        the same hour, the last one is used.
 
     Raises
     ------
@@ -474,51 +606,46 @@ def time_slice_handler(
     ValueError
         If the 'datetime' column is missing from hourly_time_index.
     NotImplementedError
-        If records do not contain valid month patterns starting with 'M'.
+        If records contain a pattern without month (M), day (D), weekday (W) or hour (H) periods.
 
     Examples
     --------
     >>> from datetime import datetime, timedelta
-    >>> records = [{"pattern": "M1-2", "value": 200}, {"pattern": "M3-12", "value": 100}]
+    >>> records = [{"pattern": "M1-2", "value": 200}, {"pattern": "M3-12;H1-6", "value": 100}]
     >>> start = datetime(year, 1, 1)
     >>> end = datetime(year + 1, 1, 1)
     >>> delta = timedelta(hours=1)
     >>> datetime_index = tuple(start + i * delta for i in range((end - start) // delta))
     >>> time_slice_handler(records, datetime_index)
     """
-    if isinstance(hourly_time_index, pl.DataFrame):
-        hourly_time_index = hourly_time_index.to_numpy()
-
     if not all(isinstance(record, dict) for record in records):
         raise TypeError("All records must be dictionaries")
 
-    if not all(record[pattern_key].startswith("M") for record in records if pattern_key in record):
-        raise NotImplementedError("All records must contain valid month patterns starting with 'M'")
-
-    if isinstance(hourly_time_index, np.ndarray):
-        hourly_time_index = hourly_time_index.astype(datetime).flatten().tolist()
-
-    assert isinstance(hourly_time_index, Sequence) and all(
-        isinstance(dt, datetime) for dt in hourly_time_index
+    calendar = (
+        hourly_time_index
+        if isinstance(hourly_time_index, TimeSliceCalendar)
+        else TimeSliceCalendar(hourly_time_index)
     )
-    months = np.array([dt.month for dt in hourly_time_index])
-    # hours = np.array([dt.hour for dt in hourly_time_index])
-    month_datetime_series = np.zeros(len(hourly_time_index), dtype=float)
+    time_slice_series = np.zeros(calendar.size, dtype=float)
 
     for record in records:
-        patterns = parse_patterns(record[pattern_key])
-        for pattern in patterns:
-            match pattern[0]:
-                case "M":
-                    month_datetime_series[np.isin(months, pattern[1])] = (
-                        record["value"].magnitude
-                        if isinstance(record["value"], pint.Quantity)
-                        else record["value"]
-                    )
-                case _:
-                    raise NotImplementedError
-
-    return month_datetime_series
+        value = record["value"].magnitude if isinstance(record["value"], pint.Quantity) else record["value"]
+        time_slice_series[calendar.get_mask(record[pattern_key])] = value
+
+    return time_slice_series
+
+
+def get_array_digest(array: np.ndarray) -> str:
+    """Return a digest of the content of an array.
+
+    Arrays with the same shape, dtype and values have the same digest. It is used to share identical time
+    series between components.
+    """
+    array = np.ascontiguousarray(array)
+    array_hash = hashlib.blake2b(digest_size=16)
+    array_hash.update(f"{array.dtype.str}{array.shape}".encode())
+    array_hash.update(array.tobytes())
+    return array_hash.hexdigest()
 
 
 def find_xml(directory: PathLike):
@@ -30,7 +30,12 @@ def pl_filter_by_year(
     Returns
     -------
     pl.DataFrame
-        The filtered DataFrame.
+        The filtered DataFrame. If the year is None or a list of years, the data is returned unfiltered.
+
+    Notes
+    -----
+    Runs with several solve years do not use this filter. `get_parser_data` leaves it out of the default
+    filter functions and `ReEDSParser.build_systems` partitions the tables by year instead.
 
     Raises
     ------
@@ -50,21 +55,22 @@ def pl_filter_by_year(
     if kwargs.get("solve_year"):
         year = kwargs["solve_year"]
 
-    filter_data = data.clone()
-
-    available_years = filter_data.select(pl.col(year_column)).unique()
+    if year is None or isinstance(year, list):
+        return data
 
-    if isinstance(data, pl.LazyFrame):
-        available_years = available_years.collect()
+    filter_data = data.filter(pl.col(year_column) == year)
 
-    assert len(available_years) >= 1
-    assert isinstance(available_years, pl.DataFrame)
+    # Probe a single row so lazy tables are only scanned in full by the caller.
+    if isinstance(filter_data, pl.LazyFrame):
+        is_empty = filter_data.head(1).collect().is_empty()
+    else:
+        is_empty = filter_data.is_empty()
 
-    if year not in available_years[year_column].to_list():
-        logger.debug("{} not in available years {}. Returning unfiltered file.", year, available_years)
+    if is_empty:
+        logger.debug("{} not in the {} column. Returning unfiltered file.", year, year_column)
         return data
 
-    return filter_data.filter(pl.col(year_column) == year)
+    return filter_data
 
 
 def pl_filter_by_weather_year(
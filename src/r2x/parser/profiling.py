@@ -0,0 +1,210 @@
+"""Stage-level profiling of the system construction.
+
+`StageProfiler` wraps the `_construct_*` and `_add_*` methods of a parser so that every stage called by
+`build_system` records its wall time, CPU time, growth of the peak resident memory, and the number of
+components, time series and bytes of time series data it added to the system. Stages called from inside
+another stage are accounted to the outer stage.
+
+The report is written as JSON and CSV next to the translation outputs so it can be compared across releases.
+"""
+
+import csv
+import json
+import sys
+import time
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from loguru import logger
+
+from r2x.__version__ import __version__
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore
+
+STAGE_PREFIXES = ("_construct_", "_add_")
+PROFILE_FNAME = "{name}_build_profile.{extension}"
+
+
+@dataclass
+class StageProfile:
+    """Resources used by a single stage of `build_system`."""
+
+    stage: str
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    peak_rss_delta: int = 0
+    components_added: int = 0
+    time_series_added: int = 0
+    array_bytes: int = 0
+
+
+def get_peak_rss() -> int:
+    """Return the peak resident set size of the process in bytes.
+
+    Returns 0 on platforms without the `resource` module.
+    """
+    if resource is None:
+        return 0
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes and macOS bytes.
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def get_array_nbytes(time_series: Any) -> int:
+    """Return the bytes of the array data of a time series."""
+    data = getattr(time_series, "data", None)
+    if data is None:
+        return 0
+    return np.asarray(getattr(data, "magnitude", data)).nbytes
+
+
+class StageProfiler:
+    """Profile the stages of a parser `build_system`.
+
+    Parameters
+    ----------
+    parser
+        Parser to profile. The stages are the methods that start with any of `STAGE_PREFIXES`.
+    enabled
+        If False the profiler does nothing.
+
+    Example
+    -------
+    >>> with StageProfiler(parser) as profiler:
+    ...     system = parser.build_system()
+    >>> profiler.write_report(output_folder, name="test")
+    """
+
+    def __init__(self, parser: Any, enabled: bool = True) -> None:
+        self.parser = parser
+        self.enabled = enabled
+        self.stages: list[StageProfile] = []
+        self._stage_names = [
+            name
+            for name in dir(type(parser))
+            if name.startswith(STAGE_PREFIXES) and callable(getattr(type(parser), name))
+        ]
+        self._current: StageProfile | None = None
+
+    def __enter__(self) -> "StageProfiler":
+        if self.enabled:
+            for name in self._stage_names:
+                setattr(self.parser, name, self._wrap_stage(name, getattr(self.parser, name)))
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        for name in self._stage_names:
+            self.parser.__dict__.pop(name, None)
+        return None
+
+    def _wrap_stage(self, name: str, method):
+        def stage(*args, **kwargs):
+            if self._current is not None:
+                return method(*args, **kwargs)
+            self._current = StageProfile(stage=name.lstrip("_"))
+            try:
+                return self._run_stage(method, *args, **kwargs)
+            finally:
+                self.stages.append(self._current)
+                self._current = None
+
+        return stage
+
+    def _run_stage(self, method, *args, **kwargs):
+        assert self._current is not None
+        system = getattr(self.parser, "system", None)
+        if system is not None:
+            system.add_time_series = self._wrap_add_time_series(system)
+        num_components = self._get_num_components()
+        peak_rss = get_peak_rss()
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            self._current.wall_time = time.perf_counter() - wall_start
+            self._current.cpu_time = time.process_time() - cpu_start
+            self._current.peak_rss_delta = get_peak_rss() - peak_rss
+            self._current.components_added = self._get_num_components() - num_components
+            if system is not None:
+                system.__dict__.pop("add_time_series", None)
+
+    def _wrap_add_time_series(self, system):
+        add_time_series = system.add_time_series
+
+        def wrapper(time_series, *args, **kwargs):
+            if self._current is not None:
+                self._current.time_series_added += 1
+                self._current.array_bytes += get_array_nbytes(time_series)
+            return add_time_series(time_series, *args, **kwargs)
+
+        return wrapper
+
+    def _get_num_components(self) -> int:
+        # Stages can create the system, e.g., `ReEDSParser.build_system`, so we look it up every time.
+        system = getattr(self.parser, "system", None)
+        if system is None:
+            return 0
+        return system._components.get_num_components()
+
+    def get_total(self) -> StageProfile:
+        """Return the sum of all the stages."""
+        total = StageProfile(stage="total")
+        for stage in self.stages:
+            total.wall_time += stage.wall_time
+            total.cpu_time += stage.cpu_time
+            total.peak_rss_delta += stage.peak_rss_delta
+            total.components_added += stage.components_added
+            total.time_series_added += stage.time_series_added
+            total.array_bytes += stage.array_bytes
+        return total
+
+    def log_summary(self) -> None:
+        """Log a table with the profile of each stage."""
+        header = f"{'Stage':<35} {'Wall (s)':>10} {'CPU (s)':>10} {'RSS (MB)':>10} {'Comp.':>8} {'TS':>8}"
+        rows = [header, "-" * len(header)]
+        for stage in [*self.stages, self.get_total()]:
+            rows.append(
+                f"{stage.stage:<35} {stage.wall_time:>10.3f} {stage.cpu_time:>10.3f} "
+                f"{stage.peak_rss_delta / 1024**2:>10.1f} {stage.components_added:>8} "
+                f"{stage.time_series_added:>8}"
+            )
+        logger.info("Profile of {}.build_system:\n{}", type(self.parser).__name__, "\n".join(rows))
+
+    def write_report(self, output_folder: Path | str, name: str) -> None:
+        """Write the JSON and CSV reports, log the summary and reset the stages.
+
+        Parameters
+        ----------
+        output_folder
+            Folder of the translation outputs.
+        name
+            Name of the translation. The reports are saved as `{name}_build_profile.json` and `.csv`.
+        """
+        if not self.enabled:
+            return
+        json_fpath = Path(output_folder) / PROFILE_FNAME.format(name=name, extension="json")
+        csv_fpath = Path(output_folder) / PROFILE_FNAME.format(name=name, extension="csv")
+        stages: list[dict[str, Any]] = [asdict(stage) for stage in self.stages]
+        report = {
+            "name": name,
+            "parser": type(self.parser).__name__,
+            "r2x_version": __version__,
+            "stages": stages,
+            "total": asdict(self.get_total()),
+        }
+        with open(json_fpath, "w") as f:
+            json.dump(report, f, indent=2)
+        with open(csv_fpath, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=[field.name for field in fields(StageProfile)])
+            writer.writeheader()
+            writer.writerows(stages)
+
+        self.log_summary()
+        logger.info("Build profile saved to {}", json_fpath)
+        self.stages = []
+        return
@@ -3,13 +3,13 @@
 import importlib
 from argparse import ArgumentParser
 from collections import defaultdict
+from collections.abc import Iterator, Sequence
 from datetime import datetime, timedelta
-from itertools import repeat
-from operator import attrgetter
+from functools import partial, reduce
+from typing import Any
 
 import numpy as np
 import polars as pl
-import pyarrow as pa
 from infrasys.cost_curves import CostCurve, FuelCurve, UnitSystem
 from infrasys.function_data import LinearFunctionData
 from infrasys.time_series_models import SingleTimeSeries
@@ -59,15 +59,24 @@ from r2x.models import (
     TransmissionInterfaceMap,
     UpDown,
 )
-from r2x.parser.handler import BaseParser, create_model_instance
-from r2x.units import ActivePower, EmissionRate, Energy, Percentage, Time, ureg
-from r2x.utils import get_enum_from_string, match_category, read_csv
+from r2x.parser.handler import BaseParser, DataRegistry, batched, create_model_instance
+from r2x.units import ActivePower, EmissionRate, Energy, ureg
+from r2x.utils import (
+    TIME_SERIES_SCALING_FACTOR,
+    get_cache_dir,
+    get_category_map,
+    get_enum_from_string,
+    get_property_magnitude,
+    get_time_series_scaling_factor,
+    read_csv,
+)
 
-from .polars_helpers import pl_left_multi_join
+from .polars_helpers import pl_filter_by_year, pl_left_multi_join
 
 R2X_MODELS = importlib.import_module("r2x.models")
 UNITS = importlib.import_module("r2x.units")
 BASE_WEATHER_YEAR = 2007
+CATEGORY_CACHE_FNAME = "reeds_tech_categories.json"
 
 
 def cli_arguments(parser: ArgumentParser):
@@ -109,9 +118,72 @@ class ReEDSParser(BaseParser):
             f"{self.weather_year + 1}",
             dtype="datetime64[D]",
         )[:-1]  # Removing 1 day to match ReEDS convention and converting into a vector
+        self.month_of_hour = self.hourly_time_index.astype("datetime64[M]").astype(int) % 12 + 1
+        self.month_of_day = self.daily_time_index.astype("datetime64[M]").astype(int) % 12 + 1
+        self._hydro_monthly_table: pl.DataFrame | None = None
+
+    def build_systems(self, solve_years: Sequence[int]) -> Iterator[tuple[str, System]]:
+        """Create a system for each solve year of the ReEDS run.
+
+        The files are read once and shared by all the solve years. Tables with a `year` column are partitioned
+        by year on their first access, so each solve year only sees its own rows as with a single year run.
+        The data must be parsed without the year filter, which `get_parser_data` does when the solve year of
+        the configuration is a list.
+
+        Parameters
+        ----------
+        solve_years : Sequence[int]
+            Solve years to translate.
+
+        Yields
+        ------
+        tuple[str, System]
+            Solve year and its system. The parser data and configuration are set to the solve year until the
+            next system is requested.
+        """
+        data = self.data
+        config_solve_year = self.reeds_config.solve_year
+        self._year_partitions: dict[str, dict[int, pl.DataFrame] | None] = {}
+        try:
+            for solve_year in solve_years:
+                logger.info("Building system for solve year {}", solve_year)
+                self.data = self._get_solve_year_data(data, solve_year)
+                self.reeds_config.solve_year = solve_year
+                yield str(solve_year), self.build_system()
+        finally:
+            self.data = data
+            self.reeds_config.solve_year = config_solve_year
+
+    def _get_solve_year_data(self, data: DataRegistry, solve_year: int) -> DataRegistry:
+        """Return a view of the parsed data filtered to a single solve year."""
+        year_data = DataRegistry()
+        for key in data:
+            year_data.register(key, partial(self._get_year_partition, data, key, solve_year))
+        return year_data
+
+    def _get_year_partition(self, data: DataRegistry, key: str, solve_year: int) -> Any:
+        if key not in self._year_partitions:
+            table = data[key]
+            partitions = None
+            if isinstance(table, pl.DataFrame) and "year" in table.columns and not table.is_empty():
+                partitions = {
+                    (year[0] if isinstance(year, tuple) else year): partition
+                    for year, partition in table.partition_by("year", as_dict=True).items()
+                }
+            self._year_partitions[key] = partitions
+
+        table = data[key]
+        if (partitions := self._year_partitions[key]) is not None:
+            # Same as `pl_filter_by_year`: if the year is not in the table we return all of it.
+            return partitions.get(solve_year, table)
+        if isinstance(table, pl.LazyFrame):
+            return pl_filter_by_year(table, year=solve_year)
+        return table
 
     def build_system(self) -> System:
         """Create IS system for the ReEDS model."""
+        # Cached tables depend on the solve year of the data.
+        self._hydro_monthly_table = None
         solve_year_found = self._check_solve_year()
         if not solve_year_found:
             msg = (
@@ -157,16 +229,19 @@ class ReEDSParser(BaseParser):
         return True
 
     # NOTE: Rename to create topology
+    @batched
     def _construct_buses(self):
         logger.info("Creating bus objects.")
         bus_data = self.get_data("hierarchy")
 
-        zones = bus_data["transmission_region"].unique()
-        for zone in zones:
-            self.system.add_component(self._create_model_instance(LoadZone, name=zone))
+        zones = {
+            zone: self._create_model_instance(LoadZone, name=zone)
+            for zone in bus_data["transmission_region"].unique()
+        }
+        self.system.add_components(*zones.values())
 
-        for area in bus_data["state"].unique():
-            self.system.add_component(self._create_model_instance(Area, name=area))
+        areas = {area: self._create_model_instance(Area, name=area) for area in bus_data["state"].unique()}
+        self.system.add_components(*areas.values())
 
         for idx, bus in enumerate(bus_data.iter_rows(named=True)):
             self.system.add_component(
@@ -174,12 +249,13 @@ class ReEDSParser(BaseParser):
                     ACBus,
                     number=idx + 1,
                     name=bus["region"],
-                    area=self.system.get_component(Area, name=bus["state"]),
-                    load_zone=self.system.get_component(LoadZone, name=bus["transmission_region"]),
+                    area=areas[bus["state"]],
+                    load_zone=zones[bus["transmission_region"]],
                     bus_type=ACBusTypes.PV,
                 )
             )
 
+    @batched
     def _construct_reserves(self):
         logger.info("Creating reserves objects.")
         bus_data = self.get_data("hierarchy")
@@ -208,6 +284,7 @@ class ReEDSParser(BaseParser):
         # Add reserve map
         self.system.add_component(self._create_model_instance(ReserveMap, name="reserve_map"))
 
+    @batched
     def _construct_branches(self):
         logger.info("Creating branch objects.")
         branch_data = self.get_data("tx_cap")
@@ -348,6 +425,7 @@ class ReEDSParser(BaseParser):
                 emission_model = self._create_model_instance(Emission, **row)
                 self.system.add_supplemental_attribute(generator, emission_model)
 
+    @batched
     def _construct_generators(self) -> None:  # noqa: C901
         """Construct generators objects."""
         logger.info("Creating generator objects.")
@@ -371,7 +449,7 @@ class ReEDSParser(BaseParser):
         planned_outages = self.get_data("planned_outages")
         storage_duration = self.get_data("storage_duration")
         storage_eff = self.get_data("storage_eff")
-        category_map = self.reeds_config.defaults.get("tech_categories", None)
+        tech_categories = self.reeds_config.defaults.get("tech_categories", None)
 
         # NOTE: Temp unit definition. This should be read from the mapping file?
         unit_definition = {
@@ -405,9 +483,14 @@ class ReEDSParser(BaseParser):
         )
 
         # NOTE: Populate fuel_price information for technologies that use bio_fuel
+        category_map = get_category_map(
+            gen_data["tech"].drop_nulls().unique(),
+            tech_categories,
+            cache_fpath=get_cache_dir(getattr(self.config, "cache_dir", None)) / CATEGORY_CACHE_FNAME,
+        )
         gen_data = gen_data.with_columns(
-            category=pl.col("tech").map_elements(
-                lambda row: match_category(row, category_map), return_dtype=pl.String
+            category=pl.col("tech").replace_strict(
+                category_map, default=pl.col("tech"), return_dtype=pl.String
             )
         )
 
@@ -588,6 +671,7 @@ class ReEDSParser(BaseParser):
             }
             self.system.add_component(self._create_model_instance(gen_model, **row))
 
+    @batched
     def _construct_load(self):
         logger.info("Adding load time series.")
 
@@ -613,6 +697,7 @@ class ReEDSParser(BaseParser):
             self.system.add_component(load)
             self.system.add_time_series(ts, load, **user_dict)
 
+    @batched
     def _construct_cf_time_series(self):
         logger.info("Adding cf time series")
         if not self.weather_year:
@@ -623,17 +708,14 @@ class ReEDSParser(BaseParser):
         # NOTE: We take the median of  the seasonal adjustment since we
         # aggregate the generators by technology vintage
         cf_adjustment = cf_adjustment.group_by("tech").agg(pl.col("cf_adj").median())
-        ilr = self.get_data("ilr")
-        ilr = dict(
-            ilr.group_by("tech").agg(pl.col("ilr").sum()).iter_rows()
-        )  # Dict is more useful here than series
+        ilr = self.get_data("ilr").group_by("tech").agg(pl.col("ilr").sum())
         start = cf_data["datetime"].item(0)
         resolution = timedelta(hours=1)
 
-        counter = 0
-        # NOTE: At some point, I would like to create a single time series per
-        # BA instead of attaching one per generator. We would need to invert
-        # the order of the loop and just use that to attach it to the different
+        # NOTE: With the `shared-cf-profiles` flag the generators of the same profile share a single
+        # time series instead of attaching one per generator.
+        generators = []
+        profile_names = []
         for generator in self.system.get_components(RenewableDispatch, RenewableNonDispatch):
             profile_name = generator.name  # .rsplit("_", 1)[0]
             if "|" in cf_data.columns[1]:
@@ -646,23 +728,71 @@ class ReEDSParser(BaseParser):
                 )
                 logger.warning(msg)
                 continue
+            generators.append(generator)
+            profile_names.append(profile_name)
+
+        if not generators:
+            logger.debug("Added 0 time series objects")
+            return
+
+        # Scale of each generator profile: active_power * ilr * cf_adj. Technologies without ilr or
+        # seasonal adjustment are not scaled.
+        scale = (
+            pl.DataFrame(
+                {
+                    "tech": [generator.ext["reeds_tech"] for generator in generators],
+                    "active_power": [generator.active_power.magnitude for generator in generators],
+                }
+            )
+            .join(ilr, on="tech", how="left")
+            .join(cf_adjustment, on="tech", how="left")
+            .select(pl.col("active_power") * pl.col("ilr").fill_null(1) * pl.col("cf_adj").fill_null(1))
+            .to_series()
+            .to_numpy()
+        )
+
+        # Matrix of (hours x profiles) with the capacity factors used by the generators.
+        unique_profiles = list(dict.fromkeys(profile_names))
+        profile_idx = {profile_name: idx for idx, profile_name in enumerate(unique_profiles)}
+        cf_matrix = cf_data.select(unique_profiles).to_numpy()
+
+        user_dict = {"weather_year": self.weather_year}
+        if self.config.feature_flags.get("shared-cf-profiles"):
+            # Generators of the same profile share the capacity factor time series and save their scale.
+            generators_by_profile = defaultdict(list)
+            for generator, profile_name, generator_scale in zip(generators, profile_names, scale):
+                generator.ext[TIME_SERIES_SCALING_FACTOR.format(variable_name="max_active_power")] = float(
+                    generator_scale
+                )
+                generators_by_profile[profile_name].append(generator)
+            for profile_name, profile_generators in generators_by_profile.items():
+                ts = SingleTimeSeries.from_array(
+                    data=np.ascontiguousarray(cf_matrix[:, profile_idx[profile_name]], dtype=np.float64),
+                    variable_name="max_active_power",
+                    initial_time=start,
+                    resolution=resolution,
+                )
+                self.system.add_time_series(ts, *profile_generators, **user_dict)
+            logger.debug("Added {} shared time series objects", len(generators_by_profile))
+            return
 
-            cf_adj = cf_adjustment.filter(pl.col("tech") == generator.ext["reeds_tech"])["cf_adj"]
-            ilr_value = ilr.get(generator.ext["reeds_tech"], 1)
-            rating_profile = generator.active_power * ilr_value * cf_adj * cf_data[profile_name].to_numpy()
+        # Matrix of (hours x generators) with all the rating profiles.
+        rating_profiles = np.asfortranarray(
+            cf_matrix[:, [profile_idx[profile_name] for profile_name in profile_names]] * scale
+        )
+        for idx, generator in enumerate(generators):
             ts = SingleTimeSeries.from_array(
-                data=rating_profile,
+                data=type(generator.active_power)(rating_profiles[:, idx], generator.active_power.units),
                 variable_name="max_active_power",
                 initial_time=start,
                 resolution=resolution,
             )
-            user_dict = {"weather_year": self.weather_year}
             self.system.add_time_series(ts, generator, **user_dict)
-            counter += 1
+        counter = len(generators)
         logger.debug("Added {} time series objects", counter)
 
+    @batched
     def _construct_reserve_provision(self):
-        # NOTE: We need to re-think this chunk of code. The code is bad.
         # Provision is just based on wind/solar and load for the given region.
         logger.debug("Creating reserve provision")
 
@@ -670,115 +800,33 @@ class ReEDSParser(BaseParser):
         # resolution of the generator time series
         start = datetime(year=self.weather_year, month=1, day=1)
         resolution = timedelta(hours=1)
+        provision_profiles = self._get_provision_profiles()
         for reserve in self.system.get_components(Reserve):
-            region = reserve.region
-            provision_objects = {}
-            provision_objects["solar"] = [
-                component
-                for component in self.system.get_components(
-                    RenewableDispatch,
-                    filter_func=lambda x: x.bus.load_zone.name == region.name
-                    and (
-                        x.prime_mover_type == PrimeMoversType.PVe
-                        or x.prime_mover_type == PrimeMoversType.RTPV
-                    ),
-                )
-                if self.system.has_time_series(component)
-            ]
-            provision_objects["wind"] = [
-                component
-                for component in self.system.get_components(
-                    RenewableDispatch,
-                    filter_func=lambda x: x.bus.load_zone.name == region.name
-                    and (
-                        x.prime_mover_type == PrimeMoversType.WT or x.prime_mover_type == PrimeMoversType.WS
-                    ),
-                )
-                if self.system.has_time_series(component)
-            ]
-            provision_objects["load"] = [
-                component
-                for component in self.system.get_components(
-                    PowerLoad, filter_func=lambda x: x.bus.load_zone.name == region.name
-                )
-                if self.system.has_time_series(component)
-            ]
-            solar_names = list(map(attrgetter("name"), provision_objects["solar"]))
-            wind_names = list(map(attrgetter("name"), provision_objects["wind"]))
-            load_names = list(map(attrgetter("name"), provision_objects["load"]))
-            solar_reserves = list(
-                map(
-                    getattr,
-                    map(
-                        getattr,
-                        map(self.system.get_time_series, provision_objects["solar"]),
-                        repeat("data"),
-                    ),
-                    repeat("magnitude"),
-                )
-            )
-            solar_capacity = list(
-                map(
-                    lambda component: self.system.get_component_by_label(
-                        component.label
-                    ).active_power.magnitude,
-                    provision_objects["solar"],
-                )
-            )
-            wind_reserves = list(
-                map(
-                    getattr,
-                    map(
-                        getattr,
-                        map(self.system.get_time_series, provision_objects["wind"]),
-                        repeat("data"),
-                    ),
-                    repeat("magnitude"),
-                )
-            )
-            load_reserves = list(
-                map(
-                    getattr,
-                    map(
-                        getattr,
-                        map(self.system.get_time_series, provision_objects["load"]),
-                        repeat("data"),
-                    ),
-                    repeat("magnitude"),
-                )
-            )
-            wind_provision = (
-                pa.Table.from_arrays(wind_reserves, names=wind_names)
-                .to_pandas()
-                .sum(axis=1)
-                .mul(self.reeds_config.defaults["wind_reserves"].get(reserve.reserve_type.name, 0.01))
-            )
-            solar_provision = (
-                pa.Table.from_arrays(solar_reserves, names=solar_names)
-                .to_pandas()
-                .sum(axis=1)
-                .apply(lambda x: 1 if x != 0 else 0)
-                .mul(sum(solar_capacity))
-                .mul(self.reeds_config.defaults["solar_reserves"].get(reserve.reserve_type.name, 0.01))
-            )
-            load_provision = (
-                pa.Table.from_arrays(load_reserves, names=load_names)
-                .to_pandas()
-                .sum(axis=1)
-                .mul(self.reeds_config.defaults["load_reserves"].get(reserve.reserve_type.name, 0.01))
-            )
-            total_provision = load_provision.add(solar_provision, fill_value=0).add(
-                wind_provision, fill_value=0
-            )
-            if total_provision.empty:
+            reserve_type = reserve.reserve_type.name
+            profiles = provision_profiles.get(reserve.region.name, {})
+            provisions = []
+            if (load_profile := profiles.get("load")) is not None:
+                load_reserves = self.reeds_config.defaults["load_reserves"].get(reserve_type, 0.01)
+                provisions.append(load_profile * load_reserves)
+            if (solar_profile := profiles.get("solar")) is not None:
+                solar_reserves = self.reeds_config.defaults["solar_reserves"].get(reserve_type, 0.01)
+                provisions.append((solar_profile != 0) * profiles["solar_capacity"] * solar_reserves)
+            if (wind_profile := profiles.get("wind")) is not None:
+                wind_reserves = self.reeds_config.defaults["wind_reserves"].get(reserve_type, 0.01)
+                provisions.append(wind_profile * wind_reserves)
+
+            if not provisions:
                 msg = (
                     f"Reserve provision for {reserve=} is zero."
                     "Check that renewable devices contribute to the reserve"
                 )
                 logger.warning(msg)
+                continue
+
+            total_provision = reduce(np.add, provisions)
             self.system.add_time_series(
                 SingleTimeSeries.from_array(
-                    total_provision.to_numpy(),
+                    total_provision,
                     variable_name="requirement",
                     initial_time=start,
                     resolution=resolution,
@@ -788,52 +836,62 @@ class ReEDSParser(BaseParser):
             # Add total provision as requirement
             setattr(reserve, "max_requirement", total_provision.sum())
 
+    def _get_provision_profiles(self) -> dict[str, dict[str, Any]]:
+        """Return the sum of the solar, wind and load profiles and the solar capacity of each load zone."""
+        categories = {
+            PrimeMoversType.PVe: "solar",
+            PrimeMoversType.RTPV: "solar",
+            PrimeMoversType.WT: "wind",
+            PrimeMoversType.WS: "wind",
+        }
+        components: list[tuple[str, RenewableDispatch | PowerLoad]] = [
+            (category, generator)
+            for generator in self.system.get_components(RenewableDispatch)
+            if generator.prime_mover_type is not None
+            and (category := categories.get(generator.prime_mover_type)) is not None
+        ]
+        components.extend(("load", load) for load in self.system.get_components(PowerLoad))
+
+        provision_profiles: dict[str, dict[str, Any]] = defaultdict(dict)
+        for category, component in components:
+            if not self.system.has_time_series(component):
+                continue
+
+            assert component.bus is not None and component.bus.load_zone is not None
+            profiles = provision_profiles[component.bus.load_zone.name]
+            time_series = self.system.get_time_series(component)
+            profile = get_property_magnitude(time_series.data) * get_time_series_scaling_factor(
+                component, time_series.variable_name
+            )
+            profiles[category] = profiles[category] + profile if category in profiles else profile
+            if category == "solar" and isinstance(component, RenewableDispatch):
+                profiles["solar_capacity"] = (
+                    profiles.get("solar_capacity", 0) + component.active_power.magnitude
+                )
+        return provision_profiles
+
+    @batched
     def _construct_hydro_budgets(self) -> None:
         """Hydro budgets in ReEDS."""
         logger.debug("Adding hydro budgets.")
-        month_hrs = read_csv("month_hrs.csv").collect()
-        month_hrs = month_hrs.filter(pl.col("model") == self.config.input_model)
-        month_map = self.reeds_config.defaults["month_map"]
-
-        hydro_cf = self.get_data("hydro_cf")
-        hydro_cf = hydro_cf.with_columns(
-            month=pl.col("month").map_elements(lambda row: month_map.get(row, row), return_dtype=pl.String)
+        # NOTE: Canadian imports need another file for the ratings, but we process it as
+        # HydroEnergyReservoir since it is the way ReEDS model it.
+        generators = list(
+            self.system.get_components(HydroDispatch, filter_func=lambda x: x.category != "can-imports")
         )
-        month_hrs = month_hrs.rename({"szn": "season"})
-        hydro_data = pl_left_multi_join(
-            hydro_cf,
-            month_hrs,
-        )
-        month_of_day = np.array(
-            [dt.astype("datetime64[M]").astype(int) % 12 + 1 for dt in self.daily_time_index]
-        )
-        initial_time = datetime(self.weather_year, 1, 1)
-        for generator in self.system.get_components(HydroDispatch):
-            # NOTE: Canadian imports need another file for the ratings, but we process it as
-            # HydroEnergyReservoir since it is the way ReEDS model it.
-            if generator.category == "can-imports":
-                continue
-            tech = generator.ext["reeds_tech"]
-            generator_bus = generator.bus
-            assert generator_bus
-            region = generator_bus.name
-            hydro_ratings = hydro_data.filter((pl.col("tech") == tech) & (pl.col("region") == region))
+        if not generators:
+            return None
 
-            hourly_time_series = np.zeros(len(month_of_day), dtype=float)
-
-            for row in hydro_ratings.iter_rows(named=True):
-                month = row["month"]
-                if isinstance(month, str):
-                    month = int(month.removeprefix("M"))
-
-                month_max_budget = (
-                    generator.active_power * Percentage(row["hydro_cf"], "") * Time(row["hrs"], "h")
-                )
-                daily_max_budget = month_max_budget / (row["hrs"] / 24)
-                hourly_time_series[month_of_day == month] = daily_max_budget.magnitude
+        hydro_cf, month_hrs = self._get_hydro_monthly_data(generators)
+        active_power = np.array([generator.active_power.magnitude for generator in generators])
+        # Daily budget of each month: the monthly energy divided by the days of the month.
+        monthly_budget = active_power[:, np.newaxis] * hydro_cf * month_hrs / (month_hrs / 24)
+        daily_budgets = monthly_budget[:, self.month_of_day - 1]
 
+        initial_time = datetime(self.weather_year, 1, 1)
+        for generator, daily_budget in zip(generators, daily_budgets):
             ts = SingleTimeSeries.from_array(
-                Energy(hourly_time_series / 1e3, "GWh"),
+                Energy(daily_budget / 1e3, "GWh"),
                 "hydro_budget",
                 initial_time=initial_time,
                 resolution=timedelta(days=1),
@@ -842,45 +900,26 @@ class ReEDSParser(BaseParser):
 
         return None
 
+    @batched
     def _construct_hydro_rating_profiles(self) -> None:
         logger.debug("Adding hydro rating profiles.")
-        month_hrs = read_csv("month_hrs.csv").collect()
-        month_hrs = month_hrs.filter(pl.col("model") == self.config.input_model).rename({"szn": "season"})
-        month_map = self.reeds_config.defaults["month_map"]
+        generators = list(self.system.get_components(HydroEnergyReservoir))
+        if not generators:
+            return None
+
+        hydro_cf, _ = self._get_hydro_monthly_data(generators)
+        active_power = np.array([generator.active_power.magnitude for generator in generators])
+        hourly_ratings = (active_power[:, np.newaxis] * hydro_cf)[:, self.month_of_hour - 1]
 
-        hydro_cf = self.get_data("hydro_cf")
-        hydro_cf = hydro_cf.with_columns(
-            month=pl.col("month").map_elements(lambda row: month_map.get(row, row), return_dtype=pl.String)
-        )
-        hydro_data = pl_left_multi_join(
-            hydro_cf,
-            month_hrs,
-        )
-        month_of_hour = np.array(
-            [dt.astype("datetime64[M]").astype(int) % 12 + 1 for dt in self.hourly_time_index]
-        )
         initial_time = datetime(self.weather_year, 1, 1)
-        for generator in self.system.get_components(HydroEnergyReservoir):
-            tech = generator.ext["reeds_tech"]
-            generator_bus = generator.bus
-            assert generator_bus is not None
-            region = generator_bus.name
+        for generator, hourly_rating in zip(generators, hourly_ratings):
             generator.inflow = 0.0
             generator.initial_storage = generator.initial_energy
             generator.storage_capacity = Energy(0.0, "MWh")
             generator.storage_target = Energy(0.0, "MWh")
 
-            hourly_time_series = np.zeros(len(month_of_hour), dtype=float)
-            hydro_ratings = hydro_data.filter((pl.col("tech") == tech) & (pl.col("region") == region))
-            for row in hydro_ratings.iter_rows(named=True):
-                month = row["month"]
-                if isinstance(month, str):
-                    month = int(month.removeprefix("M"))
-                month_indices = month_of_hour == month
-                rating = generator.active_power * Percentage(row["hydro_cf"], "")
-                hourly_time_series[month_indices] = rating.magnitude
             ts = SingleTimeSeries.from_array(
-                ActivePower(hourly_time_series, "MW"),
+                ActivePower(hourly_rating, "MW"),
                 "max_active_power",
                 initial_time=initial_time,
                 resolution=timedelta(hours=1),
@@ -888,6 +927,55 @@ class ReEDSParser(BaseParser):
             self.system.add_time_series(ts, generator)
         return None
 
+    def _get_hydro_monthly_table(self) -> pl.DataFrame:
+        """Return the hydro capacity factor and hours of each (tech, region, month).
+
+        The table is computed once per parser and `month` is the number of the month.
+        """
+        if self._hydro_monthly_table is not None:
+            return self._hydro_monthly_table
+
+        month_hrs = read_csv("month_hrs.csv").collect()
+        month_hrs = month_hrs.filter(pl.col("model") == self.config.input_model).rename({"szn": "season"})
+        month_map = self.reeds_config.defaults["month_map"]
+
+        hydro_cf = self.get_data("hydro_cf").with_columns(pl.col("month").cast(pl.String).replace(month_map))
+        hydro_data = pl_left_multi_join(hydro_cf, month_hrs)
+        self._hydro_monthly_table = (
+            hydro_data.select(
+                "tech",
+                "region",
+                pl.col("month").str.strip_prefix("M").cast(pl.Int64),
+                pl.col("hydro_cf").cast(pl.Float64),
+                pl.col("hrs").cast(pl.Float64),
+            )
+            # Keep the last value of duplicated months as when they were assigned row by row.
+            .unique(subset=["tech", "region", "month"], keep="last", maintain_order=True)
+        )
+        return self._hydro_monthly_table
+
+    def _get_hydro_monthly_data(self, generators: list) -> tuple[np.ndarray, np.ndarray]:
+        """Return the (generators x months) matrices of the hydro capacity factor and hours of the month.
+
+        Months without data for the tech and region of the generator have a capacity factor of zero.
+        """
+        generator_data = pl.DataFrame(
+            {
+                "tech": [generator.ext["reeds_tech"] for generator in generators],
+                "region": [generator.bus.name for generator in generators],
+            },
+            schema={"tech": pl.String, "region": pl.String},
+        ).with_row_index("generator")
+        hydro_data = generator_data.join(self._get_hydro_monthly_table(), on=["tech", "region"], how="inner")
+
+        generator_idx = hydro_data["generator"].to_numpy()
+        month_idx = hydro_data["month"].to_numpy() - 1
+        hydro_cf = np.zeros((len(generators), 12))
+        month_hrs = np.ones((len(generators), 12))
+        hydro_cf[generator_idx, month_idx] = hydro_data["hydro_cf"].to_numpy()
+        month_hrs[generator_idx, month_idx] = hydro_data["hrs"].to_numpy()
+        return hydro_cf, month_hrs
+
     def _construct_hybrid_systems(self):
         """Create hybrid storage units and add them to the system."""
         hybrids = list(
@@ -21,7 +21,7 @@ from r2x.config_scenario import Scenario
 from r2x.models import Emission, Generator
 from r2x.parser.handler import BaseParser
 from r2x.units import ActivePower, ureg
-from r2x.utils import read_json
+from r2x.utils import TIME_SERIES_SCALING_FACTOR, read_json
 
 # Constants
 CAPACITY_THRESHOLD = 5  # MW
@@ -89,6 +89,18 @@ def update_system(
     return break_generators(system, reference_generators, capacity_threshold, non_break_techs)
 
 
+def scale_time_series_factors(new_component, component, proportion: float) -> None:
+    """Scale the factors of the shared time series of a split generator by its share of the capacity.
+
+    The split units keep the normalized profile of the original generator, so the factors saved on
+    `ext` (see `TIME_SERIES_SCALING_FACTOR`) must follow `active_power`.
+    """
+    suffix = TIME_SERIES_SCALING_FACTOR.format(variable_name="")
+    for key, scaling_factor in component.ext.items():
+        if key.endswith(suffix):
+            new_component.ext[key] = scaling_factor * proportion
+
+
 def break_generators(  # noqa: C901
     system: System,
     reference_generators: dict[str, dict],
@@ -150,6 +162,7 @@ def break_generators(  # noqa: C901
                 if attr := getattr(new_component, property, None):
                     new_component.ext[f"{property}_original"] = attr
                     setattr(new_component, property, attr * proportion)
+            scale_time_series_factors(new_component, component, proportion)
             new_component.ext["original_capacity"] = component.active_power
             new_component.ext["original_name"] = component.name
             new_component.ext["broken"] = True
@@ -175,6 +188,7 @@ def break_generators(  # noqa: C901
                 if attr := getattr(new_component, property, None):
                     new_component.ext[f"{property}_original"] = attr
                     setattr(new_component, property, attr * proportion)
+            scale_time_series_factors(new_component, component, proportion)
             new_component.ext["original_capacity"] = component.active_power
             new_component.ext["original_name"] = component.name
             new_component.ext["broken"] = True
@@ -1,9 +1,11 @@
 """Umbrella API for R2X model."""
 
+import copy
 import importlib
 import inspect
 import shutil
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from importlib.resources import files
 from pathlib import Path
 
@@ -12,10 +14,13 @@ from loguru import logger
 from r2x.exporter.handler import get_exporter
 
 from .api import System
+from .config_models import ReEDSConfig
 from .config_scenario import Scenario, get_scenario_configuration
 from .exporter import exporter_list
 from .parser import parser_list
 from .parser.handler import BaseParser, get_parser_data
+from .parser.plexos_cache import clear_xml_cache
+from .parser.profiling import StageProfiler
 from .upgrader import upgrade_handler
 from .utils import (
     DEFAULT_PLUGIN_PATH,
@@ -57,7 +62,9 @@ def run_parser(config: Scenario, **kwargs):
         raise KeyError(f"Parser for {config.input_model} not found")
 
     parser = get_parser_data(config, parser_class, **kwargs)
-    system = parser.build_system()
+    with StageProfiler(parser, enabled=getattr(config, "profile", False)) as profiler:
+        system = parser.build_system()
+    profiler.write_report(config.output_folder, name=str(config.name))
 
     assert system is not None, "System failed to create"
 
@@ -103,10 +110,168 @@ def run_exporter(config: Scenario, system: System) -> None:
     get_exporter(config, system, exporter_class)
 
 
+def export_system_file(config: Scenario, system_fpath: Path | str) -> None:
+    """Export a serialized system.
+
+    This function is used by the worker processes of `export_system_files`.
+    """
+    system = System.from_json(system_fpath)
+    run_exporter(config=config, system=system)
+
+
+def run_multi_model_scenario(scenario: Scenario, **kwargs) -> None:
+    """Translate several models of the same input in a single run.
+
+    The parser loads the input once and creates a system for each model in `scenario.models`. Each system
+    is saved as `{output_folder}/{model_name}/{model_name}.json` and then exported on a separate process.
+    The number of processes is set by `scenario.export_workers`.
+
+    Parameters
+    ----------
+    scenario
+        Translation scenario.
+
+    Other Parameters
+    ----------------
+    kwargs
+        Additional key arguments to the parser.
+
+    Raises
+    ------
+    NotImplementedError
+        If the parser does not support translating multiple models.
+    """
+    assert scenario.input_model
+    parser_class = parser_list.get(scenario.input_model)
+    if not parser_class:
+        raise KeyError(f"Parser for {scenario.input_model} not found")
+    if getattr(parser_class, "build_systems", None) is BaseParser.build_systems:
+        msg = f"Parser for {scenario.input_model} does not support translating multiple models."
+        raise NotImplementedError(msg)
+
+    parser = get_parser_data(scenario, parser_class, **kwargs)
+    model_names: list[str] = getattr(scenario, "models", [])
+    model_exports = []
+    with StageProfiler(parser, enabled=getattr(scenario, "profile", False)) as profiler:
+        for model_name, system in parser.build_systems(model_names):
+            output_folder = Path(scenario.output_folder) / model_name
+            output_folder.mkdir(parents=True, exist_ok=True)
+            model_scenario = copy.copy(scenario)
+            model_scenario.name = model_name
+            model_scenario.output_folder = output_folder
+            # Plugins run on this process, so each model gets its own configurations.
+            if scenario.input_config is not None:
+                model_scenario.input_config = scenario.input_config.model_copy()
+            if scenario.output_config is not None:
+                model_scenario.output_config = scenario.output_config.model_copy()
+            profiler.write_report(output_folder, name=model_name)
+
+            system = run_plugins(config=model_scenario, parser=parser, system=system)
+            output_fpath = output_folder / f"{model_name}.json"
+            logger.info("Serialize system to {}", output_fpath)
+            system.to_json(output_fpath, overwrite=True)
+            model_exports.append((model_scenario, output_fpath))
+
+    if scenario.output_model == "infrasys":
+        return
+
+    export_system_files(model_exports, max_workers=getattr(scenario, "export_workers", None))
+    return
+
+
+def run_multi_year_scenario(scenario: Scenario, **kwargs) -> None:
+    """Translate several solve years of the same input in a single run.
+
+    The parser reads the input files once and creates a system for each year in
+    `scenario.input_config.solve_year`. Each system is saved as
+    `{output_folder}/{solve_year}/{name}_{solve_year}.json` and then exported on a separate process. The
+    number of processes is set by `scenario.export_workers`.
+
+    Parameters
+    ----------
+    scenario
+        Translation scenario.
+
+    Other Parameters
+    ----------------
+    kwargs
+        Additional key arguments to the parser.
+
+    Raises
+    ------
+    NotImplementedError
+        If the parser does not support translating multiple solve years.
+    """
+    assert scenario.input_model
+    assert scenario.input_config is not None
+    parser_class = parser_list.get(scenario.input_model)
+    if not parser_class:
+        raise KeyError(f"Parser for {scenario.input_model} not found")
+    if not isinstance(scenario.input_config, ReEDSConfig):
+        msg = f"Parser for {scenario.input_model} does not support translating multiple solve years."
+        raise NotImplementedError(msg)
+
+    solve_years = scenario.input_config.solve_year
+    assert isinstance(solve_years, list)
+    parser = get_parser_data(scenario, parser_class, **kwargs)
+    year_exports = []
+    with StageProfiler(parser, enabled=getattr(scenario, "profile", False)) as profiler:
+        for solve_year, system in parser.build_systems(solve_years):
+            output_folder = Path(scenario.output_folder) / solve_year
+            output_folder.mkdir(parents=True, exist_ok=True)
+            year_scenario = copy.copy(scenario)
+            year_scenario.name = f"{scenario.name}_{solve_year}"
+            year_scenario.output_folder = output_folder
+            year_scenario.input_config = scenario.input_config.model_copy(
+                update={"solve_year": int(solve_year)}
+            )
+            if scenario.output_config is not None:
+                year_scenario.output_config = scenario.output_config.model_copy()
+            profiler.write_report(output_folder, name=year_scenario.name)
+
+            system = run_plugins(config=year_scenario, parser=parser, system=system)
+            output_fpath = output_folder / f"{year_scenario.name}.json"
+            logger.info("Serialize system to {}", output_fpath)
+            system.to_json(output_fpath, overwrite=True)
+            year_exports.append((year_scenario, output_fpath))
+
+    if scenario.output_model == "infrasys":
+        return
+
+    export_system_files(year_exports, max_workers=getattr(scenario, "export_workers", None))
+    return
+
+
+def export_system_files(exports: list[tuple[Scenario, Path]], max_workers: int | None = None) -> None:
+    """Export serialized systems concurrently, one process per system.
+
+    Parameters
+    ----------
+    exports
+        Pairs of the scenario and the path of the serialized system to export.
+    max_workers
+        Maximum number of processes. Defaults to the number of processors.
+    """
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(export_system_file, export_scenario, system_fpath)
+            for export_scenario, system_fpath in exports
+        ]
+        for future in futures:
+            future.result()
+    return
+
+
 def run_single_scenario(scenario: Scenario, **kwargs) -> None:
     """Run translation process."""
     logger.info("Running {}", scenario.name)
 
+    if getattr(scenario, "models", None):
+        return run_multi_model_scenario(scenario, **kwargs)
+
+    if isinstance(getattr(scenario.input_config, "solve_year", None), list):
+        return run_multi_year_scenario(scenario, **kwargs)
+
     if scenario.input_model == "infrasys":
         fname = f"{scenario.run_folder}/{scenario.name}.json"
         system = System.from_json(filename=fname, **kwargs)
@@ -156,17 +321,11 @@ def run(cli_args: dict, user_dict: dict | None = None) -> None:
 
     Notes
     -----
-    Currently the scenario should only have a single year to run.
+    Scenarios with multiple solve years are translated with `run_multi_year_scenario`.
     """
     config_mgr = get_scenario_configuration(cli_args=cli_args, user_dict=user_dict)
     logger.info("Running {} scenarios", len(config_mgr))
     for _, scenario in config_mgr.scenarios.items():
-        # NOTE: We can pass multiple years from the CLI. In those cases we want to raise not implemented.
-        if hasattr(scenario, "input_config") and isinstance(
-            getattr(scenario.input_config, "solve_year", None), list
-        ):
-            msg = "Multi year runs from the CLI is not yet supported. Use scenarios instead."
-            raise NotImplementedError(msg)
         run_single_scenario(scenario)
     return
 
@@ -188,3 +347,20 @@ def init(cli_args: dict) -> None:
         file_path = package_path / "user_dict.yaml"
         shutil.copy(file_path, Path(path) / "user_dict.yaml")
     return
+
+
+def clear_cache(cli_args: dict) -> int:
+    """Delete the cached PLEXOS databases without running a translation.
+
+    Parameters
+    ----------
+    cli_args
+        Arguments from the CLI
+
+    Returns
+    -------
+    int
+        Number of databases deleted.
+    """
+    logger.debug("Running clear-cache command")
+    return clear_xml_cache(cli_args.get("cache_dir"))
@@ -1,6 +1,7 @@
 """R2X utils functions."""
 
 # ruff: noqa
+import hashlib
 import io
 import json
 import ast
@@ -33,6 +34,9 @@ from r2x.units import ureg
 DEFAULT_OUTPUT_FOLDER: str = "r2x_export"
 DEFAULT_DATA_FOLDER: str = "data"
 DEFAULT_PLUGIN_PATH: str = "r2x.plugins"
+TIME_SERIES_SCALING_FACTOR = "{variable_name}_scaling_factor"
+CACHE_DIR_ENV = "R2X_CACHE_DIR"
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "r2x"
 DEFAULT_SEARCH_FOLDERS = [
     "outputs",
     "inputs_case",
@@ -626,6 +630,60 @@ def match_category(row, categories, cutoff=0.6):
     return row
 
 
+def get_cache_dir(cache_dir: Path | str | None = None) -> Path:
+    """Return the R2X cache directory.
+
+    The priority is the `cache_dir` passed, then the `R2X_CACHE_DIR` environment variable and finally
+    `~/.cache/r2x`.
+    """
+    if cache_dir is None:
+        cache_dir = os.environ.get(CACHE_DIR_ENV, DEFAULT_CACHE_DIR)
+    return Path(cache_dir)
+
+
+def get_category_map(
+    values: Iterable[str], categories: list[str], cutoff: float = 0.6, cache_fpath: Path | None = None
+) -> dict[str, str]:
+    """Return the closest category of each value.
+
+    Each distinct value is matched with `match_category`. If `cache_fpath` is passed, the matches are saved
+    on it keyed by the categories and the cutoff, so later runs with the same categories only match the
+    values that were not seen before.
+
+    Args:
+        values: Strings to match.
+        categories: Categories to match against.
+        cutoff: Cutoff of the algorithm (0-1]. 1 being perfect match.
+        cache_fpath: JSON file with the previous matches.
+    """
+    values = set(values)
+    if not categories:
+        return {value: value for value in values}
+
+    cache_key = hashlib.sha256(json.dumps([categories, cutoff]).encode()).hexdigest()
+    cache: dict[str, dict[str, str]] = {}
+    if cache_fpath is not None and cache_fpath.exists():
+        try:
+            cache = json.loads(cache_fpath.read_text())
+        except json.JSONDecodeError:
+            logger.warning("Ignoring corrupted category cache {}", cache_fpath)
+
+    category_map = cache.get(cache_key, {})
+    missing_values = values.difference(category_map)
+    if not missing_values:
+        return category_map
+
+    logger.trace("Matching {} values to categories", len(missing_values))
+    category_map.update({value: match_category(value, categories, cutoff=cutoff) for value in missing_values})
+    if cache_fpath is not None:
+        cache[cache_key] = category_map
+        cache_fpath.parent.mkdir(parents=True, exist_ok=True)
+        tmp_fpath = cache_fpath.with_name(f"{cache_fpath.name}.{os.getpid()}.tmp")
+        tmp_fpath.write_text(json.dumps(cache, indent=2, sort_keys=True))
+        tmp_fpath.replace(cache_fpath)
+    return category_map
+
+
 def get_enum_from_string(string: str, enum_class, prefix: str | None = None):
     max_similarity = 0.95
     closest_enum = None
@@ -728,5 +786,16 @@ def haskey(base_dict: dict, path: list[str]) -> bool:
         return False
 
 
+def get_time_series_scaling_factor(component, variable_name: str) -> float:
+    """Return the factor that scales the time series of a component.
+
+    Components that share a normalized profile, e.g., ReEDS renewables with the `shared-cf-profiles` flag,
+    save the factor in `ext["{variable_name}_scaling_factor"]`. Components with their own time series
+    return 1.
+    """
+    ext = getattr(component, "ext", None) or {}
+    return ext.get(TIME_SERIES_SCALING_FACTOR.format(variable_name=variable_name), 1)
+
+
 DEFAULT_COLUMN_MAP = read_json("r2x/defaults/config.json").get("default_column_mapping")
 mapping_schema = json.loads(files("r2x.defaults").joinpath("mapping_schema.json").read_text())
@@ -16,6 +16,15 @@ DEFAULT_SCENARIO = "pacific"
 DEFAULT_INFRASYS = "pjm_2area"
 
 
+@pytest.fixture(scope="session", autouse=True)
+def r2x_cache_dir(tmp_path_factory):
+    """Keep the R2X on-disk caches of the test session out of the user cache folder."""
+    cache_dir = tmp_path_factory.mktemp("r2x_cache")
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("R2X_CACHE_DIR", str(cache_dir))
+        yield cache_dir
+
+
 @pytest.fixture
 def data_folder(pytestconfig):
     return pytestconfig.rootpath.joinpath(DATA_FOLDER)
@@ -23,6 +23,20 @@ def test_break_generators():
         assert generator.ext["broken"]
 
 
+def test_break_generators_scaling_factor():
+    system = ieee5bus()
+    for generator in system.get_components(Generator, filter_func=lambda x: x.category == "storage"):
+        generator.ext["max_active_power_scaling_factor"] = 200.0
+    reference_generators = {
+        "storage": {"avg_capacity_MW": 100},
+    }
+    system = break_generators(system, reference_generators, capacity_threshold=10)
+
+    new_generators = system.get_components(Generator, filter_func=lambda x: x.ext.get("broken"))
+    for generator in new_generators:
+        assert generator.ext["max_active_power_scaling_factor"] == 100.0
+
+
 def test_break_generators_break_category():
     system = ieee5bus()
     capacity_threshold = 10
@@ -1,8 +1,8 @@
 from r2x.enums import PrimeMoversType
 from r2x.models import Generator, ACBus, Emission, HydroPumpedStorage, ThermalStandard
 from r2x.models import MinMax
-from r2x.parser.handler import create_model_instance
-from r2x.units import EmissionRate, ureg
+from r2x.parser.handler import construct_model_instance, create_model_instance, validate_model_instance
+from r2x.units import ActivePower, EmissionRate, ureg
 
 
 def test_generator_model():
@@ -63,3 +63,14 @@ def test_create_model_instance():
     assert isinstance(generator, Generator)
     assert isinstance(generator.name, list)
     assert generator.name == name
+
+
+def test_construct_model_instance():
+    generator = construct_model_instance(ThermalStandard, name="TestGen", active_power=100 * ureg.MW)
+    assert isinstance(generator, ThermalStandard)
+    assert isinstance(generator.active_power, ActivePower)
+    assert generator.active_power.magnitude == 100
+    assert validate_model_instance(generator) is None
+
+    generator = construct_model_instance(ThermalStandard, name=["TestGen"])
+    assert validate_model_instance(generator) is not None
@@ -3,7 +3,7 @@ from tempfile import NamedTemporaryFile
 
 import pytest
 
-from r2x.parser.handler import file_handler
+from r2x.parser.handler import DataRegistry, file_handler
 
 
 def test_file_handler():
@@ -14,3 +14,29 @@ def test_file_handler():
 
         with pytest.raises(NotImplementedError):
             _ = file_handler(Path(temp_file.name))
+
+
+def test_data_registry():
+    calls = []
+
+    def loader():
+        calls.append("load")
+        return 1
+
+    data = DataRegistry(existing=0)
+    data.register("load", loader)
+    assert "load" in data
+    assert len(data) == 2
+    assert set(data) == {"existing", "load"}
+    assert not data.is_loaded("load")
+    assert not calls
+
+    assert data["load"] == 1
+    assert data.get("load") == 1
+    assert data.is_loaded("load")
+    assert calls == ["load"]
+
+    data["load"] = 2
+    assert data["load"] == 2
+    del data["load"]
+    assert "load" not in data
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 import polars as pl
 from datetime import datetime
@@ -7,6 +8,7 @@ from r2x.parser.parser_helpers import (
     fill_missing_timestamps,
     prepare_ext_field,
     reconcile_timeseries,
+    reconcile_timeseries_matrix,
     resample_data_to_hourly,
 )
 
@@ -207,3 +209,33 @@ def test_reconcile_timeseries_raises_assertion():
     # Check that AssertionError is raised
     with pytest.raises(AssertionError):
         reconcile_timeseries(data_file, hourly_time_index)
+
+
+@pytest.mark.parametrize("hourly_index", ["hourly_non_leap_year", "hourly_leap_year"])
+def test_reconcile_timeseries_matrix(hourly_index, hourly_leap_year, request):
+    hourly_time_index = request.getfixturevalue(hourly_index)
+    timestamps = hourly_leap_year["datetime"]
+    data_file = pl.concat(
+        pl.DataFrame(
+            {
+                "name": name,
+                "year": timestamps.dt.year(),
+                "month": timestamps.dt.month(),
+                "day": timestamps.dt.day(),
+                "hour": timestamps.dt.hour(),
+                "value": np.arange(len(timestamps)) * scale,
+            }
+        )
+        for name, scale in [("Solar", 1), ("Wind", 2)]
+    )
+    index_columns = ["year", "month", "day", "hour"]
+
+    matrix, column_index = reconcile_timeseries_matrix(data_file, hourly_time_index, index_columns)
+    assert matrix.shape == (len(hourly_time_index), 2)
+    assert column_index == {"solar": 0, "wind": 1}
+    for name in ["Solar", "Wind"]:
+        expected = reconcile_timeseries(data_file.filter(pl.col("name") == name), hourly_time_index)
+        np.testing.assert_array_equal(matrix[:, column_index[name.lower()]], expected["value"].to_numpy())
+
+    # Records with different time stamps are reconciled one by one.
+    assert reconcile_timeseries_matrix(data_file.slice(1), hourly_time_index, index_columns) is None
@@ -1,9 +1,11 @@
+import numpy as np
 import pytest
 import polars as pl
 from pathlib import Path
 from polars.testing import assert_frame_equal
 from tempfile import NamedTemporaryFile
 from r2x.parser.handler import csv_handler
+from r2x.parser.handler_utils import decode_h5_datetime, get_offset_time_zone, reeds_h5_reader
 from r2x.parser.plexos_utils import find_xml
 
 
@@ -66,3 +68,30 @@ def test_find_xml(tmp_path: Path, basic_xml: str):
 
     with pytest.raises(FileNotFoundError):
         find_xml(tmp_path)
+
+
+def test_reeds_h5_reader(reeds_data_folder):
+    fpath = reeds_data_folder.joinpath("inputs_case", "load.h5")
+    load = reeds_h5_reader(fpath)
+    assert load.columns[:2] == ["year", "datetime"]
+
+    solve_year = load["year"].max()
+    load_weather_year = reeds_h5_reader(fpath, weather_year=2007, solve_year=solve_year)
+    assert load_weather_year["year"].unique().to_list() == [solve_year]
+    assert load_weather_year["datetime"].dt.year().unique().to_list() == [2007]
+    assert load_weather_year.columns == load.columns
+
+
+@pytest.mark.parametrize(
+    "offset, time_zone",
+    [("-05:00", "Etc/GMT+5"), ("+03:00", "Etc/GMT-3"), ("+00:00", "Etc/GMT"), ("+05:30", None)],
+)
+def test_get_offset_time_zone(offset, time_zone):
+    assert get_offset_time_zone(offset) == time_zone
+
+
+def test_decode_h5_datetime():
+    index_datetime = np.array([b"2007-01-01T00:00:00-05:00", b"2007-01-01T01:00:00-05:00"])
+    datetimes = decode_h5_datetime(index_datetime)
+    assert datetimes.dtype == pl.Datetime("ns", "Etc/GMT+5")
+    assert datetimes.dt.hour().to_list() == [0, 1]
@@ -0,0 +1,125 @@
+import os
+import sqlite3
+
+import polars as pl
+import pytest
+from plexosdb import PlexosDB
+
+from r2x.parser.plexos_cache import (
+    XML_CACHE_FOLDER,
+    clear_xml_cache,
+    evict_cache,
+    get_cache_dir,
+    get_data_file_cache_fpath,
+    get_data_file_column_type,
+    get_xml_cache_key,
+    load_plexos_db,
+    read_data_file_cache,
+    write_data_file_cache,
+)
+from r2x.parser.plexos_utils import DATAFILE_COLUMNS
+
+DB_NAME = "2-bus_example.xml"
+
+
+@pytest.fixture
+def xml_file(data_folder):
+    return data_folder / DB_NAME
+
+
+def test_get_cache_dir(tmp_path, monkeypatch):
+    assert get_cache_dir(tmp_path) == tmp_path
+    monkeypatch.setenv("R2X_CACHE_DIR", str(tmp_path / "env"))
+    assert get_cache_dir() == tmp_path / "env"
+
+
+def test_xml_cache_key(xml_file, tmp_path):
+    assert get_xml_cache_key(xml_file) == get_xml_cache_key(xml_file)
+
+    modified_xml = tmp_path / DB_NAME
+    modified_xml.write_bytes(xml_file.read_bytes() + b"\n")
+    assert get_xml_cache_key(modified_xml) != get_xml_cache_key(xml_file)
+
+
+def test_load_plexos_db_cache(xml_file, tmp_path):
+    query = "SELECT name FROM t_object ORDER BY name"
+    db = load_plexos_db(xml_file, cache_dir=tmp_path)
+    cached_files = list((tmp_path / XML_CACHE_FOLDER).glob("*.db"))
+    assert len(cached_files) == 1
+
+    cached_db = load_plexos_db(xml_file, cache_dir=tmp_path)
+    assert isinstance(cached_db, PlexosDB)
+    assert cached_db.query(query) == db.query(query)
+
+    # Cached databases are opened read-only
+    with pytest.raises(sqlite3.OperationalError):
+        cached_db._db.conn.execute("DELETE FROM t_object")
+
+    assert clear_xml_cache(tmp_path) == 1
+    assert not list((tmp_path / XML_CACHE_FOLDER).glob("*.db"))
+
+
+def test_load_plexos_db_no_cache(xml_file, tmp_path):
+    db = load_plexos_db(xml_file, cache_dir=tmp_path, use_cache=False)
+    assert isinstance(db, PlexosDB)
+    assert not (tmp_path / XML_CACHE_FOLDER).exists()
+
+
+def test_evict_cache(tmp_path):
+    for idx in range(3):
+        fpath = tmp_path / f"{idx}.db"
+        fpath.write_bytes(b"0" * 10)
+        # Older files are evicted first
+        os.utime(fpath, (1_000_000 + idx, 1_000_000 + idx))
+    evict_cache(tmp_path, max_size=20)
+    assert sorted(fpath.name for fpath in tmp_path.glob("*.db")) == ["1.db", "2.db"]
+
+
+def test_data_file_cache(tmp_path):
+    data_file = tmp_path / "data_file.csv"
+    data_file.write_text("Name,Year,Month,Day,Period,Value\nGen1,2035,1,1,1,10\nGen1,2035,1,1,2,20\n")
+
+    column_type = get_data_file_column_type(data_file)
+    assert column_type == DATAFILE_COLUMNS.TS_NYMDPV
+
+    cache_fpath = get_data_file_cache_fpath(data_file, column_type, year=2035, cache_dir=tmp_path)
+    assert cache_fpath != get_data_file_cache_fpath(data_file, column_type, year=2036, cache_dir=tmp_path)
+    assert cache_fpath != get_data_file_cache_fpath(
+        data_file, column_type, year=2035, csv_file_encoding="utf8-lossy", cache_dir=tmp_path
+    )
+    assert read_data_file_cache(cache_fpath) is None
+
+    parsed_file = pl.read_csv(data_file)
+    write_data_file_cache(cache_fpath, parsed_file)
+    assert read_data_file_cache(cache_fpath).equals(parsed_file)
+
+    # Modifying the data file invalidates the cache.
+    data_file.write_text("Name,Year,Month,Day,Period,Value\nGen1,2035,1,1,1,30\n")
+    assert get_data_file_cache_fpath(data_file, column_type, year=2035, cache_dir=tmp_path) != cache_fpath
+
+
+def test_evict_cache_orphaned_tmp_files(tmp_path):
+    orphaned = tmp_path / "old.123.tmp"
+    orphaned.write_bytes(b"0")
+    os.utime(orphaned, (1_000_000, 1_000_000))
+    in_flight = tmp_path / "new.456.tmp"
+    in_flight.write_bytes(b"0")
+    evict_cache(tmp_path)
+    assert not orphaned.exists()
+    assert in_flight.exists()
+
+
+def test_evict_cache_missing_file(tmp_path, monkeypatch):
+    for idx in range(2):
+        (tmp_path / f"{idx}.db").write_bytes(b"0" * 10)
+
+    # Simulate a concurrent eviction between the glob and the stat.
+    original_glob = type(tmp_path).glob
+
+    def glob_with_missing(self, pattern):
+        return [*original_glob(self, pattern), self / "evicted.db"]
+
+    monkeypatch.setattr(type(tmp_path), "glob", glob_with_missing)
+    evict_cache(tmp_path, max_size=10)
+    monkeypatch.undo()
+    assert len(list(tmp_path.glob("*.db"))) == 1
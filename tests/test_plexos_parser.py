@@ -1,12 +1,17 @@
+import numpy as np
+import polars as pl
 import pytest
-from plexosdb import PlexosDB, XMLHandler
+from infrasys.time_series_models import SingleTimeSeries
+from pint import Quantity
+from plexosdb import ClassEnum, CollectionEnum, PlexosDB, XMLHandler
 
 from r2x.api import System
 from r2x.config_scenario import Scenario
 from r2x.exceptions import R2XParserError
-from r2x.models import Generator
+from r2x.models import ACBus, Generator
 from r2x.parser.handler import get_parser_data
 from r2x.parser.plexos import PlexosParser
+from r2x.units import Voltage, ureg
 
 DB_NAME = "2-bus_example.xml"
 MODEL_NAME = "main_model"
@@ -100,6 +105,24 @@ def test_parser_system(pjm_scenario):
     assert total_components == 48
 
 
+def test_parser_system_trusted_input(pjm_scenario):
+    pjm_scenario.input_config.model_name = "model_2012"
+    pjm_scenario.input_config.defaults["plexos_category_map"] = {
+        "thermal": {"fuel": "NATURAL_GAS", "type": "CC"},
+        "solar": {"fuel": None, "type": "PVe"},
+        "wind": {"fuel": None, "type": "WT"},
+    }
+    pjm_scenario.trusted_input = True
+    pjm_scenario.validate_trusted_input = True
+
+    parser = get_parser_data(pjm_scenario, parser_class=PlexosParser)
+    system = parser.build_system()
+    assert sum(1 for _ in system.iter_all_components()) == 48
+    assert parser._constructed_components
+    for component in system.get_components(ACBus):
+        assert isinstance(component.base_voltage, Voltage)
+
+
 def test_variable_parsing(five_bus_variables_scenario):
     plexos_category_map = {
         "thermal": {"fuel": "NATURAL_GAS", "type": "CC"},
@@ -123,3 +146,331 @@ def test_variable_parsing(five_bus_variables_scenario):
 
     assert sum(record_ts["SolarPV1"].data.tolist()) == 4224.0
     assert "SolarPV2" not in record_ts
+
+
+def test_object_id_index(five_bus_variables_scenario, monkeypatch):
+    five_bus_variables_scenario.input_config.model_name = "Base"
+    five_bus_variables_scenario.input_config.defaults["plexos_category_map"] = {
+        "thermal": {"fuel": "NATURAL_GAS", "type": "CC"},
+    }
+    parser = get_parser_data(five_bus_variables_scenario, parser_class=PlexosParser)
+    parser._build_object_id_index()
+    assert parser._object_ids[ClassEnum.Variable]
+
+    variable_name, object_id = next(iter(parser._object_ids[ClassEnum.Variable].items()))
+    expected_object_id = parser.db.get_object_id(ClassEnum.Variable, name=variable_name)
+
+    def get_object_id(*args, **kwargs):
+        raise AssertionError("Object ids must be resolved from the index.")
+
+    monkeypatch.setattr(parser.db, "get_object_id", get_object_id)
+    assert parser._get_object_id(ClassEnum.Variable, variable_name) == object_id == expected_object_id
+    system = parser.build_system()
+    assert isinstance(system, System)
+
+
+def test_property_index(pjm_scenario):
+    plexos_category_map = {
+        "thermal": {"fuel": "NATURAL_GAS", "type": "CC"},
+        "solar": {"fuel": None, "type": "PVe"},
+        "wind": {"fuel": None, "type": "WT"},
+    }
+    pjm_scenario.input_config.model_name = "model_2012"
+    pjm_scenario.input_config.defaults["plexos_category_map"] = plexos_category_map
+
+    parser = get_parser_data(pjm_scenario, parser_class=PlexosParser)
+    _ = parser.build_system()
+
+    generator_filter = (pl.col("child_class_name") == str(ClassEnum.Generator)) & (
+        pl.col("parent_class_name") == str(ClassEnum.System)
+    )
+    expected = parser._get_model_data(generator_filter)
+    generators = parser._get_class_data(ClassEnum.Generator, ClassEnum.System)
+    assert generators.sort(pl.all()).equals(expected.sort(pl.all()))
+
+    object_id = generators["object_id"][0]
+    object_data = parser._filter_by_object_id(object_id)
+    assert not object_data.is_empty()
+    assert (object_data["object_id"] == object_id).all()
+    assert parser._filter_by_object_id(-1).is_empty()
+
+
+def test_data_file_cache(five_bus_variables_scenario, tmp_path):
+    plexos_category_map = {
+        "thermal": {"fuel": "NATURAL_GAS", "type": "CC"},
+        "solar": {"fuel": None, "type": "WT"},
+        "wind": {"fuel": None, "type": "PV"},
+    }
+    five_bus_variables_scenario.input_config.model_name = "Base"
+    five_bus_variables_scenario.input_config.defaults["plexos_category_map"] = plexos_category_map
+    five_bus_variables_scenario.data_file_cache = True
+    five_bus_variables_scenario.cache_dir = tmp_path
+
+    # First run populates the cache and the second one reads from it.
+    for _ in range(2):
+        parser = get_parser_data(five_bus_variables_scenario, parser_class=PlexosParser)
+        system = parser.build_system()
+        solar = system.list_components_by_name(Generator, "SolarPV1")[0]
+        assert sum(system.get_time_series(solar, "max_active_power").data.tolist()) == 4224.0
+    assert list((tmp_path / "data_files").glob("*.arrow"))
+
+
+@pytest.mark.parametrize("workers", [None, "0"])
+def test_prefetch_data_files(five_bus_variables_scenario, workers):
+    five_bus_variables_scenario.input_config.model_name = "Base"
+    five_bus_variables_scenario.input_config.defaults["plexos_category_map"] = {
+        "thermal": {"fuel": "NATURAL_GAS", "type": "CC"},
+    }
+    if workers is not None:
+        five_bus_variables_scenario.feature_flags["data-file-workers"] = workers
+
+    parser = get_parser_data(five_bus_variables_scenario, parser_class=PlexosParser)
+    parser.plexos_data = parser._polarize_data(parser._plexos_table_data())
+    parser._build_property_index()
+    assert {"solar_ts.csv", "solar_ts_02.csv"} <= parser._collect_data_file_paths()
+
+    parser._prefetch_data_files()
+    prefetched_files = {path.name for path in parser._data_file_cache}
+    if workers == "0":
+        assert not prefetched_files
+    else:
+        assert {"solar_ts.csv", "solar_ts_02.csv"} <= prefetched_files
+        reconciled_files = {path.name for path, matrix in parser._data_file_matrices.items() if matrix}
+        assert {"solar_ts.csv", "solar_ts_02.csv"} <= reconciled_files
+
+
+@pytest.mark.parametrize("data_file_cache", [False, True])
+def test_lazy_data_files(five_bus_variables_scenario, tmp_path, data_file_cache):
+    five_bus_variables_scenario.input_config.model_name = "Base"
+    five_bus_variables_scenario.input_config.defaults["plexos_category_map"] = {
+        "thermal": {"fuel": "NATURAL_GAS", "type": "CC"},
+    }
+    five_bus_variables_scenario.feature_flags["lazy-data-files"] = True
+    five_bus_variables_scenario.data_file_cache = data_file_cache
+    five_bus_variables_scenario.cache_dir = tmp_path / "cache"
+    parser = get_parser_data(five_bus_variables_scenario, parser_class=PlexosParser)
+
+    timestamps = parser.hourly_time_index["datetime"]
+    fpath = tmp_path / "long_data_file.csv"
+    pl.concat(
+        pl.DataFrame(
+            {
+                "NAME": name,
+                "YEAR": timestamps.dt.year(),
+                "MONTH": timestamps.dt.month(),
+                "DAY": timestamps.dt.day(),
+                "PERIOD": timestamps.dt.hour() + 1,
+                "VALUE": np.arange(len(timestamps)) * scale,
+            }
+        )
+        for name, scale in [("Gen1", 1), ("Gen2", 2)]
+    ).write_csv(fpath)
+
+    values = parser._data_file_handler("gen2", "Rating", fpath.as_posix())
+    np.testing.assert_array_equal(values, np.arange(len(timestamps)) * 2)
+    assert parser._data_file_scans[fpath] is not None
+    assert fpath not in parser._data_file_cache
+    assert bool(list((tmp_path / "cache" / "data_files").glob("*.parquet"))) == data_file_cache
+
+
+def test_parse_class_property_data(five_bus_variables_scenario):
+    five_bus_variables_scenario.input_config.model_name = "Base"
+    five_bus_variables_scenario.input_config.defaults["plexos_category_map"] = {
+        "thermal": {"fuel": "NATURAL_GAS", "type": "CC"},
+    }
+    parser = get_parser_data(five_bus_variables_scenario, parser_class=PlexosParser)
+    parser.plexos_data = parser._polarize_data(parser._plexos_table_data())
+    parser._build_property_index()
+
+    generators = parser._get_class_data(ClassEnum.Generator, ClassEnum.System)
+    generator_properties = parser._parse_class_property_data(generators)
+    assert set(generator_properties) == {(name,) for name in generators["name"].unique()}
+
+    brighton_records, brighton_multi_band = generator_properties[("Brighton",)]
+    assert brighton_multi_band == set()
+    assert brighton_records["available"] == 1
+    assert brighton_records["base_power"] == 600 * ureg.MW
+    assert brighton_records["min_rated_capacity"] == 150 * ureg.MW
+    assert brighton_records["startup_cost"] == 5000 * ureg.usd
+    assert brighton_records["Shutdown Cost"] == 3000 * ureg.usd
+    assert brighton_records["min_up_time"] == 5 * ureg.hour
+    assert brighton_records["min_down_time"] == 3 * ureg.hour
+    assert brighton_records["ramp_up"] == 5 * ureg.Unit("MW/min")
+    assert brighton_records["ramp_down"] == 5 * ureg.Unit("MW/min")
+
+    park_city_records, _ = generator_properties[("Park_City",)]
+    assert park_city_records["base_power"] == 170 * ureg.MW
+    assert park_city_records["ramp_up"] == 0.5 * ureg.Unit("MW/min")
+
+    solar_records, _ = generator_properties[("SolarPV1",)]
+    assert isinstance(solar_records["Rating Factor"], SingleTimeSeries)
+    assert parser._parse_class_property_data(generators.clear()) == {}
+
+
+def test_membership_index(pjm_scenario):
+    pjm_scenario.input_config.model_name = "model_2012"
+    pjm_scenario.input_config.defaults["plexos_category_map"] = {
+        "thermal": {"fuel": "NATURAL_GAS", "type": "CC"},
+    }
+    parser = get_parser_data(pjm_scenario, parser_class=PlexosParser)
+    parser._build_membership_index()
+
+    line_name = parser.memberships.filter(pl.col("parent_class_name") == str(ClassEnum.Line))["parent"][0]
+    line_memberships = parser.db.get_object_memberships(line_name, class_enum=ClassEnum.Line)
+    for collection in (CollectionEnum.NodeFrom, CollectionEnum.NodeTo):
+        expected = next(
+            membership["child"]
+            for membership in line_memberships
+            if membership["parent"] == line_name
+            and membership["collection_name"].replace(" ", "") == collection.name
+        )
+        assert parser._get_memberships(ClassEnum.Line, line_name, collection)[0]["child"] == expected
+
+    node_to = parser._get_memberships(ClassEnum.Line, line_name, CollectionEnum.NodeTo)[0]
+    node_from = parser._get_child_memberships(
+        ClassEnum.Node, node_to["child"], CollectionEnum.NodeTo, parent_class=ClassEnum.Line
+    )
+    assert any(membership["parent"] == line_name for membership in node_from)
+    assert node_to in parser._get_object_memberships(node_to["parent_object_id"], CollectionEnum.NodeTo)
+    assert parser._get_memberships(ClassEnum.Line, "missing-line", CollectionEnum.NodeTo) == []
+
+
+def test_relationship_map(five_bus_variables_scenario):
+    five_bus_variables_scenario.input_config.model_name = "Base"
+    five_bus_variables_scenario.input_config.defaults["plexos_category_map"] = {
+        "thermal": {"fuel": "NATURAL_GAS", "type": "CC"},
+    }
+    parser = get_parser_data(five_bus_variables_scenario, parser_class=PlexosParser)
+    parser._build_membership_index()
+    parser._build_relationship_map()
+
+    assert set(parser.relationships["relationship"]) <= {"generator_node", "generator_storage"}
+    generator_nodes = parser.relationships.filter(pl.col("relationship") == "generator_node")
+    assert not generator_nodes.is_empty()
+    for generator_name, node_name in generator_nodes.select("device", "related").rows():
+        related = parser._get_relationships("generator_node", generator_name)
+        assert node_name in [relationship["related"] for relationship in related]
+    assert parser._get_relationships("generator_reserve", "missing-generator") == []
+
+
+def test_shared_time_series(five_bus_variables_scenario, tmp_path):
+    five_bus_variables_scenario.input_config.model_name = "Base"
+    five_bus_variables_scenario.input_config.defaults["plexos_category_map"] = {
+        "thermal": {"fuel": "NATURAL_GAS", "type": "CC"},
+    }
+    parser = get_parser_data(five_bus_variables_scenario, parser_class=PlexosParser)
+
+    profile = np.arange(8760, dtype=np.float64)
+    time_series = parser._parse_value(profile, variable_name="max_active_power", unit="MW")
+    assert parser._parse_value(profile.copy(), variable_name="max_active_power", unit="MW") is time_series
+    assert parser._parse_value(profile, variable_name="max_active_power", unit="kW") is not time_series
+    assert parser._parse_value(profile + 1, variable_name="max_active_power", unit="MW") is not time_series
+
+    assert parser._get_time_series_copy(time_series, "max_active_power") is time_series
+    unitless_time_series = parser._get_time_series_copy(time_series, "max_active_power", unitless=True)
+    assert (
+        parser._get_time_series_copy(time_series, "max_active_power", unitless=True) is unitless_time_series
+    )
+    assert isinstance(time_series.data, Quantity)
+    assert not isinstance(unitless_time_series.data, Quantity)
+
+    # Attaching the same profile under another name (e.g., `pump_load` as `rating`) never renames the
+    # shared time series.
+    rating_time_series = parser._get_time_series_copy(time_series, "rating", unitless=True)
+    assert rating_time_series is not unitless_time_series
+    assert rating_time_series.variable_name == "rating"
+    assert time_series.variable_name == "max_active_power"
+
+    system = System(name="shared_time_series", auto_add_composed_components=True)
+    buses = [ACBus(name=f"bus_{idx}", number=idx) for idx in range(1, 4)]
+    for bus in buses:
+        system.add_component(bus)
+    system.add_time_series(unitless_time_series, *buses)
+    system.add_time_series(rating_time_series, buses[0])
+    system.to_json(tmp_path / "system.json")
+
+    deserialized_system = System.from_json(tmp_path / "system.json")
+    deserialized_time_series = [
+        deserialized_system.get_time_series(bus, "max_active_power")
+        for bus in deserialized_system.get_components(ACBus)
+    ]
+    assert len({time_series.uuid for time_series in deserialized_time_series}) == 1
+
+
+def test_resolve_model_data(pjm_scenario):
+    pjm_scenario.input_config.model_name = "model_2012"
+    pjm_scenario.input_config.defaults["plexos_category_map"] = {
+        "thermal": {"fuel": "NATURAL_GAS", "type": "CC"},
+    }
+    parser = get_parser_data(pjm_scenario, parser_class=PlexosParser)
+    parser.scenarios = ["high"]
+    parser.year = 2030
+
+    def record(object_id, property_name, value, band=1, scenario=None, date_from=None, date_to=None):
+        return {
+            "parent_object_id": 1,
+            "object_id": object_id,
+            "name": f"gen_{object_id}",
+            "property_name": property_name,
+            "property_value": value,
+            "band": band,
+            "scenario": scenario,
+            "date_from": date_from,
+            "date_to": date_to,
+        }
+
+    model_data = pl.DataFrame(
+        [
+            record(1, "Max Capacity", 100.0),
+            record(1, "Max Capacity", 150.0, scenario="high"),
+            record(1, "Max Capacity", 120.0, scenario="low"),
+            record(1, "Max Capacity", 10.0, band=2),
+            record(2, "Max Capacity", 200.0),
+            record(2, "Max Capacity", 250.0, date_from="2025-01-01T00:00:00"),
+            record(2, "Max Capacity", 300.0, date_from="2040-01-01T00:00:00"),
+            record(3, None, None, band=None),
+        ],
+        schema={
+            "parent_object_id": pl.Int32,
+            "object_id": pl.Int32,
+            "name": pl.String,
+            "property_name": pl.String,
+            "property_value": pl.Float64,
+            "band": pl.Int32,
+            "scenario": pl.String,
+            "date_from": pl.String,
+            "date_to": pl.String,
+        },
+    ).with_columns(tag_timeslice=pl.lit(None, dtype=pl.String))
+
+    resolved = parser._resolve_model_data(model_data)
+    values = {
+        (object_id, band): value
+        for object_id, band, value in resolved.select("object_id", "band", "property_value").rows()
+    }
+    assert values == {(1, 1): 150.0, (1, 2): 10.0, (2, 1): 250.0, (3, None): None}
+
+
+def test_build_systems(pjm_scenario, monkeypatch):
+    pjm_scenario.input_config.defaults["plexos_category_map"] = {
+        "thermal": {"fuel": "NATURAL_GAS", "type": "CC"},
+        "solar": {"fuel": None, "type": "PVe"},
+        "wind": {"fuel": None, "type": "WT"},
+    }
+    pjm_scenario.input_config.model_name = "model_2012"
+    pjm_scenario.models = ["model_2012", "model_2012_m1"]
+    parser = get_parser_data(pjm_scenario, parser_class=PlexosParser)
+
+    table_data_calls = []
+    plexos_table_data = parser._plexos_table_data
+    monkeypatch.setattr(
+        parser, "_plexos_table_data", lambda: table_data_calls.append(1) or plexos_table_data()
+    )
+
+    systems = dict(parser.build_systems(pjm_scenario.models))
+    assert list(systems) == pjm_scenario.models
+    assert len(table_data_calls) == 1
+    assert systems["model_2012"] is not systems["model_2012_m1"]
+    for model_name, system in systems.items():
+        assert system.name == model_name
+        assert sum(1 for _ in system.iter_all_components()) == 48
@@ -2,10 +2,18 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from tempfile import NamedTemporaryFile
 
+import numpy as np
 import polars as pl
 import pytest
 
-from r2x.parser.plexos_utils import DATAFILE_COLUMNS, get_column_enum, parse_ymd, time_slice_handler
+from r2x.parser.plexos_utils import (
+    DATAFILE_COLUMNS,
+    TimeSliceCalendar,
+    get_array_digest,
+    get_column_enum,
+    parse_ymd,
+    time_slice_handler,
+)
 
 
 def temp_csv_file(data: str):
@@ -105,14 +113,55 @@ def test_time_slice_handler_raises():
     with pytest.raises(TypeError):
         _ = time_slice_handler(records, datetime_index)
 
-    records = [{"pattern": "H1-2", "value": 200}, {"pattern": "M3-12", "value": 100}]
+    records = [{"pattern": "Q1", "value": 200}, {"pattern": "M3-12", "value": 100}]
     with pytest.raises(NotImplementedError):
         _ = time_slice_handler(records, datetime_index)
 
 
+def test_time_slice_calendar():
+    year = 2024  # 2024-01-01 is a Monday
+    hourly_time_index = pl.datetime_range(
+        datetime(year, 1, 1), datetime(year + 1, 1, 1), interval="1h", eager=True, closed="left"
+    ).to_frame("datetime")
+    calendar = TimeSliceCalendar(hourly_time_index)
+    assert calendar.size == 8784
+
+    assert calendar.get_mask("M2").sum() == 29 * 24
+    assert calendar.get_mask("D31").sum() == 7 * 24
+    assert calendar.get_mask("H1-6").sum() == 366 * 6
+    assert calendar.get_mask("W1")[: 7 * 24].nonzero()[0].tolist() == list(range(6 * 24, 7 * 24))
+
+    # Different period types are combined with AND and `;` with OR.
+    assert calendar.get_mask("M1,H1-6").sum() == 31 * 6
+    assert calendar.get_mask("M1;H1-6").sum() == 31 * 24 + (366 - 31) * 6
+    assert calendar.get_mask("H1-6,H19-24").sum() == 366 * 12
+
+    # Masks are compiled once per pattern.
+    assert calendar.get_mask("M1;H1-6") is calendar.get_mask("M1;H1-6")
+
+
+def test_time_slice_handler_composite_patterns():
+    year = 2024
+    hourly_time_index = pl.datetime_range(
+        datetime(year, 1, 1), datetime(year + 1, 1, 1), interval="1h", eager=True, closed="left"
+    ).to_frame("datetime")
+    records = [{"pattern": "M1-12", "value": 1}, {"pattern": "W2-6,H8-23", "value": 2}]
+    result = time_slice_handler(records, TimeSliceCalendar(hourly_time_index))
+    assert result.tolist()[:24] == [1] * 7 + [2] * 16 + [1]
+    assert all(result[6 * 24 : 7 * 24] == 1)  # Sunday
+
+
 def test_parse_ymd():
     header = "year,month,day,Gen1,Gen2\n"
     data = "2023,1,1,200,200\n2023,1,2,300,300\n"
     csv_file = temp_csv_file(header + data)
     csv_file = pl.read_csv(csv_file)
     parse_ymd(csv_file)
+
+
+def test_get_array_digest():
+    array = np.arange(24, dtype=np.float64)
+    assert get_array_digest(array) == get_array_digest(array.copy())
+    assert get_array_digest(array) != get_array_digest(array + 1)
+    assert get_array_digest(array) != get_array_digest(array.astype(np.float32))
+    assert get_array_digest(array) != get_array_digest(array.reshape(2, 12))
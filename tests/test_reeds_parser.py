@@ -1,12 +1,26 @@
+import numpy as np
+import polars as pl
 import pytest
 from infrasys.time_series_models import SingleTimeSeries
 
 from r2x.api import System
 from r2x.config_scenario import Scenario
-from r2x.models import MonitoredLine, Emission, Generator, PowerLoad
+from r2x.models import (
+    ACBus,
+    MonitoredLine,
+    Emission,
+    Generator,
+    HydroDispatch,
+    HydroEnergyReservoir,
+    PowerLoad,
+    RenewableDispatch,
+    RenewableNonDispatch,
+    Reserve,
+)
 from r2x.parser.handler import get_parser_data
 from r2x.parser.reeds import ReEDSParser
 from r2x.exceptions import R2XParserError
+from r2x.units import ActivePower
 
 
 @pytest.fixture
@@ -27,6 +41,20 @@ def reeds_parser_instance(scenario_instance):
     return get_parser_data(scenario_instance, parser_class=ReEDSParser)
 
 
+def test_multi_year_data_is_not_filtered(reeds_data_folder, default_scenario, tmp_folder):
+    scenario = Scenario.from_kwargs(
+        name=default_scenario,
+        input_model="reeds-US",
+        output_model="plexos",
+        run_folder=reeds_data_folder,
+        output_folder=tmp_folder,
+        solve_year=[2047, 2050],
+        weather_year=2012,
+    )
+    parser = get_parser_data(scenario, parser_class=ReEDSParser)
+    assert {2047, 2050} <= set(parser.get_data("fuel_price")["year"].to_list())
+
+
 def test_reeds_parser_instance(reeds_parser_instance):
     assert isinstance(reeds_parser_instance, ReEDSParser)
 
@@ -35,6 +63,13 @@ def test_parser_has_data(reeds_parser_instance):
     assert len(reeds_parser_instance.data) != 0
 
 
+def test_parser_data_is_lazy(reeds_parser_instance):
+    assert not any(reeds_parser_instance.data.is_loaded(key) for key in reeds_parser_instance.data)
+    hierarchy = reeds_parser_instance.get_data("hierarchy")
+    assert reeds_parser_instance.data.is_loaded("hierarchy")
+    assert reeds_parser_instance.get_data("hierarchy") is hierarchy
+
+
 def test_system_creation(reeds_parser_instance):
     system = reeds_parser_instance.build_system()
     assert isinstance(system, System)
@@ -86,6 +121,38 @@ def test_construct_load_time_series(reeds_parser_instance):
     assert len(ts.data) == len(load_df[single_load.bus.name][end_idx - 8760 : end_idx])
 
 
+def test_construct_cf_time_series(reeds_parser_instance):
+    reeds_parser_instance.system = System(name="Test", auto_add_composed_components=True)
+    reeds_parser_instance._check_solve_year()
+    reeds_parser_instance._construct_buses()
+    reeds_parser_instance._construct_reserves()
+    reeds_parser_instance._construct_generators()
+    reeds_parser_instance._construct_cf_time_series()
+
+    cf_data = reeds_parser_instance.get_data("cf").collect()
+    cf_adjustment = reeds_parser_instance.get_data("cf_adjustment")
+    ilr = reeds_parser_instance.get_data("ilr")
+    generators = [
+        generator
+        for generator in reeds_parser_instance.system.get_components(RenewableDispatch, RenewableNonDispatch)
+        if reeds_parser_instance.system.has_time_series(generator)
+    ]
+    assert generators
+
+    generator = generators[0]
+    tech = generator.ext["reeds_tech"]
+    profile_name = generator.name
+    if "|" in cf_data.columns[1]:
+        profile_name = "|".join(profile_name.rsplit("_", 1))
+    cf_adj = cf_adjustment.filter(pl.col("tech") == tech)["cf_adj"].median()
+    ilr_value = ilr.filter(pl.col("tech") == tech)["ilr"].sum() or 1
+    expected = generator.active_power.magnitude * ilr_value * cf_adj * cf_data[profile_name].to_numpy()
+
+    ts = reeds_parser_instance.system.get_time_series(generator)
+    assert ts.data.units == generator.active_power.units
+    assert np.allclose(ts.data.magnitude, expected)
+
+
 @pytest.fixture
 def reeds_system(reeds_parser_instance):
     return reeds_parser_instance.build_system()
@@ -107,3 +174,75 @@ def test_construct_branches(reeds_system):
     branch_objects = [component for component in reeds_system.get_components(MonitoredLine)]
     assert all(isinstance(component, MonitoredLine) for component in branch_objects)
     assert len(branch_objects) == 17  # With rating on both direction
+
+
+def test_construct_reserve_provision(reeds_system):
+    reserves = [
+        reserve for reserve in reeds_system.get_components(Reserve) if reeds_system.has_time_series(reserve)
+    ]
+    assert reserves
+    for reserve in reserves:
+        requirement = reeds_system.get_time_series(reserve, "requirement")
+        assert len(requirement.data) == 8760
+        assert np.isclose(reserve.max_requirement, requirement.data.sum())
+
+
+def test_shared_cf_profiles(reeds_parser_instance):
+    def construct_cf_time_series():
+        reeds_parser_instance.system = System(name="Test", auto_add_composed_components=True)
+        reeds_parser_instance._check_solve_year()
+        reeds_parser_instance._construct_buses()
+        reeds_parser_instance._construct_reserves()
+        reeds_parser_instance._construct_generators()
+        reeds_parser_instance._construct_cf_time_series()
+        return reeds_parser_instance.system
+
+    system = construct_cf_time_series()
+    reeds_parser_instance.config.feature_flags["shared-cf-profiles"] = True
+    shared_system = construct_cf_time_series()
+
+    for generator in system.get_components(RenewableDispatch, RenewableNonDispatch):
+        if not system.has_time_series(generator):
+            continue
+        shared_generator = shared_system.get_component(type(generator), generator.name)
+        scaling_factor = shared_generator.ext["max_active_power_scaling_factor"]
+        shared_ts = shared_system.get_time_series(shared_generator)
+        expected = system.get_time_series(generator).data.magnitude
+        assert np.allclose(shared_ts.data * scaling_factor, expected)
+
+
+def test_hydro_monthly_data(reeds_parser_instance):
+    reeds_parser_instance.system = System(name="Test", auto_add_composed_components=True)
+    reeds_parser_instance._check_solve_year()
+    reeds_parser_instance._construct_buses()
+
+    # Synthetic hydro generators on a (tech, region) of the hydro capacity factors of the fixture.
+    bus_names = [bus.name for bus in reeds_parser_instance.system.get_components(ACBus)]
+    monthly_table = reeds_parser_instance._get_hydro_monthly_table().filter(pl.col("region").is_in(bus_names))
+    assert not monthly_table.is_empty()
+    tech, region, month, cf, _ = monthly_table.row(0)
+    bus = reeds_parser_instance.system.get_component(ACBus, region)
+    ext = {"reeds_tech": tech}
+    dispatch = HydroDispatch(name="hydro_dispatch", bus=bus, active_power=ActivePower(100, "MW"), ext=ext)
+    reservoir = HydroEnergyReservoir(
+        name="hydro_reservoir", bus=bus, active_power=ActivePower(50, "MW"), ext=ext.copy()
+    )
+    reeds_parser_instance.system.add_components(dispatch, reservoir)
+
+    hydro_cf, month_hrs = reeds_parser_instance._get_hydro_monthly_data([dispatch, reservoir])
+    assert hydro_cf.shape == month_hrs.shape == (2, 12)
+    generator_table = monthly_table.filter((pl.col("tech") == tech) & (pl.col("region") == region))
+    for row in generator_table.iter_rows(named=True):
+        assert hydro_cf[0, row["month"] - 1] == row["hydro_cf"]
+
+    # The daily budget is the energy of a day at the capacity factor of the month.
+    reeds_parser_instance._construct_hydro_budgets()
+    budget = reeds_parser_instance.system.get_time_series(dispatch, "hydro_budget")
+    day = np.flatnonzero(reeds_parser_instance.month_of_day == month)[0]
+    assert budget.data[day].to("MWh").magnitude == pytest.approx(100 * cf * 24)
+
+    reeds_parser_instance._construct_hydro_rating_profiles()
+    rating = reeds_parser_instance.system.get_time_series(reservoir, "max_active_power")
+    assert len(rating.data) == len(reeds_parser_instance.hourly_time_index)
+    hour = np.flatnonzero(reeds_parser_instance.month_of_hour == month)[0]
+    assert rating.data[hour].magnitude == pytest.approx(50 * cf)
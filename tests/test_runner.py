@@ -1,5 +1,10 @@
+import json
+
 import pytest
-from r2x.runner import init, run
+from r2x.config_scenario import Scenario
+from r2x.exceptions import R2XParserError
+from r2x.parser.plexos_cache import XML_CACHE_FOLDER
+from r2x.runner import clear_cache, init, run, run_multi_model_scenario
 
 
 def test_runner(tmp_path, reeds_data_folder):
@@ -29,10 +34,28 @@ def test_runner_exceptions(tmp_path, reeds_data_folder):
         "run_folder": reeds_data_folder,
     }
 
-    with pytest.raises(NotImplementedError):
+    # 2055 is not a modeled year.
+    with pytest.raises(R2XParserError):
         _ = run(cli_input, {})
 
 
+def test_runner_multi_year(tmp_path, reeds_data_folder):
+    cli_input = {
+        "name": "Test",
+        "weather_year": 2012,
+        "solve_year": [2047, 2050],
+        "input_model": "reeds-US",
+        "output_model": "sienna",
+        "output_folder": str(tmp_path),
+        "run_folder": reeds_data_folder,
+        "export_workers": 2,
+    }
+
+    _ = run(cli_input, {})
+    for solve_year in cli_input["solve_year"]:
+        assert (tmp_path / str(solve_year) / f"Test_{solve_year}.json").exists()
+
+
 def test_runner_serialization(tmp_path, reeds_data_folder):
     cli_input = {
         "name": "Test",
@@ -50,7 +73,59 @@ def test_runner_serialization(tmp_path, reeds_data_folder):
     assert (tmp_path / f"{cli_input['name']}.json").exists()
 
 
+def test_runner_profile(tmp_path, reeds_data_folder):
+    cli_input = {
+        "name": "Test",
+        "weather_year": 2012,
+        "solve_year": [2050],
+        "input_model": "reeds-US",
+        "output_model": "sienna",
+        "output_folder": str(tmp_path),
+        "run_folder": reeds_data_folder,
+        "profile": True,
+    }
+
+    _ = run(cli_input, {})
+    report = json.loads((tmp_path / "Test_build_profile.json").read_text())
+    stages = {stage["stage"]: stage for stage in report["stages"]}
+    assert "construct_buses" in stages
+    assert stages["construct_buses"]["components_added"] > 0
+    assert report["total"]["time_series_added"] > 0
+    assert report["total"]["array_bytes"] > 0
+    assert (tmp_path / "Test_build_profile.csv").exists()
+
+
+def test_runner_multi_model(tmp_path, data_folder):
+    scenario = Scenario.from_kwargs(
+        name="Test",
+        input_model="plexos",
+        output_model="sienna",
+        run_folder=data_folder / "pjm_2area",
+        output_folder=tmp_path,
+        model_year=2024,
+        user_dict={
+            "fmap": {"xml_file": {"fname": "pjm_2area.xml"}},
+            "plexos_category_map": {"thermal": {"fuel": "NATURAL_GAS", "type": "CC"}},
+        },
+    )
+    scenario.models = ["model_2012", "model_2012_m1"]
+    scenario.export_workers = 2
+
+    _ = run_multi_model_scenario(scenario)
+    for model_name in scenario.models:
+        assert (tmp_path / model_name / f"{model_name}.json").exists()
+        assert any((tmp_path / model_name).glob("*.csv"))
+
+
 def test_init(tmp_path):
     cli_input = {"path": str(tmp_path)}
     _ = init(cli_input)
     assert (tmp_path / "user_dict.yaml").exists()
+
+
+def test_clear_cache(tmp_path):
+    xml_cache_dir = tmp_path / XML_CACHE_FOLDER
+    xml_cache_dir.mkdir()
+    (xml_cache_dir / "model.db").write_bytes(b"0")
+    assert clear_cache({"cache_dir": tmp_path}) == 1
+    assert not list(xml_cache_dir.glob("*.db"))
@@ -1,4 +1,12 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+from infrasys.time_series_models import SingleTimeSeries
+
 from r2x.api import System
+from r2x.models import ACBus, PowerLoad
+from r2x.units import ActivePower
 
 
 def test_serialization(infrasys_test_system, tmp_path):
@@ -8,3 +16,31 @@ def test_serialization(infrasys_test_system, tmp_path):
 
     assert system._uuid == deserialized_system._uuid
     assert system._components.get_num_components() == deserialized_system._components.get_num_components()
+
+
+def test_batch():
+    system = System(name="test", auto_add_composed_components=True)
+    bus = ACBus(name="bus", number=1)
+    load = PowerLoad(name="load", bus=bus, max_active_power=ActivePower(1, "MW"))
+    ts = SingleTimeSeries.from_array(
+        np.arange(24),
+        variable_name="max_active_power",
+        initial_time=datetime(2030, 1, 1),
+        resolution=timedelta(hours=1),
+    )
+    with system.batch():
+        system.add_component(bus)
+        system.add_component(load)
+        key = system.add_time_series(ts, load)
+        assert key.variable_name == "max_active_power"
+        ts.variable_name = "rating"
+        assert system._components.get_num_components() == 0
+    assert system._components.get_num_components() == 2
+    assert system.has_time_series(load, variable_name="max_active_power")
+    assert not system.has_time_series(load, variable_name="rating")
+
+    with pytest.raises(ValueError):
+        with system.batch():
+            system.add_component(ACBus(name="bus_2", number=2))
+            raise ValueError
+    assert system._components.get_num_components() == 2
@@ -5,7 +5,7 @@ from tempfile import NamedTemporaryFile
 import pytest
 import yaml
 
-from r2x.utils import check_file_exists, haskey, override_dict, read_user_dict
+from r2x.utils import check_file_exists, get_category_map, haskey, override_dict, read_user_dict
 
 
 @pytest.mark.utils
@@ -156,3 +156,16 @@ def test_check_file_exist():
         folder = path.parent
         fpath = check_file_exists(path.name, folder, folder=folder)
         assert path == fpath
+
+
+@pytest.mark.utils
+def test_get_category_map(tmp_path, monkeypatch):
+    categories = ["upv", "wind-ons", "battery"]
+    cache_fpath = tmp_path / "categories.json"
+    category_map = get_category_map(["upv_1", "wind-ons_3", "nuclear"], categories, cache_fpath=cache_fpath)
+    assert category_map == {"upv_1": "upv", "wind-ons_3": "wind-ons", "nuclear": "nuclear"}
+    assert cache_fpath.exists()
+
+    # Cached values are not matched again.
+    monkeypatch.setattr("r2x.utils.match_category", lambda *args, **kwargs: pytest.fail("Not cached"))
+    assert get_category_map(["upv_1", "nuclear"], categories, cache_fpath=cache_fpath) == category_map